@@ -0,0 +1,352 @@
+#commands/bench.py
+
+import json
+import os
+import statistics
+import time
+from contextlib import contextmanager
+import click
+from commands.clean_replication import clean_replication
+from commands.replication import setup_replication
+from factories.ddl_factory import SUPPORTED_IMPLEMENTATIONS, get_ddl_implementation
+from models.config import load_config
+from utils.lag_sampler import LagSampler
+from utils.log_handler import get_logs_dir, logger
+from utils.workload import WriteWorkload, parse_mix
+
+BENCH_COLUMNS = {"id": "SERIAL PRIMARY KEY", "data": "TEXT", "bench_col": "INTEGER"}
+
+
+def _replica_columns(ddl, node_name, schema_name, table_name):
+    """
+    Current definition of the table on the node (bypassing the metadata cache, the change
+    arrives through replication). Returns {column: type} or None if the table does not exist.
+    """
+    columns = ddl.get_tables_columns(node_name, schema_name, [table_name], fresh=True)[table_name]
+    if columns is None:
+        return None
+    return {column["column_name"]: column["data_type"] for column in columns}
+
+
+# name -> (run on master, change visible on replica); every case starts from a table created
+# with BENCH_COLUMNS, except create_table which starts from nothing.
+DDL_CASES = {
+    "create_table": (
+        lambda ddl, node, schema, table: ddl.create_table(node, schema, table, BENCH_COLUMNS),
+        lambda ddl, node, schema, table: _replica_columns(ddl, node, schema, table) is not None,
+    ),
+    "add_column": (
+        lambda ddl, node, schema, table: ddl.add_column(node, schema, table, "added_col", "INTEGER"),
+        lambda ddl, node, schema, table: "added_col" in (_replica_columns(ddl, node, schema, table) or {}),
+    ),
+    "drop_column": (
+        lambda ddl, node, schema, table: ddl.drop_column(node, schema, table, "bench_col"),
+        lambda ddl, node, schema, table: "bench_col" not in (_replica_columns(ddl, node, schema, table) or {"bench_col": None}),
+    ),
+    "rename_column": (
+        lambda ddl, node, schema, table: ddl.rename_column(node, schema, table, "bench_col", "renamed_col"),
+        lambda ddl, node, schema, table: "renamed_col" in (_replica_columns(ddl, node, schema, table) or {}),
+    ),
+    "alter_column_type": (
+        lambda ddl, node, schema, table: ddl.alter_column_type(node, schema, table, "bench_col", "BIGINT"),
+        lambda ddl, node, schema, table: (_replica_columns(ddl, node, schema, table) or {}).get("bench_col") == "bigint",
+    ),
+    "rename_table": (
+        lambda ddl, node, schema, table: ddl.rename_table(node, schema, table, f"{table}_renamed"),
+        lambda ddl, node, schema, table: _replica_columns(ddl, node, schema, f"{table}_renamed") is not None,
+    ),
+    "drop_table": (
+        lambda ddl, node, schema, table: ddl.drop_table(node, schema, table),
+        lambda ddl, node, schema, table: _replica_columns(ddl, node, schema, table) is None,
+    ),
+}
+
+
+def _prepare_table(ddl, master_name, replica_name, schema_name, table_name, timeout):
+    """Creates the benchmark table on the master and makes sure it exists on the replica."""
+    ddl.create_table(master_name, schema_name, table_name, BENCH_COLUMNS)
+    ddl.wait_for_replication(master_name, replica_name, timeout)
+    if _replica_columns(ddl, replica_name, schema_name, table_name) is None:
+        ddl.create_table(replica_name, schema_name, table_name, BENCH_COLUMNS)
+
+
+def _measure(ddl, case, master_name, replica_name, schema_name, table_name, timeout, poll_interval):
+    """
+    Runs one DDL on the master and polls the replica until the change is visible.
+    Returns the latency in seconds, or None on timeout.
+    """
+    run, visible = DDL_CASES[case]
+    run(ddl, master_name, schema_name, table_name)
+    committed = time.perf_counter()
+    while time.perf_counter() - committed < timeout:
+        if visible(ddl, replica_name, schema_name, table_name):
+            return time.perf_counter() - committed
+        time.sleep(poll_interval)
+    return None
+
+
+def _summary(latencies, repetitions):
+    if not latencies:
+        return {"samples": 0, "timeouts": repetitions}
+    ordered = sorted(latencies)
+    return {
+        "samples": len(ordered),
+        "timeouts": repetitions - len(ordered),
+        "min_ms": ordered[0] * 1000,
+        "median_ms": statistics.median(ordered) * 1000,
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+def bench_ddl_latency(implementations, cases, repetitions: int = 20, timeout: float = 10.0,
+                      poll_interval: float = 0.005, replica_name: str = "replica1"):
+    """
+    Measures, per implementation and DDL type, the time from commit on the master
+    to visibility of the change in the replica's catalog.
+
+    A case whose first repetition times out is treated as not replicated by the
+    implementation and skipped. The cluster is re-initialized for every implementation
+    (see _replication).
+
+    :return: {implementation: {case: summary dict}} or {implementation: {"error": ...}}.
+    """
+    base_config = load_config()
+    master_name = base_config.get_master_node().name
+    cluster = {"implementation": base_config.ddl_implementation}
+    results = {}
+
+    for implementation in implementations:
+        with _replication(base_config, implementation, cascade=False, cluster=cluster) as ddl:
+            if ddl is None:
+                results[implementation] = {"error": "replication setup failed"}
+                continue
+
+            schema_name = ddl.config.get_replication_schema(master_name)
+            results[implementation] = {}
+            for case in cases:
+                latencies = []
+                for rep in range(repetitions):
+                    table_name = f"bench_{case}_{rep}"
+                    if case != "create_table":
+                        _prepare_table(ddl, master_name, replica_name, schema_name, table_name, timeout)
+                    latency = _measure(ddl, case, master_name, replica_name, schema_name, table_name, timeout, poll_interval)
+                    if latency is None and not latencies:
+                        logger.debug(f"[bench] '{case}' is not replicated by '{implementation}', skipping.")
+                        break
+                    if latency is not None:
+                        latencies.append(latency)
+                results[implementation][case] = _summary(latencies, repetitions)
+                click.echo(f"[bench] {implementation}: {case} done.")
+
+    _restore_cluster(base_config, cluster)
+    return results
+
+
+def bench_dml_throughput(implementations, writers: int = 4, txn_size: int = 10, mix=None, duration: float = 30.0,
+                         replicas=("replica1",), cascade: bool = False, timeout: float = 300.0, lag_interval: float = 0.0,
+                         preload: int = 0):
+    """
+    Runs a concurrent write workload against the master's replication table for every
+    implementation and measures committed TPS on the master and applied rows/s per replica
+    (rows written / time from workload start until the replica caught up).
+    The cluster is re-initialized for every implementation (see _replication).
+    With preload, that many rows are bulk-loaded (COPY) into the table first, so the
+    workload runs against a table of realistic size.
+
+    :return: {implementation: {"master": workload totals, "replicas": {name: {...}}}} or {"error": ...}.
+    """
+    base_config = load_config()
+    master = base_config.get_master_node()
+    cluster = {"implementation": base_config.ddl_implementation}
+    results = {}
+
+    for implementation in implementations:
+        with _replication(base_config, implementation, cascade=cascade, cluster=cluster) as ddl:
+            if ddl is None:
+                results[implementation] = {"error": "replication setup failed"}
+                continue
+
+            if preload:
+                ddl.insert_rows(master.name, master.replication_schema, master.replication_table,
+                                ({"data": f"preload-{i}"} for i in range(preload)))
+                click.echo(f"[bench] {implementation}: preloaded {preload} row(s).")
+            for replica_name in replicas:
+                ddl.wait_for_replication(master.name, replica_name, timeout)
+
+            workload = WriteWorkload(ddl, master.name, master.replication_schema, master.replication_table,
+                                     writers=writers, txn_size=txn_size, mix=mix, duration=duration)
+            sampler = LagSampler(ddl, interval=lag_interval, name=f"bench_lag_{implementation}") if lag_interval else None
+            if sampler:
+                sampler.start()
+            started = time.monotonic()
+            try:
+                totals = workload.run()
+                per_replica = {}
+                for replica_name in replicas:
+                    try:
+                        ddl.wait_for_replication(master.name, replica_name, timeout)
+                        caught_up = time.monotonic() - started
+                        per_replica[replica_name] = {
+                            "seconds": caught_up,
+                            "catchup_after_stop": caught_up - totals["seconds"],
+                            "rows_per_second": totals["rows"] / caught_up,
+                        }
+                    except TimeoutError as e:
+                        per_replica[replica_name] = {"error": str(e)}
+            finally:
+                if sampler:
+                    sampler.stop()
+
+            results[implementation] = {"master": totals, "replicas": per_replica}
+            click.echo(f"[bench] {implementation}: {totals['tps']:.1f} tps on master.")
+
+    _restore_cluster(base_config, cluster)
+    return results
+
+
+@contextmanager
+def _replication(base_config, implementation, cascade, cluster):
+    """
+    Sets up replication with the given implementation and yields its BaseDDL
+    (None if the setup failed); cleans the replication up afterwards.
+
+    Implementations need different node settings and extensions (e.g. pglogical in
+    shared_preload_libraries for pgl_ddl_deploy), so the cluster is re-initialized with
+    init_cluster whenever it was last initialized for another implementation.
+    ddl_patch additionally needs pg_bin_dir to hold the patched build.
+
+    :param cluster: {"implementation": ...} the cluster is currently initialized for; updated here.
+    """
+    config = base_config.model_copy(update={"ddl_implementation": implementation})
+    ddl = get_ddl_implementation(db_type="postgresql", config=config)
+    try:
+        if cluster["implementation"] != implementation:
+            click.echo(f"[bench] {implementation}: re-initializing the cluster...")
+            cluster["implementation"] = None
+            ddl.init_cluster()
+            ddl.start_cluster()
+            cluster["implementation"] = implementation
+        click.echo(f"[bench] {implementation}: setting up replication...")
+        clean_replication(config=config)
+        setup_replication(ddl=True, cascade=cascade, config=config)
+    except (Exception, SystemExit) as e:
+        logger.error(f"[bench] Replication setup failed for '{implementation}': {e}")
+        ddl.pool.close_all()
+        yield None
+        return
+
+    try:
+        yield ddl
+    finally:
+        ddl.pool.close_all()
+        try:
+            clean_replication(config=config)
+        except (Exception, SystemExit) as e:
+            logger.error(f"[bench] Cleanup failed for '{implementation}': {e}")
+
+
+def _restore_cluster(base_config, cluster):
+    """Re-initializes the cluster for config.ddl_implementation if a bench left it set up for another one."""
+    if cluster["implementation"] == base_config.ddl_implementation:
+        return
+    click.echo(f"[bench] Re-initializing the cluster for '{base_config.ddl_implementation}'...")
+    ddl = get_ddl_implementation(db_type="postgresql", config=base_config)
+    ddl.init_cluster()
+    ddl.start_cluster()
+    ddl.pool.close_all()
+    cluster["implementation"] = base_config.ddl_implementation
+
+
+def format_latency_table(results, cases) -> str:
+    """Renders median (p95) milliseconds per implementation and DDL type."""
+    width = max(len(c) for c in cases) + 2
+    lines = ["implementation".ljust(20) + "".join(c.rjust(width + 4) for c in cases)]
+    for implementation, per_case in results.items():
+        if "error" in per_case:
+            lines.append(implementation.ljust(20) + "  setup failed: " + per_case["error"])
+            continue
+        cells = []
+        for case in cases:
+            summary = per_case.get(case)
+            if not summary or not summary["samples"]:
+                cells.append("n/a".rjust(width + 4))
+            else:
+                cells.append(f"{summary['median_ms']:.1f} ({summary['p95_ms']:.1f})".rjust(width + 4))
+        lines.append(implementation.ljust(20) + "".join(cells))
+    return "\n".join(lines)
+
+
+@click.group(name="bench")
+def bench_cmd():
+    """Replication benchmarks."""
+    pass
+
+
+@bench_cmd.command(name="ddl-latency")
+@click.option("--implementation", "-i", "implementations", multiple=True, type=click.Choice(SUPPORTED_IMPLEMENTATIONS),
+              help="Implementation(s) to benchmark (default: all)")
+@click.option("--case", "-c", "cases", multiple=True, type=click.Choice(list(DDL_CASES)), help="DDL type(s) to run (default: all)")
+@click.option("--repetitions", "-n", default=20, show_default=True, help="Repetitions per DDL type")
+@click.option("--timeout", default=10.0, show_default=True, help="Seconds to wait for a change to become visible")
+@click.option("--replica", default="replica1", show_default=True, help="Replica to measure visibility on")
+def bench_ddl_latency_cmd(implementations, cases, repetitions, timeout, replica):
+    """
+    CLI command: Measures DDL replication latency (commit on master -> visible on replica)
+    for every DDL type and implementation.
+    """
+    implementations = list(implementations) or SUPPORTED_IMPLEMENTATIONS
+    cases = list(cases) or list(DDL_CASES)
+    results = bench_ddl_latency(implementations, cases, repetitions=repetitions, timeout=timeout, replica_name=replica)
+
+    output_path = os.path.join(get_logs_dir(), time.strftime("bench_ddl_latency_%H%M%S.json"))
+    with open(output_path, "w") as f:
+        json.dump(results, f, indent=2)
+
+    click.echo("\nDDL replication latency, median (p95) ms:")
+    click.echo(format_latency_table(results, cases))
+    click.echo(f"\nRaw results: {output_path}")
+
+
+@bench_cmd.command(name="dml-throughput")
+@click.option("--implementation", "-i", "implementations", multiple=True, type=click.Choice(SUPPORTED_IMPLEMENTATIONS),
+              help="Implementation(s) to benchmark (default: all)")
+@click.option("--writers", "-w", default=4, show_default=True, help="Concurrent writer threads on the master")
+@click.option("--txn-size", default=10, show_default=True, help="Row operations per transaction")
+@click.option("--mix", default="insert=70,update=20,delete=10", show_default=True, help="Operation weights")
+@click.option("--duration", "-d", default=30.0, show_default=True, help="Seconds to run the writers")
+@click.option("--cascade", is_flag=True, help="Set up cascading replication and measure replica2 as well")
+@click.option("--replica", "replicas", multiple=True, help="Replica(s) to measure (default: replica1, plus replica2 with --cascade)")
+@click.option("--lag-interval", default=0.0, show_default=True, help="Sample replication lag every N seconds (0 = off)")
+@click.option("--preload", default=0, show_default=True, help="Rows to bulk-load (COPY) into the table before the run")
+def bench_dml_throughput_cmd(implementations, writers, txn_size, mix, duration, cascade, replicas, lag_interval, preload):
+    """
+    CLI command: Measures committed TPS on the master and applied rows/s on replicas
+    under concurrent writers, for every implementation.
+    """
+    implementations = list(implementations) or SUPPORTED_IMPLEMENTATIONS
+    replicas = list(replicas) or (["replica1", "replica2"] if cascade else ["replica1"])
+    try:
+        weights = parse_mix(mix)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--mix")
+
+    results = bench_dml_throughput(implementations, writers=writers, txn_size=txn_size, mix=weights, duration=duration,
+                                   replicas=replicas, cascade=cascade, lag_interval=lag_interval, preload=preload)
+
+    output_path = os.path.join(get_logs_dir(), time.strftime("bench_dml_throughput_%H%M%S.json"))
+    with open(output_path, "w") as f:
+        json.dump(results, f, indent=2)
+
+    click.echo(f"\nDML throughput ({writers} writers, txn_size={txn_size}, mix={mix}):")
+    click.echo("implementation".ljust(20) + "master tps".rjust(12) + "".join(f"{r} rows/s".rjust(20) for r in replicas))
+    for implementation, result in results.items():
+        if "error" in result:
+            click.echo(implementation.ljust(20) + "  " + result["error"])
+            continue
+        cells = []
+        for replica_name in replicas:
+            replica = result["replicas"][replica_name]
+            cells.append(("timeout" if "error" in replica else f"{replica['rows_per_second']:.1f}").rjust(20))
+        click.echo(implementation.ljust(20) + f"{result['master']['tps']:.1f}".rjust(12) + "".join(cells))
+    click.echo(f"\nRaw results: {output_path}")
@@ -3,15 +3,17 @@
 import json
 import click
 from factories.ddl_factory import get_ddl_implementation
-from models.config import load_config
+from models.config import Config, load_config
 from utils.log_handler import logger
 
-def clean_replication():
+def clean_replication(config: Config = None):
 	"""
 	Performs a full cleanup of all subscriptions, publications, replication slots,
 	and replication schemas on all servers.
+
+	:param config: Configuration to use instead of config.json.
 	"""
-	config = load_config()
+	config = config or load_config()
 	ddl_replication = get_ddl_implementation(db_type="postgresql", config=config)
 	ddl_replication.cleanup_cluster()
 
@@ -45,6 +45,14 @@ def stop_cluster():
     ddl_replication = get_ddl_implementation(db_type="postgresql", config=config)
     ddl_replication.stop_cluster()
 
+def apply_settings(node_names=None):
+    """
+    Re-renders node settings from config.json and reloads/restarts running servers as needed.
+    """
+    config = load_config()
+    ddl_replication = get_ddl_implementation(db_type="postgresql", config=config)
+    ddl_replication.apply_settings(list(node_names) if node_names else None)
+
 def start_server(server_name):
     """
     Starts a specific PostgreSQL cluster by name.
@@ -52,7 +60,6 @@ def start_server(server_name):
     try:
         config = load_config()
         pg_bin_dir = config.pg_bin_dir
-        pg_cluster_dir = config.pg_cluster_dir
         clusters = config.clusters
 
         cluster = next((c for c in clusters if c.name == server_name), None)
@@ -60,7 +67,7 @@ def start_server(server_name):
             logger.debug(f"Cluster '{server_name}' not found.")
             return
 
-        data_dir = os.path.join(pg_cluster_dir, server_name)
+        data_dir = config.get_data_dir(server_name)
         logger.debug(f"Запуск кластера '{server_name}'...")
         pg_ctl_path = os.path.join(pg_bin_dir, 'pg_ctl')
         run_as_postgres([pg_ctl_path, '-D', data_dir, '-l', os.path.join(data_dir, 'logfile'), 'start'])
@@ -77,7 +84,6 @@ def stop_server(server_name):
     try:
         config = load_config()
         pg_bin_dir = config.pg_bin_dir
-        pg_cluster_dir = config.pg_cluster_dir
         clusters = config.clusters
 
         cluster = next((c for c in clusters if c.name == server_name), None)
@@ -85,7 +91,7 @@ def stop_server(server_name):
             logger.debug(f"Cluster '{server_name}' not found.")
             return
 
-        data_dir = os.path.join(pg_cluster_dir, server_name)
+        data_dir = config.get_data_dir(server_name)
         logger.debug(f"Stopping server '{server_name}'...")
         pg_ctl_path = os.path.join(pg_bin_dir, 'pg_ctl')
         run_as_postgres([pg_ctl_path, '-D', data_dir, 'stop', '-m', 'fast'])
@@ -113,4 +119,11 @@ def status_cluster_cmd():
 @click.command(name='stop')
 def stop_cluster_cmd():
     """CLI command: Stop cluster."""
-    stop_cluster()
\ No newline at end of file
+    stop_cluster()
+
+
+@click.command(name='apply-settings')
+@click.option('--node', '-n', 'node_names', multiple=True, help="Node(s) to apply settings to (default: all)")
+def apply_settings_cmd(node_names):
+    """CLI command: Apply postgresql.conf settings from config.json."""
+    apply_settings(node_names)
@@ -3,17 +3,18 @@
 import sys
 import click
 from factories.ddl_factory import get_ddl_implementation
-from models.config import load_config
+from models.config import Config, load_config
 from utils.log_handler import logger
 
-def setup_master(ddl=False):
+def setup_master(ddl=False, config: Config = None):
     """
     Sets up the Master server.
 
     :param implementation: Type of DDL implementation.
     :param ddl: If True, enable DDL replication in the publication.
+    :param config: Configuration to use instead of config.json.
     """
-    config = load_config()
+    config = config or load_config()
     ddl_replication = get_ddl_implementation(db_type="postgresql", config=config)
     ddl_replication.setup_master("master", ddl)
 
@@ -3,19 +3,20 @@
 import sys
 import click
 from factories.ddl_factory import get_ddl_implementation
-from models.config import load_config
+from models.config import Config, load_config
 from utils.log_handler import logger
 
 
-def setup_replica1(ddl: bool = False, cascade : bool = False):
+def setup_replica1(ddl: bool = False, cascade : bool = False, config: Config = None):
     """
     Sets up Replica 1.
 
     :param implementation: Type of DDL implementation (ddl_patch, vanilla).
     :param ddl: If True, enable DDL replication in the publication.
     :param cascading_replication: If True, enable cascading replication.
+    :param config: Configuration to use instead of config.json.
     """
-    config = load_config()
+    config = config or load_config()
     ddl_replication = get_ddl_implementation(db_type="postgresql", config=config)
     ddl_replication.setup_replica("replica1", "master", ddl, cascade)
 
@@ -3,16 +3,17 @@
 import sys
 import click
 from factories.ddl_factory import get_ddl_implementation
-from models.config import load_config
+from models.config import Config, load_config
 from utils.log_handler import logger
 
-def setup_replica2():
+def setup_replica2(config: Config = None):
     """
     Sets up Replica 2.
 
     :param implementation: Type of DDL implementation (ddl_patch, vanilla).
+    :param config: Configuration to use instead of config.json.
     """
-    config = load_config()
+    config = config or load_config()
     ddl_replication = get_ddl_implementation(db_type="postgresql", config=config)
     ddl_replication.setup_replica("replica2", "replica1", False, False)
 
@@ -2,56 +2,39 @@
 
 import sys
 import click
-from commands.master import setup_master
-from commands.replica1 import setup_replica1
-from commands.replica2 import setup_replica2
+from factories.ddl_factory import get_ddl_implementation
+from models.config import Config, load_config
 from utils.log_handler import logger
 
-def setup_replication(ddl: bool = False, cascade: bool = False):
+def setup_replication(ddl: bool = False, cascade: bool = False, config: Config = None):
     """
-    Performs a full replication setup:
-    1) Sets up the Master (optionally with DDL replication).
-    2) Sets up Replica 1 (optionally with DDL replication and cascading replication).
-    3) Sets up Replica 2.
+    Performs a full replication setup of the topology from config.json
+    (master -> replica1, plus replica1 -> replica2 with cascade, if none is configured):
+    1) Sets up the root publishers (optionally with DDL replication).
+    2) Sets up the subscribers in dependency order, independent branches concurrently.
 
-    :param implementation: Type of DDL implementation.
     :param ddl: If True, enable DDL replication in the publication.
-    :param cascade: If True, enable cascading replication.
+    :param cascade: If True, enable cascading replication (include the cascade edges).
+    :param config: Configuration to use instead of config.json.
     """
+    config = config or load_config()
+    ddl_replication = get_ddl_implementation(db_type="postgresql", config=config)
     try:
-        logger.debug("Starting master setup...")
-        setup_master(ddl=ddl)
-        logger.debug("Master setup completed.")
+        logger.debug("Starting topology setup...")
+        ddl_replication.setup_topology(ddl=ddl, cascade=cascade)
     except Exception as e:
-        logger.error(f"Error during master setup: {e}")
+        logger.error(f"Error during replication setup: {e}")
         raise
 
-    try:
-        logger.debug("Starting Replica 1 setup...")
-        setup_replica1(ddl=ddl, cascade=cascade)
-        logger.debug("Replica 1 setup completed.")
-    except Exception as e:
-        logger.error(f"Error during Replica 1 setup: {e}")
-        raise
-
-    if(cascade):
-        try:
-            logger.debug("Starting Replica 2 setup...")
-            setup_replica2()
-            logger.debug("Replica 2 setup completed.")
-        except Exception as e:
-            logger.error(f"Error during Replica 2 setup: {e}")
-            raise
-
     logger.debug("Replication setup has been completed successfully.")
     click.echo("Replication setup has been completed successfully.")
 
 @click.command(name="setup")
 @click.option('--ddl', ' /-ddl', is_flag=True, default=False, help='Enable DDL replication in the publication')
-@click.option('--cascade', ' /-cascade', is_flag=True, default=False, help='Enable cascading replication for Replica 1')
+@click.option('--cascade', ' /-cascade', is_flag=True, default=False, help='Enable cascading replication (cascade edges of the topology)')
 def setup_replication_cmd(ddl: bool = False, cascade: bool = False):
     """
-    CLI command: Performs a full replication setup (Master, Replica1, and Replica2).
+    CLI command: Performs a full replication setup of every node in the topology.
     """
     try:
         setup_replication(
@@ -63,3 +46,14 @@ def setup_replication_cmd(ddl: bool = False, cascade: bool = False):
         click.secho(f"Failed to complete replication setup: {e}", fg='red')
         sys.exit(1)
 
+@click.command(name="topology")
+@click.option('--cascade', ' /-cascade', is_flag=True, default=False, help='Include the cascade edges of the topology')
+def topology_cmd(cascade: bool = False):
+    """
+    CLI command: Shows the replication topology in the order `setup` provisions it.
+    """
+    config = load_config()
+    click.echo(f"Publishers: {', '.join(config.get_topology_roots(cascade))}")
+    for depth, level in enumerate(config.get_topology_levels(cascade), 1):
+        edges = ", ".join(f"{edge.publisher} -> {edge.subscriber}" for edge in level)
+        click.echo(f"Level {depth}: {edges}")
@@ -8,6 +8,8 @@ from implementations.ddl_patch import DDLPatch
 from implementations.logical_ddl import LogicalDDLExt
 from models.config import Config
 
+SUPPORTED_IMPLEMENTATIONS = ["vanilla", "ddl_patch", "logical_ddl", "pg_easy_replicate", "pg_ddl_deploy"]
+
 def get_ddl_implementation(db_type: str, config: Config) -> DDLInterface:
 	impl = config.ddl_implementation or "vanilla"
 	impl = impl.lower()
@@ -1,18 +1,39 @@
 # implementations/base_ddl.py
 
+import errno
+import fcntl
 import grp
+import hashlib
+import io
+import itertools
 import os
 import pwd
 import subprocess
 import sys
+import tempfile
+import time
+import weakref
+from collections import Counter
 
 import click
 import psycopg2
+from psycopg2.extensions import parse_dsn
 from interfaces.ddl_interface import DDLInterface
+from sql.catalog import generate_schema_columns_query, generate_schema_snapshot_query
+from sql.checksum import (	generate_chunk_bounds_query,
+							generate_chunk_hash_query,
+							generate_chunk_rows_query,
+							generate_primary_key_query,
+							generate_table_columns_query)
+from sql.copy import format_copy_row, generate_copy_from_stdin_query, get_copy_columns
 from sql.database import generate_create_database_query, generate_drop_database_query
-from sql.publication import generate_create_publication_query, generate_drop_publication_query
+from sql.publication import (	generate_add_schema_to_publication_query,
+								generate_create_publication_query,
+								generate_drop_publication_query,
+								generate_drop_schema_from_publication_query)
 from sql.schema import generate_create_schema_query, generate_drop_schema_query
-from sql.subscription import generate_create_subscription_query, generate_drop_subscription_query
+from sql.script import generate_timed_script
+from sql.subscription import generate_create_subscription_query, generate_drop_subscription_query, generate_refresh_subscription_query
 from sql.table import (	generate_add_column_query,
 						generate_alter_column_type_query,
 						generate_create_table_query,
@@ -22,41 +43,134 @@ from sql.table import (	generate_add_column_query,
 					  	generate_rename_column_query,
 					   	generate_rename_table_query)
 from sql.user import generate_create_user_query
+from utils.connection_pool import ConnectionPool
 from utils.execute import execute_sql, run_as_postgres
+from utils.fs import clone_tree, hash_tree_metadata, remove_tree
 from utils.log_handler import logger
-from typing import List, Dict
+from utils.metadata_cache import MetadataCache, may_change_catalog
+from utils.parallel import NodeOperationError, run_concurrently
+from utils.pg_conf import format_value, parse_conf, render_conf
+from utils.pg_status import is_postmaster_alive, probe_port, read_postmaster_pid
+from utils.schema_snapshot import diff_snapshots, fingerprint
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Union
 
 class BaseDDL(DDLInterface):
 
 	LOG_TAG = "[BaseDDL]"
 
+	# Whether add_replicated_schema works, i.e. replication is defined per schema
+	# (FOR TABLES IN SCHEMA publications) so that a new schema can be added to a running topology.
+	supports_schema_namespacing = True
+
 	def __init__(self, config):
 		"""
 		:param config:
 		"""
 		self.config = config
 		self.node_conn = {node.name: node.conn_params.model_dump() for node in config.nodes}
+		self.pool = ConnectionPool(self.node_conn)
+		# The cache must not keep the instance alive (a bound method would make a cycle),
+		# so throwaway instances release their pooled connections as soon as they are dropped.
+		loader = weakref.WeakMethod(self._load_schema_metadata)
+		self.metadata = MetadataCache(lambda node_name, schema_name: loader()(node_name, schema_name))
+		weakref.finalize(self, self.pool.close_all)
 
 	#########################
 	#  SQL Helpers
 	#########################
 
 	def _execute(self, node_name: str, sql: str, autocommit: bool = False, fetch: bool = False):
+		if not fetch or may_change_catalog(sql):
+			self.metadata.invalidate(node_name)
 		conn_params = self.node_conn[node_name]
 		return execute_sql(
 			conn_params,
 			sql,
 			server_name=node_name,
 			autocommit=autocommit,
-			fetch=fetch
+			fetch=fetch,
+			pool=self.pool
 		)
 
 
+	def execute_batch(self, node_name: str, statements: List[str], transactional: bool = True) -> List[float]:
+		"""
+		Executes several statements on the node over one pooled connection.
+
+		With transactional=True the statements are composed into one script and sent
+		in a single round trip as one transaction; per-statement durations are taken
+		from clock_timestamp() marks on the server. With transactional=False every
+		statement runs on its own in autocommit mode (needed for e.g. CREATE SUBSCRIPTION).
+
+		:return: Duration of every statement in seconds.
+		"""
+		if not statements:
+			return []
+
+		self.metadata.invalidate(node_name)
+		try:
+			if transactional:
+				script = generate_timed_script(statements)
+				marks = self._execute(node_name, script, fetch=True)[0][0]
+				durations = [(end - start).total_seconds() for start, end in zip(marks, marks[1:])]
+			else:
+				durations = []
+				with self.pool.connection(node_name, autocommit=True) as conn:
+					with conn.cursor() as cur:
+						for statement in statements:
+							started = time.perf_counter()
+							cur.execute(statement)
+							durations.append(time.perf_counter() - started)
+		except psycopg2.DatabaseError as e:
+			logger.error(f"{self.LOG_TAG} Batch of {len(statements)} statement(s) failed on '{node_name}': {e}")
+			raise
+
+		logger.debug(f"{self.LOG_TAG} Executed batch of {len(statements)} statement(s) on '{node_name}' in {sum(durations) * 1000:.2f} ms (transactional={transactional}).")
+		for statement, duration in zip(statements, durations):
+			logger.debug(f"{self.LOG_TAG}   {duration * 1000:8.2f} ms  {' '.join(statement.split())[:120]}")
+		return durations
+
+	def query(self, node_name: str, sql: str, params: Optional[Dict[str, Any]] = None) -> List[tuple]:
+		"""
+		Runs a read-only query (optionally with psycopg2 %(name)s placeholders) on a pooled
+		connection and returns all rows. Does not touch the metadata cache.
+		"""
+		with self.pool.connection(node_name) as conn:
+			with conn.cursor() as cur:
+				cur.execute(sql, params)
+				rows = cur.fetchall()
+			conn.commit()
+		return rows
+
 	def _sql_literal(self, value):
 		if value is None:
 			return "NULL"
 		return str(value)
 
+	#########################
+	#  Fan-out
+	#########################
+
+	def for_each_node(self, func: Callable[[str], Any], node_names: List[str] = None, operation: str = "Operation") -> Dict[str, Any]:
+		"""
+		Runs func(node_name) on every node (all config nodes by default) concurrently.
+
+		Calls that must happen in order (e.g. subscriptions dropped before publications)
+		are expressed as consecutive for_each_node calls.
+
+		:return: Result of func per node name.
+		:raises NodeOperationError: if func failed on any node; all nodes are still waited for.
+		"""
+		if node_names is None:
+			node_names = [node.name for node in self.config.nodes]
+
+		results, errors = run_concurrently(func, node_names)
+		for node_name, error in errors.items():
+			logger.error(f"{self.LOG_TAG} {operation} failed on '{node_name}': {error!r}")
+		if errors:
+			raise NodeOperationError(operation, errors)
+		return results
+
 	#########################
 	#  DML Functions
 	#########################
@@ -66,18 +180,72 @@ class BaseDDL(DDLInterface):
 		self._execute(node_name=node_name, sql=insert_sql)
 		logger.debug(f"{self.LOG_TAG} Inserted row into '{schema_name}.{table_name}' on '{node_name}': {data}")
 
+	def insert_rows(self, node_name: str, schema_name: str, table_name: str, rows: Iterable[dict],
+					columns_def: dict = None, chunk_size: int = 10000) -> int:
+		"""
+		Bulk counterpart of insert_into_table: loads dict rows with COPY.
+		Columns are taken from the first row.
+		"""
+		return self.copy_into_table(node_name, schema_name, table_name, rows, columns_def=columns_def, chunk_size=chunk_size)
+
+	def copy_into_table(self, node_name: str, schema_name: str, table_name: str, rows: Iterable[Union[Sequence, dict]],
+						columns: List[str] = None, columns_def: dict = None, chunk_size: int = 10000) -> int:
+		"""
+		Streams rows into the table with COPY ... FROM STDIN. Rows are rendered into an
+		in-memory buffer and sent every chunk_size rows; all chunks share one transaction.
+
+		:param rows: Iterable of tuples (in column order) or dicts.
+		:param columns: Target columns. Defaults to the keys of the first dict row, otherwise to
+						the insertable columns of columns_def, otherwise to all table columns.
+		:param columns_def: Column definitions as passed to create_table; their types drive value formatting.
+		:return: Number of loaded rows.
+		"""
+		rows = iter(rows)
+		first_row = next(rows, None)
+		if first_row is None:
+			return 0
+		rows = itertools.chain([first_row], rows)
+
+		as_dicts = isinstance(first_row, dict)
+		if columns is None:
+			if as_dicts:
+				columns = list(first_row.keys())
+			elif columns_def:
+				columns = get_copy_columns(columns_def)
+		column_types = [columns_def.get(column) for column in columns] if columns and columns_def else None
+
+		copy_sql = generate_copy_from_stdin_query(schema_name, table_name, columns)
+		count = 0
+		try:
+			with self.pool.connection(node_name) as conn:
+				with conn.cursor() as cur:
+					for chunk in iter(lambda: list(itertools.islice(rows, chunk_size)), []):
+						buffer = io.StringIO()
+						for row in chunk:
+							values = [row.get(column) for column in columns] if as_dicts else row
+							buffer.write(format_copy_row(values, column_types))
+						buffer.seek(0)
+						cur.copy_expert(copy_sql, buffer)
+						count += len(chunk)
+				conn.commit()
+		except psycopg2.DatabaseError as e:
+			logger.error(f"{self.LOG_TAG} COPY into '{schema_name}.{table_name}' failed on '{node_name}' after {count} row(s): {e}")
+			raise
+		logger.debug(f"{self.LOG_TAG} Copied {count} row(s) into '{schema_name}.{table_name}' on '{node_name}' (chunk_size={chunk_size}).")
+		return count
+
 	#########################
 	#  Database
 	#########################
 
 	def create_db(self, node_name: str, owner: str = None, db_name: str = "mydb") -> None:
 		sql = generate_create_database_query(dbname=db_name, owner=owner)
-		self._execute(node_name, sql)
+		self._execute(node_name, sql, autocommit=True)
 		logger.debug(f"{self.LOG_TAG} Created database {db_name} on node '{node_name}', owner={owner}.")
 
 	def drop_db(self, node_name: str, db_name: str) -> None:
 		sql = generate_drop_database_query(dbname=db_name)
-		self._execute(node_name, sql)
+		self._execute(node_name, sql, autocommit=True)
 		logger.debug(f"{self.LOG_TAG} Dropped database {db_name} on node '{node_name}'.")
 
 	#########################
@@ -131,6 +299,40 @@ class BaseDDL(DDLInterface):
 	#  Schema
 	#########################
 
+	def add_replicated_schema(self, schema_name: str, node_names: List[str]) -> None:
+		"""
+		Adds a new schema (with the replication table in it) to an already running topology.
+
+		:param node_names: Replication chain, e.g. ['master', 'replica1', 'replica2']: every node
+						   subscribes to the previous one, every node but the last publishes.
+		"""
+		for upstream, node_name in itertools.zip_longest(node_names, node_names[1:]):
+			node = self.config.get_node_by_name(upstream)
+			statements = [
+				generate_create_schema_query(schema_name),
+				generate_create_table_query(schema_name, node.replication_table),
+			]
+			if node_name is not None:
+				statements.append(generate_add_schema_to_publication_query(f"pub_{upstream}", schema_name))
+			self.execute_batch(upstream, statements)
+			if upstream != node_names[0]:
+				self._execute(upstream, generate_refresh_subscription_query(f"sub_{upstream}"), autocommit=True)
+		logger.debug(f"{self.LOG_TAG} Schema '{schema_name}' added to replication along {node_names}.")
+
+	def drop_replicated_schema(self, schema_name: str, node_names: List[str], timeout: float = 30.0) -> None:
+		"""
+		Removes a schema added with add_replicated_schema: drops it on the origin first,
+		waits until that has been replicated, then drops whatever is left downstream.
+		"""
+		origin = node_names[0]
+		self.execute_batch(origin, [
+			generate_drop_schema_from_publication_query(f"pub_{origin}", schema_name),
+			generate_drop_schema_query(schema_name),
+		])
+		self.wait_for_replication(origin, node_names[-1], timeout)
+		self.for_each_node(lambda node_name: self.drop_schema(node_name, schema_name), node_names[1:], operation="Drop schema")
+		logger.debug(f"{self.LOG_TAG} Schema '{schema_name}' removed from replication along {node_names}.")
+
 	def create_schema(self, node_name: str, schema_name: str) -> None:
 		sql = generate_create_schema_query(schema_name)
 		self._execute(node_name, sql)
@@ -198,58 +400,75 @@ class BaseDDL(DDLInterface):
 	#  Table / System Queries
 	#########################
 
-	def table_exists(self, node_name: str, schema_name: str, table_name: str) -> bool:
-		table_exists_sql = f"""
-		SELECT EXISTS (
-			SELECT 1 FROM information_schema.tables
-			WHERE table_schema='{schema_name}' AND table_name='{table_name}'
-		);
+	def table_exists(self, node_name: str, schema_name: str, table_name: str, fresh: bool = False) -> bool:
+		"""
+		:param fresh: Bypass the metadata cache, e.g. when polling a subscriber for replicated DDL.
 		"""
-		results = self._execute(node_name, table_exists_sql, fetch=True)
-		logger.debug(f"{self.LOG_TAG} table_exists result raw: {results}")
-		exists = bool(results) and results[0][0]
+		exists = self.metadata.get(node_name, schema_name, table_name, fresh) is not None
 		logger.debug(f"{self.LOG_TAG} Table '{schema_name}.{table_name}' exists on '{node_name}': {exists}")
 		return exists
 
 	def select_all(self, node_name: str, schema_name: str, table_name: str) -> List[dict]:
+		rows = list(self.iter_rows(node_name, schema_name, table_name))
+		logger.debug(f"[select_all] Fetched {len(rows)} row(s) from '{schema_name}.{table_name}' on '{node_name}'.")
+		return rows
+
+	def iter_rows(self, node_name: str, schema_name: str, table_name: str, batch_size: int = 10000) -> Iterator[dict]:
+		"""
+		Lazily yields rows of the table as dicts, fetching batch_size rows per round trip
+		through a server-side (named) cursor. Column names come from cursor.description.
+		"""
 		select_all_sql = f"SELECT * FROM {schema_name}.{table_name};"
-		rows = self._execute(node_name=node_name, sql=select_all_sql, fetch=True)
-		logger.debug(f"[select_all] Raw rows from '{schema_name}.{table_name}' on '{node_name}': {rows}")
-		col_sql = f"""
-			SELECT column_name
-			FROM information_schema.columns
-			WHERE table_schema='{schema_name}' AND table_name='{table_name}'
-			ORDER BY ordinal_position;
-		"""
-		col_rows = self._execute(node_name=node_name, sql=col_sql, fetch=True)
-		col_names = [r[0] for r in col_rows]
-
-		result = []
-		for row in rows:
-			row_dict = {}
-			for col_name, val in zip(col_names, row):
-				row_dict[col_name] = val
-			result.append(row_dict)
-		logger.debug(f"[select_all] Final row_dict list: {result}")
-		return result
-
-	def get_table_columns(self, node_name: str, schema_name: str, table_name: str) -> List[Dict]:
-		sql = f"""
-		SELECT column_name, data_type, column_default
-		FROM information_schema.columns
-		WHERE table_schema='{schema_name}' AND table_name='{table_name}';
-		"""
-		results = execute_sql(self.node_conn[node_name], sql, node_name, fetch=True)
-		columns = [{"column_name": row[0], "data_type": row[1], "default": row[2]} for row in results]
+		count = 0
+		try:
+			with self.pool.connection(node_name) as conn:
+				with conn.cursor(name="iter_rows") as cur:
+					cur.itersize = batch_size
+					cur.execute(select_all_sql)
+					col_names = None
+					for row in cur:
+						if col_names is None:
+							col_names = [column[0] for column in cur.description]
+						count += 1
+						yield dict(zip(col_names, row))
+				conn.commit()
+		except psycopg2.DatabaseError as e:
+			logger.error(f"{self.LOG_TAG} Error streaming rows of '{schema_name}.{table_name}' on '{node_name}': {e}")
+			raise
+		logger.debug(f"{self.LOG_TAG} Streamed {count} row(s) from '{schema_name}.{table_name}' on '{node_name}' (batch_size={batch_size}).")
+
+	def get_table_columns(self, node_name: str, schema_name: str, table_name: str, fresh: bool = False) -> List[Dict]:
+		"""
+		:param fresh: Bypass the metadata cache, e.g. when polling a subscriber for replicated DDL.
+		"""
+		columns = [dict(column) for column in self.metadata.get(node_name, schema_name, table_name, fresh) or []]
 		logger.debug(f"{self.LOG_TAG} Columns for table '{schema_name}.{table_name}' on '{node_name}': {columns}")
 		return columns
 
+	def get_tables_columns(self, node_name: str, schema_name: str, table_names: List[str], fresh: bool = False) -> Dict[str, Optional[List[Dict]]]:
+		"""
+		Bulk variant of get_table_columns/table_exists: {table: columns, or None if the table does not exist}.
+		"""
+		found = self.metadata.get_many(node_name, schema_name, table_names, fresh)
+		return {table: [dict(column) for column in columns] if columns is not None else None for table, columns in found.items()}
+
+	def _load_schema_metadata(self, node_name: str, schema_name: str) -> Dict[str, List[Dict]]:
+		"""
+		Loader of self.metadata: columns of every table in the schema from pg_catalog, in one query.
+		"""
+		tables: Dict[str, List[Dict]] = {}
+		for table_name, column_name, data_type, default in self._execute(node_name, generate_schema_columns_query(schema_name), fetch=True):
+			columns = tables.setdefault(table_name, [])
+			if column_name is not None:
+				columns.append({"column_name": column_name, "data_type": data_type, "default": default})
+		return tables
+
 	def get_subscriptions(self, node_name: str) -> List[str]:
 		"""
 		Get name of all subscriptions in node
 		"""
 		sql = "SELECT subname FROM pg_subscription;"
-		results = execute_sql(self.node_conn[node_name], sql, node_name, fetch=True)
+		results = self._execute(node_name, sql, fetch=True)
 		subs = [row[0] for row in results]
 		logger.debug(f"{self.LOG_TAG} Subscriptions on '{node_name}': {subs}")
 		return subs
@@ -259,11 +478,253 @@ class BaseDDL(DDLInterface):
 		Get name of all publications in node
 		"""
 		sql = "SELECT pubname FROM pg_publication;"
-		results = execute_sql(self.node_conn[node_name], sql, node_name, fetch=True)
+		results = self._execute(node_name, sql, fetch=True)
 		pubs = [row[0] for row in results]
 		logger.debug(f"{self.LOG_TAG} Publications on '{node_name}': {pubs}")
 		return pubs
 
+	def get_schema_snapshot(self, node_name: str, schema_name: str, tables: List[str] = None) -> Dict[str, Any]:
+		"""
+		Reads the structure of all tables of the schema (columns, types, defaults, constraints,
+		indexes, partitioning, inheritance) from pg_catalog in a single query.
+
+		:param tables: Restrict the snapshot to these tables.
+		:return: {table: definition}; see sql/catalog.py for the layout.
+		"""
+		snapshot = self._execute(node_name, generate_schema_snapshot_query(schema_name), fetch=True)[0][0]
+		if tables is not None:
+			snapshot = {table: definition for table, definition in snapshot.items() if table in tables}
+		logger.debug(f"{self.LOG_TAG} Schema snapshot of '{schema_name}' on '{node_name}': {len(snapshot)} table(s), fingerprint {fingerprint(snapshot)[:12]}")
+		return snapshot
+
+	def compare_schemas(self, node_names: List[str], schema_name: str, tables: List[str] = None) -> Dict[str, Any]:
+		"""
+		Snapshots the schema on all nodes in parallel (one query per node) and diffs
+		every node against the first one.
+
+		:return: {"consistent", "fingerprints": {node: str}, "diffs": {node: [change, ...]}}
+		"""
+		snapshots = self.for_each_node(
+			lambda node_name: self.get_schema_snapshot(node_name, schema_name, tables),
+			node_names,
+			operation="Schema snapshot"
+		)
+		reference = node_names[0]
+		fingerprints = {node_name: fingerprint(snapshot) for node_name, snapshot in snapshots.items()}
+		diffs = {
+			node_name: diff_snapshots(snapshots[reference], snapshots[node_name])
+			for node_name in node_names[1:]
+			if fingerprints[node_name] != fingerprints[reference]
+		}
+		return {"consistent": not diffs, "fingerprints": fingerprints, "diffs": diffs}
+
+	#########################
+	#  Data consistency
+	#########################
+
+	def compare_tables(self, node_names: List[str], schema_name: str, table_name: str, chunk_size: int = 10000) -> Dict[str, Any]:
+		"""
+		Compares the table's data on several nodes; the first node is the reference.
+
+		The table is split into ranges of the first primary key column (chunk bounds are taken
+		from the reference node), every node hashes its chunks server-side in parallel, and rows
+		are fetched only for chunks whose (row count, hash) differ from the reference.
+		A table without primary key is one chunk and is diffed as a multiset of rows.
+		Columns missing on a node or only present there are reported in its diff; the data
+		is compared over the columns all nodes have.
+
+		:return: {"consistent", "chunks", "mismatched_chunks": {node: [chunk, ...]},
+			"diffs": {node: {"missing_columns": [column, ...], "extra_columns": [column, ...],
+			"missing": [key, ...], "extra": [key, ...], "changed": [{"key", "expected", "actual"}, ...]}}}
+			Keys are tuples of primary key values (whole rows without primary key).
+		"""
+		reference = node_names[0]
+		key = self._execute(reference, generate_primary_key_query(schema_name, table_name), fetch=True)
+		columns_sql = generate_table_columns_query(schema_name, table_name)
+		node_columns = self.for_each_node(lambda node_name: [row[0] for row in self.query(node_name, columns_sql)],
+										  node_names, operation="Table columns")
+		columns = [c for c in node_columns[reference] if all(c in node_columns[node_name] for node_name in node_names[1:])]
+		column_drift = {
+			node_name: {
+				"missing_columns": [c for c in node_columns[reference] if c not in node_columns[node_name]],
+				"extra_columns": [c for c in node_columns[node_name] if c not in node_columns[reference]],
+			}
+			for node_name in node_names[1:]
+		}
+		# A key column some node lacks cannot bound chunks there: fall back to comparing whole rows.
+		key_columns = [name for name, _ in key] if all(name in columns for name, _ in key) else []
+		key_type = key[0][1] if key_columns else None
+		bounds = []
+		if key_columns:
+			bounds_sql = generate_chunk_bounds_query(schema_name, table_name, key_columns[0], chunk_size)
+			bounds = [row[0] for row in self._execute(reference, bounds_sql, fetch=True)]
+
+		hash_sql = generate_chunk_hash_query(schema_name, table_name, columns, key_columns, key_type)
+		hashes = self.for_each_node(
+			lambda node_name: {chunk: (count, digest) for chunk, count, digest in self.query(node_name, hash_sql, {"bounds": bounds})},
+			node_names,
+			operation="Chunk hashing"
+		)
+
+		mismatched = {}
+		for node_name in node_names[1:]:
+			chunks = set(hashes[reference]) | set(hashes[node_name])
+			mismatched[node_name] = sorted(c for c in chunks if hashes[reference].get(c) != hashes[node_name].get(c))
+		logger.debug(f"{self.LOG_TAG} compare_tables '{schema_name}.{table_name}': {len(hashes[reference])} chunk(s), mismatched: {mismatched}")
+
+		def chunk_rows(node_name: str, chunk: int) -> Dict[tuple, dict]:
+			lower = bounds[chunk - 1] if key_columns and chunk > 0 else None
+			upper = bounds[chunk] if key_columns and chunk < len(bounds) else None
+			sql = generate_chunk_rows_query(schema_name, table_name, columns, key_columns[0] if key_columns else None,
+											has_lower=lower is not None, has_upper=upper is not None)
+			rows = [dict(zip(columns, row)) for row in self.query(node_name, sql, {"lower": lower, "upper": upper})]
+			if key_columns:
+				return {tuple(row[c] for c in key_columns): row for row in rows}
+			return dict(Counter(tuple(row[c] for c in columns) for row in rows))
+
+		reference_rows = {}
+		for chunk in sorted(set(itertools.chain.from_iterable(mismatched.values()))):
+			reference_rows[chunk] = chunk_rows(reference, chunk)
+
+		def diff_node(node_name: str) -> Dict[str, List]:
+			diff = dict(column_drift[node_name], missing=[], extra=[], changed=[])
+			for chunk in mismatched[node_name]:
+				expected, actual = reference_rows[chunk], chunk_rows(node_name, chunk)
+				if not key_columns:
+					diff["missing"].extend(itertools.chain.from_iterable([row] * (n - actual.get(row, 0)) for row, n in expected.items()))
+					diff["extra"].extend(itertools.chain.from_iterable([row] * (n - expected.get(row, 0)) for row, n in actual.items()))
+					continue
+				diff["missing"].extend(k for k in expected if k not in actual)
+				diff["extra"].extend(k for k in actual if k not in expected)
+				diff["changed"].extend({"key": k, "expected": expected[k], "actual": actual[k]}
+									   for k in expected if k in actual and expected[k] != actual[k])
+			return diff
+
+		diffs = self.for_each_node(diff_node, node_names[1:], operation="Chunk diff")
+		consistent = not any(any(diff.values()) for diff in diffs.values())
+		logger.debug(f"{self.LOG_TAG} compare_tables '{schema_name}.{table_name}' on {node_names}: consistent={consistent}")
+		return {
+			"consistent": consistent,
+			"chunks": len(hashes[reference]),
+			"mismatched_chunks": mismatched,
+			"diffs": diffs,
+		}
+
+	#########################
+	#  Replication progress
+	#########################
+
+	def get_current_wal_lsn(self, node_name: str) -> str:
+		return self._execute(node_name, "SELECT pg_current_wal_lsn();", fetch=True)[0][0]
+
+	def is_replica_caught_up(self, master_node_name: str, replica_node_name: str, target_lsn: str) -> bool:
+		"""
+		Checks whether the replica has applied the master's WAL up to target_lsn.
+
+		Uses the replica's subscription 'sub_<replica>' in pg_stat_subscription (and requires
+		all its tables to be synchronized). Implementations without such a subscription
+		(e.g. pglogical) fall back to confirmed_flush_lsn of the active logical slots on the master.
+		"""
+		subscription_sql = f"""
+		SELECT count(*), coalesce(bool_or(st.latest_end_lsn >= '{target_lsn}'::pg_lsn), false)
+			AND NOT EXISTS (
+				SELECT 1 FROM pg_subscription_rel sr
+				JOIN pg_subscription s ON s.oid = sr.srsubid
+				WHERE s.subname = 'sub_{replica_node_name}' AND sr.srsubstate NOT IN ('r', 's')
+			)
+		FROM pg_stat_subscription st
+		WHERE st.subname = 'sub_{replica_node_name}' AND st.relid IS NULL;
+		"""
+		subscriptions, caught_up = self._execute(replica_node_name, subscription_sql, fetch=True)[0]
+		if subscriptions:
+			return caught_up
+
+		slots_sql = f"""
+		SELECT coalesce(bool_and(confirmed_flush_lsn >= '{target_lsn}'::pg_lsn), false)
+		FROM pg_replication_slots
+		WHERE slot_type = 'logical' AND active AND database = current_database();
+		"""
+		return self._execute(master_node_name, slots_sql, fetch=True)[0][0]
+
+	def wait_for_replication(self, master_node_name: str, replica_node_name: str, timeout: float = 30.0, poll_interval: float = 0.05) -> float:
+		"""
+		Blocks until everything written on the master so far (pg_current_wal_lsn()) has been
+		applied on the replica. Cascaded replicas are followed hop by hop (see track_propagation).
+
+		:return: Seconds spent waiting.
+		:raises TimeoutError: if the replica did not catch up within timeout seconds.
+		"""
+		hops = self.track_propagation(master_node_name, replica_node_name, timeout, poll_interval)
+		return hops[-1]["since_origin"]
+
+	def get_upstream_node(self, node_name: str) -> Optional[str]:
+		"""
+		Returns the name of the node that 'sub_<node_name>' subscribes to, matched by
+		host/port of the subscription connection string, or None if there is no such subscription.
+		"""
+		sql = f"SELECT subconninfo FROM pg_subscription WHERE subname = 'sub_{node_name}';"
+		results = self._execute(node_name, sql, fetch=True)
+		if not results:
+			return None
+
+		dsn = parse_dsn(results[0][0])
+		for node in self.config.nodes:
+			if str(node.conn_params.port) == dsn.get("port", "5432") and node.conn_params.host == dsn.get("host", node.conn_params.host):
+				return node.name
+		return None
+
+	def get_replication_path(self, origin_node_name: str, target_node_name: str) -> List[str]:
+		"""
+		Returns the chain of nodes changes travel from origin to target, e.g.
+		['master', 'replica1', 'replica2']. Unknown topologies are treated as a direct edge.
+		"""
+		path = [target_node_name]
+		while path[-1] != origin_node_name:
+			upstream = self.get_upstream_node(path[-1])
+			if upstream is None or upstream in path:
+				return [origin_node_name, target_node_name]
+			path.append(upstream)
+		return list(reversed(path))
+
+	def track_propagation(self, origin_node_name: str, target_node_name: str, timeout: float = 30.0, poll_interval: float = 0.05) -> List[Dict]:
+		"""
+		Follows the current WAL position of the origin down the replication chain to the target.
+
+		For every hop the downstream node is polled until it has applied the upstream LSN;
+		its own pg_current_wal_lsn() at that moment becomes the LSN awaited on the next hop
+		(the applied changes were written to its WAL before that point).
+
+		:return: One dict per hop: hop, upstream_lsn, seconds (hop latency), since_origin.
+		:raises TimeoutError: if the whole chain did not converge within timeout seconds.
+		"""
+		started = time.monotonic()
+		path = self.get_replication_path(origin_node_name, target_node_name)
+		lsn = self.get_current_wal_lsn(origin_node_name)
+
+		hops = []
+		for upstream, downstream in zip(path, path[1:]):
+			hop_started = time.monotonic()
+			while not self.is_replica_caught_up(upstream, downstream, lsn):
+				if time.monotonic() - started > timeout:
+					raise TimeoutError(f"Replica '{downstream}' did not reach LSN {lsn} of '{upstream}' within {timeout} s.")
+				time.sleep(poll_interval)
+			reached = time.monotonic()
+			self.metadata.invalidate(downstream)
+
+			hops.append({
+				"hop": f"{upstream} -> {downstream}",
+				"upstream_lsn": lsn,
+				"seconds": reached - hop_started,
+				"since_origin": reached - started,
+			})
+			logger.debug(f"{self.LOG_TAG} Replica '{downstream}' reached LSN {lsn} of '{upstream}' in {(reached - hop_started) * 1000:.1f} ms ({(reached - started) * 1000:.1f} ms since '{origin_node_name}').")
+			if downstream != target_node_name:
+				lsn = self.get_current_wal_lsn(downstream)
+
+		if not hops:
+			hops.append({"hop": origin_node_name, "upstream_lsn": lsn, "seconds": 0.0, "since_origin": 0.0})
+		return hops
+
 	#########################
 	#  BUILD
 	#########################
@@ -298,65 +759,219 @@ class BaseDDL(DDLInterface):
 			sys.exit(1)
 
 	def init_cluster(self) -> None:
-		logger.debug(f"{self.LOG_TAG} Init cluster starting...")
-		pg_bin_dir = self.config.pg_bin_dir
-		pg_cluster_dir = self.config.pg_cluster_dir
-		initdb_path = os.path.join(pg_bin_dir, "initdb")
+		"""
+		Initializes all nodes concurrently (see _init_node). Failures are collected
+		from every node and reported together.
 
-		uid = pwd.getpwnam("postgres").pw_uid
-		gid = grp.getgrnam("postgres").gr_gid
-		for node in self.config.nodes:
-			node_name = node.name
-			node_replication_user = node.replication_user
-			data_dir = os.path.join(pg_cluster_dir, node_name)
+		With config.initdb_template the first node of every replication user is initialized
+		normally and copied into a template under pg_cluster_dir/.templates; the other nodes
+		(and later inits with the same binaries) just clone the template.
+		"""
+		logger.debug(f"{self.LOG_TAG} Init cluster starting (profile '{self.config.cluster_profile}')...")
+		started = time.monotonic()
+		template_key = self._initdb_template_key() if self.config.initdb_template else None
+		self.drop_snapshots()
+		try:
+			self.for_each_node(lambda node_name: self._init_node(node_name, template_key), operation="Init cluster")
+		except NodeOperationError as e:
+			for node_name, error in e.errors.items():
+				logger.error(f"Node '{node_name}': init failed: {error!r}")
+			sys.exit(1)
+		logger.info(f"Cluster initialized in {time.monotonic() - started:.1f} s.")
+		logger.debug(f"{self.LOG_TAG} cluster have been initialized successfully.")
+
+	def _node_conf_settings(self, node_name: str) -> Dict[str, str]:
+		"""
+		Settings rendered into the node's node.conf (included from postgresql.conf):
+		base settings, overridden by the configured profiles and node settings
+		(Config.get_node_settings); implementations add their own (e.g. shared_preload_libraries).
+		"""
+		node = self.config.get_node_by_name(node_name)
+		return {
+			"port": str(node.port),
+			"wal_level": "logical",
+			"max_wal_senders": "10",
+			"max_replication_slots": "10",
+			"logging_collector": "on",
+			"log_min_messages": "notice",
+			"client_min_messages": "notice",
+			**self.config.get_node_settings(node_name),
+		}
+
+	def _init_node_objects(self, node_name: str) -> None:
+		"""
+		Called by _init_node while the freshly initialized server is running, after the
+		replication user and database exist. Implementations create their extensions here.
+		"""
+
+	def _initdb_template_key(self) -> str:
+		"""
+		Identifies the result of initializing a node apart from its port: binary version,
+		installed files (binaries, libraries, extensions) and implementation.
+		Settings are not part of it: they all live in node.conf, which is rendered per node after cloning.
+		"""
+		pg_config_path = os.path.join(self.config.pg_bin_dir, "pg_config")
+		version = subprocess.run([pg_config_path, "--version"], check=True, capture_output=True, text=True).stdout.strip()
+		dirs = [self.config.pg_bin_dir] + [
+			subprocess.run([pg_config_path, option], check=True, capture_output=True, text=True).stdout.strip()
+			for option in ("--pkglibdir", "--sharedir")
+		]
+		key = hashlib.sha256(f"{version}|{hash_tree_metadata(dirs)}|{type(self).__name__}".encode()).hexdigest()[:16]
+		logger.debug(f"{self.LOG_TAG} initdb template key for '{version}': {key}")
+		return key
+
+	def _write_node_conf(self, node_name: str, data_dir: str) -> Dict[str, str]:
+		"""
+		Renders the node's settings into <data_dir>/node.conf.
 
-			self.ensure_server_stopped(node_name)
+		:return: The settings as written (values formatted for postgresql.conf).
+		"""
+		settings = self._node_conf_settings(node_name)
+		node_conf_path = os.path.join(data_dir, "node.conf")
+		with open(node_conf_path, "w") as conf:
+			conf.write(render_conf(settings, header=f"Node {node_name} settings (generated from config.json, changes are overwritten)"))
+		os.chown(node_conf_path, pwd.getpwnam("postgres").pw_uid, grp.getgrnam("postgres").gr_gid)
+		return {name: format_value(value) for name, value in settings.items()}
+
+	def apply_settings(self, node_names: List[str] = None) -> Dict[str, str]:
+		"""
+		Re-renders node.conf of the nodes from config.json and makes running servers pick up
+		the changes: reload if all changed settings can be reloaded, restart if any of them
+		has context 'postmaster'.
+
+		:return: Action per node: unchanged, written (server stopped), reloaded or restarted.
+		"""
+		actions = self.for_each_node(self._apply_node_settings, node_names, operation="Apply settings")
+		for node_name, action in actions.items():
+			logger.info(f"Node '{node_name}': settings {action}")
+		return actions
+
+	def _apply_node_settings(self, node_name: str) -> str:
+		data_dir = self.config.get_data_dir(node_name)
+		node_conf_path = os.path.join(data_dir, "node.conf")
+		old = {}
+		if os.path.exists(node_conf_path):
+			with open(node_conf_path) as f:
+				old = parse_conf(f.read())
+		new = self._write_node_conf(node_name, data_dir)
+		changed = sorted(name for name in set(old) | set(new) if old.get(name) != new.get(name))
+		if not changed:
+			return "unchanged"
+		logger.debug(f"{self.LOG_TAG} Changed settings on '{node_name}': {changed}")
+		if not self.is_server_running(node_name):
+			return "written"
+
+		names = ", ".join(f"'{name}'" for name in changed)
+		contexts = self._execute(node_name, f"SELECT name, context FROM pg_settings WHERE name IN ({names});", fetch=True)
+		if any(context == "postmaster" for _, context in contexts):
+			self.stop_server(node_name)
+			self.start_server(node_name)
+			return "restarted"
+		self._execute(node_name, "SELECT pg_reload_conf();", fetch=True)
+		return "reloaded"
 
-			if os.path.exists(data_dir):
-				logger.debug(f"{self.LOG_TAG} Removing old data dir '{data_dir}' for node '{node_name}'...")
-				subprocess.run(["rm", "-rf", data_dir], check=True)
+	def _init_node(self, node_name: str, template_key: str = None) -> None:
+		"""
+		Re-creates the data directory of one node: initdb, postgresql.conf settings,
+		replication user, database and implementation objects. The server is left stopped.
+
+		:param template_key: If given, the data directory is cloned from the matching initdb
+							 template; the template is created from this node if it does not exist yet.
+		"""
+		node = self.config.get_node_by_name(node_name)
+		data_dir = self.config.get_data_dir(node_name)
+		started = time.monotonic()
+
+		def progress(step: str) -> None:
+			logger.info(f"Node '{node_name}': {step} ({time.monotonic() - started:.1f} s)")
+
+		self.ensure_server_stopped(node_name)
+
+		if os.path.exists(data_dir):
+			logger.debug(f"{self.LOG_TAG} Removing old data dir '{data_dir}' for node '{node_name}'...")
+			subprocess.run(["rm", "-rf", data_dir], check=True)
+
+		os.makedirs(os.path.dirname(data_dir), exist_ok=True)
+		if template_key is None:
+			self._init_node_data_dir(node_name, data_dir, progress)
+			return
+
+		templates_root = os.path.join(self.config.pg_cluster_dir, ".templates")
+		template_dir = os.path.join(templates_root, f"{template_key}_{node.replication_user}")
+		os.makedirs(templates_root, exist_ok=True)
+		# flock is held per open file, so it serializes both the nodes of one cluster and
+		# shards of a parallel test run building the same template (threads or processes).
+		with open(f"{template_dir}.lock", "w") as lock_file:
+			fcntl.flock(lock_file, fcntl.LOCK_EX)
+			if not os.path.exists(template_dir):
+				self._init_node_data_dir(node_name, data_dir, progress)
+				tmp_root = tempfile.mkdtemp(dir=templates_root, prefix=f"{os.path.basename(template_dir)}.tmp")
+				try:
+					tmp_dir = os.path.join(tmp_root, "data")
+					clone_tree(data_dir, tmp_dir)
+					for leftover in ("node.conf", "postmaster.opts", "current_logfiles", "startup.log"):
+						if os.path.exists(os.path.join(tmp_dir, leftover)):
+							os.remove(os.path.join(tmp_dir, leftover))
+					remove_tree(os.path.join(tmp_dir, "log"))
+					try:
+						os.rename(tmp_dir, template_dir)
+						progress(f"saved as initdb template '{template_dir}'")
+					except OSError as e:
+						if e.errno not in (errno.EEXIST, errno.ENOTEMPTY):
+							raise
+						logger.debug(f"{self.LOG_TAG} Template '{template_dir}' was created meanwhile, keeping it.")
+				finally:
+					remove_tree(tmp_root)
+				return
+
+		clone_tree(template_dir, data_dir)
+		self._write_node_conf(node_name, data_dir)
+		progress(f"cloned from initdb template '{template_dir}'")
+
+	def _init_node_data_dir(self, node_name: str, data_dir: str, progress: Callable[[str], None]) -> None:
+		node = self.config.get_node_by_name(node_name)
+		initdb_path = os.path.join(self.config.pg_bin_dir, "initdb")
+		uid = pwd.getpwnam("postgres").pw_uid
+		gid = grp.getgrnam("postgres").gr_gid
 
-				logger.debug(f"Creating new data dir '{data_dir}' for node '{node_name}'...")
-				os.makedirs(data_dir, exist_ok=True)
+		logger.debug(f"Creating new data dir '{data_dir}' for node '{node_name}'...")
+		os.makedirs(data_dir, exist_ok=True)
 
-				logger.debug(f"{self.LOG_TAG} Changing ownership of data dir '{data_dir}' to postgres:postgres")
-				os.chown(data_dir, uid, gid)
+		logger.debug(f"{self.LOG_TAG} Changing ownership of data dir '{data_dir}' to postgres:postgres")
+		os.chown(data_dir, uid, gid)
 
-				logger.debug(f"{self.LOG_TAG} Initdb => {data_dir} for node '{node_name}'...")
-				run_as_postgres([initdb_path, "-D", data_dir])
+		logger.debug(f"{self.LOG_TAG} Initdb => {data_dir} for node '{node_name}'...")
+		run_as_postgres([initdb_path, "-D", data_dir])
+		progress("initdb done")
 
-				conf_path = os.path.join(data_dir, 'postgresql.conf')
-				with open(conf_path, 'a') as conf:
-					conf.write(f"\n# Node {node_name} settings\n")
-					conf.write(f"port = {node.port}\n")
-					conf.write("wal_level = logical\n")
-					conf.write("max_wal_senders = 10\n")
-					conf.write("max_replication_slots = 10\n")
-					conf.write("logging_collector = on\n")
-					conf.write("log_min_messages = notice\n")
-					conf.write("client_min_messages = notice\n")
+		conf_path = os.path.join(data_dir, 'postgresql.conf')
+		with open(conf_path, 'a') as conf:
+			conf.write("\n# Node settings, see BaseDDL._node_conf_settings\n")
+			conf.write("include_if_exists = 'node.conf'\n")
+		self._write_node_conf(node_name, data_dir)
 
-				logger.debug(f"{self.LOG_TAG} Node {node_name} have been initialized successfully.")
+		logger.debug(f"{self.LOG_TAG} Node {node_name} have been initialized successfully.")
 
-				logger.debug(f"{self.LOG_TAG} Starting server '{node_name}' to create replication user.")
+		logger.debug(f"{self.LOG_TAG} Starting server '{node_name}' to create replication user.")
 
-				conn_params_postgres = self.node_conn[node_name].copy()
-				conn_params_postgres["user"] = "postgres"
-				conn_params_postgres["password"] = "postgres"
+		conn_params_postgres = self.node_conn[node_name].copy()
+		conn_params_postgres["user"] = "postgres"
+		conn_params_postgres["password"] = "postgres"
 
-				self.start_server(node_name)
-				# create_plpgsql_sql = "CREATE EXTENSION IF NOT EXISTS plpgsql;"
-				# execute_sql(conn_params=conn_params_postgres, sql=create_plpgsql_sql, server_name=node_name)
+		self.start_server(node_name)
+		progress("server started")
 
-				self.create_replication_user(conn_params=conn_params_postgres, node_name=node_name, username = node.replication_user)
+		self.create_replication_user(conn_params=conn_params_postgres, node_name=node_name, username = node.replication_user)
 
-				self.create_db(node_name=node_name, owner = node_replication_user, db_name="mydb")
+		self.create_db(node_name=node_name, owner = node.replication_user, db_name="mydb")
 
-				logger.debug(f"{self.LOG_TAG} Stopping server '{node_name}' after creating replication user.")
+		self._init_node_objects(node_name)
+		progress("user, database and extensions created")
 
-				self.stop_server(node_name)
+		logger.debug(f"{self.LOG_TAG} Stopping server '{node_name}' after creating replication user.")
 
-			logger.debug(f"{self.LOG_TAG} cluster have been initialized successfully.")
+		self.stop_server(node_name)
+		progress("initialized")
 
 	#########################
 	#  MASTER/REPLICA SETUP
@@ -365,10 +980,11 @@ class BaseDDL(DDLInterface):
 
 		logger.debug(f"{self.LOG_TAG} Setting up master '{node_name}' with ddl={ddl}...")
 		node = self.config.get_node_by_name(node_name)
+		publication_name = f"pub_{node_name}"
 
+		# Through the methods, not one batch: implementations override create_table etc.
 		self.create_schema(node_name, node.replication_schema)
 		self.create_table(node_name, node.replication_schema, node.replication_table)
-		publication_name = f"pub_{node_name}"
 		self.create_publication(node_name, publication_name, node.replication_schema, ddl)
 
 		logger.debug(f"{self.LOG_TAG} Master '{node_name}' setup done.")
@@ -392,85 +1008,211 @@ class BaseDDL(DDLInterface):
 
 		logger.debug(f"{self.LOG_TAG} Setting up replica '{node_name}' with ddl={ddl} finish successfully")
 
+	def setup_topology(self, ddl: bool, cascade: bool) -> None:
+		"""
+		Sets up the replication topology of the config (see Config.get_topology_levels):
+		root publishers first, then the subscribers level by level. Nodes within a step are
+		independent and are set up concurrently; a subscriber that publishes further down
+		gets its cascade publication.
+
+		:param ddl: If True, enable DDL replication.
+		:param cascade: If True, include the cascade-only edges.
+		:raises NodeOperationError: if a step failed on any node.
+		"""
+		levels = self.config.get_topology_levels(cascade)
+		publishers = {edge.publisher for level in levels for edge in level}
+
+		roots = self.config.get_topology_roots(cascade)
+		logger.info(f"{self.LOG_TAG} Setting up publishers: {', '.join(roots)}")
+		self.for_each_node(lambda node_name: self.setup_master(node_name, ddl), roots, operation="Set up publisher")
+
+		for depth, level in enumerate(levels, 1):
+			upstream = {edge.subscriber: edge.publisher for edge in level}
+			logger.info(f"{self.LOG_TAG} Setting up subscribers (level {depth}): "
+						f"{', '.join(f'{sub} <- {pub}' for sub, pub in upstream.items())}")
+			self.for_each_node(
+				lambda node_name, upstream=upstream: self.setup_replica(node_name, upstream[node_name], ddl, node_name in publishers),
+				list(upstream),
+				operation=f"Set up subscriber (level {depth})"
+			)
+
 	#########################
 	#  CLEANUP
 	#########################
 
 	def cleanup_cluster(self) -> None:
 		logger.debug(f"{self.LOG_TAG} Cleaning up cluster.")
-		nodes = self.config.nodes
 
-		for node in nodes:
-			server_name = node.name
-			conn_params = node.conn_params.model_dump()
-			subname = f"sub_{server_name}"
-			drop_sub_sql = generate_drop_subscription_query(subname)
-			try:
-				execute_sql(conn_params, drop_sub_sql, server_name, autocommit=True)
-				logger.debug(f"Dropped subscription {subname} on {server_name}")
-			except Exception as e:
-				logger.error(f"Failed to drop subscription {subname} on {server_name}: {e}")
-
-		for node in nodes:
-			server_name = node.name
-			conn_params = node.conn_params.model_dump()
-			pubname = f"pub_{server_name}"
-			drop_pub_sql = generate_drop_publication_query(pubname);
-			try:
-				execute_sql(conn_params, drop_pub_sql, server_name)
-				logger.debug(f"Dropped publication {pubname} on {server_name}")
-			except Exception as e:
-				logger.error(f"Failed to drop publication {pubname} on {server_name}: {e}")
-
-		for node in nodes:
-			server_name = node.name
-			conn_params = node.conn_params.model_dump()
-			schema_name = node.replication_schema
-			drop_schema_sql = generate_drop_schema_query(schema_name)
-			try:
-				execute_sql(conn_params, drop_schema_sql, server_name)
-				logger.debug(f"Dropped schema {schema_name} on {server_name}")
-			except Exception as e:
-				logger.error(f"Failed to drop schema {schema_name} on {server_name}: {e}")
+		# Subscriptions first, publications second, schemas last; nodes run concurrently within a step.
+		self.for_each_node(self._drop_node_subscription, operation="Drop subscription")
+		self.for_each_node(self._drop_node_publication, operation="Drop publication")
+		self.for_each_node(self._drop_node_schema, operation="Drop schema")
 
 		logger.debug(f"{self.LOG_TAG} Replication cleanup completed on all nodes.")
 
+	def _drop_node_subscription(self, server_name: str) -> None:
+		subname = f"sub_{server_name}"
+		drop_sub_sql = generate_drop_subscription_query(subname)
+		try:
+			self._execute(server_name, drop_sub_sql, autocommit=True)
+			logger.debug(f"Dropped subscription {subname} on {server_name}")
+		except Exception as e:
+			logger.error(f"Failed to drop subscription {subname} on {server_name}: {e}")
+
+	def _drop_node_publication(self, server_name: str) -> None:
+		pubname = f"pub_{server_name}"
+		drop_pub_sql = generate_drop_publication_query(pubname)
+		try:
+			self._execute(server_name, drop_pub_sql)
+			logger.debug(f"Dropped publication {pubname} on {server_name}")
+		except Exception as e:
+			logger.error(f"Failed to drop publication {pubname} on {server_name}: {e}")
+
+	def _drop_node_schema(self, server_name: str) -> None:
+		schema_name = self.config.get_replication_schema(server_name)
+		drop_schema_sql = generate_drop_schema_query(schema_name)
+		try:
+			self._execute(server_name, drop_schema_sql)
+			logger.debug(f"Dropped schema {schema_name} on {server_name}")
+		except Exception as e:
+			logger.error(f"Failed to drop schema {schema_name} on {server_name}: {e}")
+
+	#########################
+	#  SNAPSHOTS
+	#########################
+
+	def _snapshots_root(self) -> str:
+		# Next to the data dirs, so that snapshots of the fast profile stay on tmpfs too.
+		return os.path.join(os.path.dirname(self.config.get_data_dir(self.config.nodes[0].name)), ".snapshots")
+
+	def _snapshot_dir(self, name: str, node_name: str = None) -> str:
+		snapshots_dir = os.path.join(self._snapshots_root(), name)
+		return os.path.join(snapshots_dir, node_name) if node_name else snapshots_dir
+
+	def has_snapshot(self, name: str) -> bool:
+		return os.path.exists(os.path.join(self._snapshot_dir(name), "complete"))
+
+	def create_snapshot(self, name: str) -> None:
+		"""
+		Saves the current state of all nodes: checkpoint, stop the cluster, copy every data dir
+		(reflink where supported, see utils.fs.clone_tree), start the cluster again.
+		Hardlinks are not used: PostgreSQL modifies data files in place.
+		"""
+		started = time.monotonic()
+		self.for_each_node(lambda node_name: self._execute(node_name, "CHECKPOINT;", autocommit=True), operation="Checkpoint")
+		self.stop_cluster()
+
+		snapshot_dir = self._snapshot_dir(name)
+		remove_tree(snapshot_dir)
+		os.makedirs(snapshot_dir)
+		self.for_each_node(lambda node_name: clone_tree(self.config.get_data_dir(node_name), self._snapshot_dir(name, node_name)), operation="Snapshot")
+		open(os.path.join(snapshot_dir, "complete"), "w").close()
+
+		self.start_cluster()
+		logger.info(f"Snapshot '{name}' created in {time.monotonic() - started:.1f} s.")
+
+	def restore_snapshot(self, name: str) -> None:
+		"""
+		Replaces the data dirs of all nodes with the snapshot and starts the cluster.
+		Running servers are stopped in immediate mode, their data is thrown away anyway.
+		"""
+		if not self.has_snapshot(name):
+			raise FileNotFoundError(f"Snapshot '{name}' does not exist.")
+		started = time.monotonic()
+		self.pool.close_all()
+		self.metadata.invalidate()
+		self.for_each_node(
+			lambda node_name: self.stop_server(node_name, mode="immediate") if self.is_server_running(node_name) else None,
+			operation="Stop server"
+		)
+		self.for_each_node(lambda node_name: self._restore_node(name, node_name), operation="Restore snapshot")
+		logger.debug(f"{self.LOG_TAG} Snapshot '{name}' restored in {time.monotonic() - started:.2f} s.")
+
+	def _restore_node(self, name: str, node_name: str) -> None:
+		data_dir = self.config.get_data_dir(node_name)
+		remove_tree(data_dir)
+		clone_tree(self._snapshot_dir(name, node_name), data_dir)
+		self.start_server(node_name)
+		# Connections opened while the server was going down must not be reused.
+		self.pool.close_node(node_name)
+
+	def drop_snapshots(self) -> None:
+		"""Removes all snapshots (they are invalid after the cluster was re-initialized)."""
+		remove_tree(self._snapshots_root())
+
 	#########################
 	#  START/STOP/STATUS
 	#########################
 
 	def start_cluster(self) -> None:
 		logger.debug(f"{self.LOG_TAG} Starting all cluster nodes.")
+		self.pool.close_all()
+		self.metadata.invalidate()
 		try:
-			for node in self.config.nodes:
-				node_name = node.name
-				if not self.is_server_running(node_name):
-					self.start_server(node_name)
-				else:
-					logger.debug(f"{self.LOG_TAG} Server '{node_name}' is already running.")
+			self.for_each_node(self._start_server_if_stopped, operation="Start server")
 			logger.debug(f"{self.LOG_TAG} All cluster nodes have been started successfully.")
 		except Exception as e:
 			logger.error(f"{self.LOG_TAG} Error starting cluster nodes: {e}")
 			sys.exit(1)
 
+	def _start_server_if_stopped(self, node_name: str) -> None:
+		if not self.is_server_running(node_name):
+			self.start_server(node_name)
+		else:
+			logger.debug(f"{self.LOG_TAG} Server '{node_name}' is already running.")
+
 	def start_server(self, node_name: str) -> None:
+		"""
+		Starts the server and returns once it accepts connections and is out of recovery.
+		Output written before the logging collector takes over goes to <data_dir>/startup.log.
+		"""
 		pg_ctl_path = os.path.join(self.config.pg_bin_dir, 'pg_ctl')
-		data_dir = os.path.join(self.config.pg_cluster_dir, node_name)
+		data_dir = self.config.get_data_dir(node_name)
+		timeout = self.config.pg_ctl_timeout
+		self.pool.close_node(node_name)
+		self.metadata.invalidate(node_name)
 		try:
 			logger.debug(f"{self.LOG_TAG} Starting server '{node_name}'...")
-			run_as_postgres([pg_ctl_path, '-D', data_dir, 'start'])
-			logger.debug(f"{self.LOG_TAG} Server '{node_name}' started successfully.")
-		except subprocess.CalledProcessError as e:
+			started = time.monotonic()
+			run_as_postgres([pg_ctl_path, '-D', data_dir, '-l', os.path.join(data_dir, 'startup.log'), '-w', '-t', str(timeout), 'start'])
+			self.wait_until_ready(node_name, timeout)
+			logger.debug(f"{self.LOG_TAG} Server '{node_name}' started successfully in {time.monotonic() - started:.2f} s.")
+		except (subprocess.CalledProcessError, TimeoutError) as e:
 			logger.error(f"{self.LOG_TAG} Failed to start server '{node_name}': {e}")
 			sys.exit(1)
 
+	def wait_until_ready(self, node_name: str, timeout: float = 60.0, poll_interval: float = 0.05) -> None:
+		"""
+		Polls the server over libpq until it accepts connections and is not in recovery.
+		Connects as the postgres superuser, so it also works before the replication user exists.
+
+		:raises TimeoutError: if the server is not ready within timeout seconds.
+		"""
+		conn_params = dict(self.node_conn[node_name], user="postgres", password="postgres", dbname="postgres", connect_timeout=1)
+		deadline = time.monotonic() + timeout
+		while True:
+			try:
+				conn = psycopg2.connect(**conn_params)
+				try:
+					with conn.cursor() as cur:
+						cur.execute("SELECT pg_is_in_recovery();")
+						if not cur.fetchone()[0]:
+							return
+				finally:
+					conn.close()
+				reason = "in recovery"
+			except psycopg2.OperationalError as e:
+				reason = str(e).strip()
+			if time.monotonic() > deadline:
+				raise TimeoutError(f"Server '{node_name}' not ready within {timeout} s: {reason}")
+			time.sleep(poll_interval)
+
 	def status_cluster(self) -> None:
 		logger.debug(f"{self.LOG_TAG} Checking status of all cluster nodes.")
 
 		try:
-			for node in self.config.nodes:
-				node_name = node.name
-				running = self.is_server_running(node_name)
+			statuses = self.for_each_node(lambda node_name: self.is_server_running(node_name, probe=True), operation="Status check")
+			for node_name, running in statuses.items():
 				status = "running" if running else "stopped"
 				logger.info(f"Cluster '{node_name}': {status}")
 			logger.debug(f"{self.LOG_TAG} Status check completed for all cluster nodes.")
@@ -478,21 +1220,37 @@ class BaseDDL(DDLInterface):
 			logger.error(f"{self.LOG_TAG} Error checking status of cluster nodes: {e}")
 			sys.exit(1)
 
+	def restart_cluster(self) -> None:
+		"""
+		Stops all nodes, then starts them again (each step concurrently across nodes).
+		"""
+		self.stop_cluster()
+		self.start_cluster()
+
 	def stop_cluster(self) -> None:
 		logger.debug(f"{self.LOG_TAG} Stopping all cluster nodes.")
+		self.pool.close_all()
+		self.metadata.invalidate()
 		try:
-			for node in self.config.nodes:
-				self.stop_server(node.name)
+			self.for_each_node(self.stop_server, operation="Stop server")
 		except Exception as e:
 			logger.error(f"{self.LOG_TAG} Error stopping cluster nodes: {e}")
 			sys.exit(1)
 
-	def stop_server(self, node_name: str) -> None:
+	def stop_server(self, node_name: str, mode: str = None) -> None:
+		"""
+		Stops the server and waits until it is down.
+
+		:param mode: pg_ctl shutdown mode (smart, fast, immediate); config.shutdown_mode by default.
+		"""
 		pg_ctl_path = os.path.join(self.config.pg_bin_dir, 'pg_ctl')
-		data_dir = os.path.join(self.config.pg_cluster_dir, node_name)
+		data_dir = self.config.get_data_dir(node_name)
+		mode = mode or self.config.shutdown_mode
+		self.pool.close_node(node_name)
+		self.metadata.invalidate(node_name)
 		try:
-			logger.debug(f"{self.LOG_TAG} Stopping server '{node_name}'...")
-			run_as_postgres([pg_ctl_path, '-D', data_dir, 'stop'])
+			logger.debug(f"{self.LOG_TAG} Stopping server '{node_name}' (mode={mode})...")
+			run_as_postgres([pg_ctl_path, '-D', data_dir, '-m', mode, '-w', '-t', str(self.config.pg_ctl_timeout), 'stop'])
 			logger.debug(f"{self.LOG_TAG} Server '{node_name}' stopped successfully.")
 		except subprocess.CalledProcessError as e:
 			logger.error(f"{self.LOG_TAG} Failed to stop server '{node_name}': {e}")
@@ -504,9 +1262,29 @@ class BaseDDL(DDLInterface):
 		else:
 			logger.debug(f"{self.LOG_TAG} Server '{node_name}' is already stopped.")
 
-	def is_server_running(self, node_name: str) -> bool:
+	def is_server_running(self, node_name: str, probe: bool = False) -> bool:
+		"""
+		Checks postmaster.pid of the node and validates its PID through /proc, without
+		spawning processes. Falls back to pg_ctl status if the data dir is not readable.
+
+		:param probe: Additionally require the server to accept TCP connections on its port.
+		"""
+		data_dir = self.config.get_data_dir(node_name)
+		try:
+			pid_info = read_postmaster_pid(data_dir)
+		except PermissionError:
+			return self._pg_ctl_status(node_name)
+
+		running = pid_info is not None and is_postmaster_alive(pid_info["pid"])
+		if running and probe:
+			conn_params = self.node_conn[node_name]
+			running = probe_port(conn_params.get("host") or "localhost", pid_info["port"] or conn_params["port"])
+		logger.debug(f"{self.LOG_TAG} Server status for '{node_name}': {'Running' if running else 'Not running'}.")
+		return running
+
+	def _pg_ctl_status(self, node_name: str) -> bool:
 		pg_ctl_path = os.path.join(self.config.pg_bin_dir, 'pg_ctl')
-		data_dir = os.path.join(self.config.pg_cluster_dir, node_name)
+		data_dir = self.config.get_data_dir(node_name)
 		try:
 			result = run_as_postgres([pg_ctl_path, '-D', data_dir, 'status'], suppress_output=True)
 			logger.debug(f"{self.LOG_TAG} Server status for '{node_name}': Running.")
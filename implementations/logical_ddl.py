@@ -2,6 +2,8 @@
 
 import os
 from implementations.base_ddl import BaseDDL
+from sql.schema import generate_create_schema_query
+from sql.table import generate_create_table_query
 from utils.execute import execute_sql
 from utils.log_handler import logger
 import subprocess
@@ -10,6 +12,7 @@ import sys
 class LogicalDDLExt(BaseDDL):
 
 	LOG_TAG = "[LOGICALDDLEXT]"
+	supports_schema_namespacing = False  # publishes individual registered tables, not schemas
 
 	def __init__(self, config):
 		super().__init__(config)
@@ -43,45 +46,40 @@ class LogicalDDLExt(BaseDDL):
 	def init_cluster(self) -> None:
 		logger.debug(f"{self.LOG_TAG} Init cluster starting with logical_ddl extension build...")
 		super().init_cluster()
-		logger.debug(f"{self.LOG_TAG} Creating extension logical_ddl on each node if needed...")
-		for node in self.config.nodes:
-			node_name = node.name
-			self.start_server(node_name)
-			try:
-				create_ext_sql = "CREATE EXTENSION IF NOT EXISTS logical_ddl;"
-				self._execute(node_name, create_ext_sql)
-				logger.debug(f"{self.LOG_TAG} Extension logical_ddl created on '{node_name}'.")
-			except Exception as e:
-				logger.error(f"{self.LOG_TAG} Failed to create extension on '{node_name}': {e}")
-				sys.exit(1)
-			self.stop_server(node.name)
-
 		logger.debug(f"{self.LOG_TAG} cluster have been initialized successfully.")
 
+	def _init_node_objects(self, node_name: str) -> None:
+		try:
+			create_ext_sql = "CREATE EXTENSION IF NOT EXISTS logical_ddl;"
+			self._execute(node_name, create_ext_sql)
+			logger.debug(f"{self.LOG_TAG} Extension logical_ddl created on '{node_name}'.")
+		except Exception as e:
+			logger.error(f"{self.LOG_TAG} Failed to create extension on '{node_name}': {e}")
+			raise
+
 	def setup_master(self, node_name: str, ddl: bool) -> None:
 		logger.debug(f"{self.LOG_TAG} Setting up master '{node_name}' with ddl={False}...")
 
+		node = self.config.get_node_by_name(node_name)
+
 		set_publisher_sql = f"""
 			INSERT INTO logical_ddl.settings (publish, source)
 			VALUES (true, '{node_name}')
 		"""
-		self._execute(node_name, set_publisher_sql)
-		logger.debug(f"{self.LOG_TAG} Configured node '{node_name}' as publisher with source='{node_name}'.")
-
-		node = self.config.get_node_by_name(node_name)
 		pub_sql = f"CREATE PUBLICATION pub_{node_name};"
-		self._execute(node_name, pub_sql)
-		logger.debug(f"{self.LOG_TAG} Created publication 'pub_{node_name}' WITHOUT any tables.")
-
-		self.create_schema(node_name, node.replication_schema)
-
-		self.create_table(node_name, node.replication_schema, node.replication_table)
-
 		add_shadow_table_sql = f"""
 			ALTER PUBLICATION pub_{node_name} ADD TABLE logical_ddl.shadow_table;
 		"""
-		self._execute(node_name, add_shadow_table_sql)
-		logger.debug(f"{self.LOG_TAG} Added 'logical_ddl.shadow_table' to publication 'pub_{node_name}'.")
+		self.execute_batch(node_name, [
+			set_publisher_sql,
+			pub_sql,
+			add_shadow_table_sql,
+			generate_create_schema_query(node.replication_schema),
+		])
+		logger.debug(f"{self.LOG_TAG} Configured node '{node_name}' as publisher with source='{node_name}'.")
+		logger.debug(f"{self.LOG_TAG} Created publication 'pub_{node_name}' with 'logical_ddl.shadow_table' only.")
+
+		self.create_table(node_name, node.replication_schema, node.replication_table)
 
 		logger.debug(f"{self.LOG_TAG} Master '{node_name}' setup with ddl={False} finished successfully.")
 
@@ -100,7 +98,8 @@ class LogicalDDLExt(BaseDDL):
 		set_replication_role_sql = """
 			SET session_replication_role = 'replica';
 		"""
-		self._execute(node_name, set_replication_role_sql)
+		# Session setting: run it on a dedicated connection so it does not leak into pooled sessions.
+		execute_sql(self.node_conn[node_name], set_replication_role_sql, node_name)
 		logger.debug(f"{self.LOG_TAG} Set session_replication_role to 'replica' on '{node_name}'.")
 
 		self.create_schema(node_name, replica.replication_schema)
@@ -123,50 +122,67 @@ class LogicalDDLExt(BaseDDL):
 
 		super().cleanup_cluster()
 
-		for node in self.config.nodes:
-			node_name = node.name
-			try:
-				drop_extension_sql = "DROP EXTENSION IF EXISTS logical_ddl CASCADE";
-				self._execute(node_name, drop_extension_sql)
-				logger.debug(f"{self.LOG_TAG} Deleted extension logical_ddl on '{node_name}'.")
-			except Exception as e:
-				logger.error(f"{self.LOG_TAG} Failed to drop extension logical_ddl on '{node_name}': {e}")
-
-			try:
-				create_extension_sql = "CREATE EXTENSION logical_ddl;";
-				self._execute(node_name, create_extension_sql)
-				logger.debug(f"{self.LOG_TAG} Create extension logical_ddl on '{node_name}'.")
-			except Exception as e:
-				logger.error(f"{self.LOG_TAG} Failed to create extension logical_ddl on '{node_name}': {e}")
+		self.for_each_node(self._recreate_node_extension, operation="Re-create extension logical_ddl")
 
 		logger.debug(f"{self.LOG_TAG} Cleanup for logical_ddl extension completed on all nodes.")
 
+	def _recreate_node_extension(self, node_name: str) -> None:
+		try:
+			drop_extension_sql = "DROP EXTENSION IF EXISTS logical_ddl CASCADE";
+			self._execute(node_name, drop_extension_sql)
+			logger.debug(f"{self.LOG_TAG} Deleted extension logical_ddl on '{node_name}'.")
+		except Exception as e:
+			logger.error(f"{self.LOG_TAG} Failed to drop extension logical_ddl on '{node_name}': {e}")
+
+		try:
+			create_extension_sql = "CREATE EXTENSION logical_ddl;";
+			self._execute(node_name, create_extension_sql)
+			logger.debug(f"{self.LOG_TAG} Create extension logical_ddl on '{node_name}'.")
+		except Exception as e:
+			logger.error(f"{self.LOG_TAG} Failed to create extension logical_ddl on '{node_name}': {e}")
+
 	def create_table(self, node_name: str, schema_name: str, table_name: str,
 					 columns_def: dict = None) -> None:
-		super().create_table(node_name, schema_name, table_name, columns_def)
-		self.add_table_in_extension(node_name=node_name, schema_name=schema_name, table_name=table_name)
-		self.add_table_in_replication(node_name=node_name, schema_name=schema_name, table_name=table_name)
+		node = self.config.get_node_by_name(node_name)
+		statements = [
+			generate_create_table_query(schema_name, table_name, columns_def),
+			self._register_table_query(node_name, schema_name, table_name),
+		]
+		if node.role == "master":
+			statements.append(self._add_table_to_publication_query(node_name, schema_name, table_name))
+		self.execute_batch(node_name, statements)
+		logger.debug(f"{self.LOG_TAG} Table '{schema_name}.{table_name}' created and registered in logical_ddl on '{node_name}'.")
+
+		if node.role != "master":
+			self.add_table_in_replication(node_name=node_name, schema_name=schema_name, table_name=table_name)
 
 	def drop_table(self, node_name: str, schema_name: str, table_name: str) -> None:
 		self.drop_table_from_extension(node_name=node_name, schema_name=schema_name, table_name=table_name)
 		self.drop_table_from_replication(node_name=node_name, schema_name=schema_name, table_name=table_name)
 		super().drop_table(node_name=node_name,schema_name=schema_name, table_name=table_name)
 
-	def add_table_in_extension(self, node_name, schema_name, table_name):
+	def _register_table_query(self, node_name, schema_name, table_name) -> str:
 		node = self.config.get_node_by_name(node_name)
-		tablelist = "publish_tablelist" if node.role == "master" else "subscribe_tablelist"
-
 		if node.role == "master":
-			register_table_sql = f"""
-			INSERT INTO logical_ddl.{tablelist} (relid)
+			return f"""
+			INSERT INTO logical_ddl.publish_tablelist (relid)
 			VALUES ('{schema_name}.{table_name}'::regclass);
 			"""
-		else:
-			register_table_sql = f"""
-			INSERT INTO logical_ddl.{tablelist} (source, relid)
+		return f"""
+			INSERT INTO logical_ddl.subscribe_tablelist (source, relid)
 			VALUES ('master', '{schema_name}.{table_name}'::regclass);
 			"""
-		self._execute(node_name, register_table_sql)
+
+	def _add_table_to_publication_query(self, node_name, schema_name, table_name) -> str:
+		return f"""
+			ALTER PUBLICATION pub_{node_name} ADD TABLE {schema_name}.{table_name};
+			"""
+
+	def add_table_in_extension(self, node_name, schema_name, table_name):
+		node = self.config.get_node_by_name(node_name)
+		tablelist = "publish_tablelist" if node.role == "master" else "subscribe_tablelist"
+
+		self._execute(node_name, self._register_table_query(node_name, schema_name, table_name))
 		logger.debug(f"{self.LOG_TAG} Record for table '{schema_name}.{table_name}' register in logical_ddl.{tablelist} on '{node_name}'.")
 
 	def drop_table_from_extension(self, node_name, schema_name, table_name):
@@ -183,9 +199,7 @@ class LogicalDDLExt(BaseDDL):
 	def add_table_in_replication(self, node_name, schema_name, table_name):
 		node = self.config.get_node_by_name(node_name)
 		if(node.role == "master"):
-			add_table_to_publication_sql = f"""
-			ALTER PUBLICATION pub_{node_name} ADD TABLE {schema_name}.{table_name};
-			"""
+			add_table_to_publication_sql = self._add_table_to_publication_query(node_name, schema_name, table_name)
 			self._execute(node_name=node_name, sql = add_table_to_publication_sql)
 			logger.debug(f"{self.LOG_TAG} Added '{schema_name}.{table_name}' to publication 'pub_{node_name}'.")
 		else:
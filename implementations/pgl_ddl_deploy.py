@@ -3,6 +3,7 @@
 import os
 import subprocess
 import sys
+from typing import Dict
 from implementations.base_ddl import BaseDDL
 from utils.execute import execute_sql
 from utils.log_handler import logger
@@ -10,6 +11,7 @@ from utils.log_handler import logger
 class PG_DDL_Deploy(BaseDDL):
 
     LOG_TAG = "[PGL_DDL_DEPLOY]"
+    supports_schema_namespacing = False  # replicates through pglogical replication sets
 
     def __init__(self, config):
         super().__init__(config)
@@ -74,34 +76,29 @@ class PG_DDL_Deploy(BaseDDL):
     def init_cluster(self) -> None:
         logger.debug(f"{self.LOG_TAG} Initializing cluster with pgl_ddl_deploy extension...")
         super().init_cluster()
-
-        for node in self.config.nodes:
-            node_name = node.name
-            data_dir = os.path.join(self.config.pg_cluster_dir, node_name)
-            conf_path = os.path.join(data_dir, 'postgresql.conf')
-
-            logger.debug(f"{self.LOG_TAG} Appending pglogical to shared_preload_libraries in {conf_path} for node '{node_name}'")
-            with open(conf_path, 'a') as conf:
-                conf.write("\n# Additional settings for pglogical from pgl_ddl_deploy\n")
-                conf.write("shared_preload_libraries = 'pglogical'\n")
-
-        for node in self.config.nodes:
-            node_name = node.name
-            logger.debug(f"{self.LOG_TAG} Starting server '{node_name}' again with updated postgresql.conf...")
-            self.start_server(node_name)
-            try:
-                self._execute(node_name, "CREATE EXTENSION IF NOT EXISTS pglogical;")
-                self._execute(node_name, "CREATE EXTENSION IF NOT EXISTS pgl_ddl_deploy;")
-
-                self._execute(node_name, f"SELECT pgl_ddl_deploy.add_role(oid) FROM pg_roles WHERE rolname = '{node.replication_user}';")
-
-                logger.debug(f"{self.LOG_TAG} Extension pgl_ddl_deploy created on '{node_name}'.")
-            except Exception as e:
-                logger.error(f"{self.LOG_TAG} Failed to create extension on '{node_name}': {e}")
-                sys.exit(1)
-            self.stop_server(node_name)
         logger.debug(f"{self.LOG_TAG} Cluster initialized successfully with pgl_ddl_deploy.")
 
+    def _node_conf_settings(self, node_name: str) -> Dict[str, str]:
+        settings = super()._node_conf_settings(node_name)
+        libraries = [lib.strip() for lib in settings.get("shared_preload_libraries", "").strip("'").split(",") if lib.strip()]
+        if "pglogical" not in libraries:
+            libraries.append("pglogical")
+        settings["shared_preload_libraries"] = ",".join(libraries)
+        return settings
+
+    def _init_node_objects(self, node_name: str) -> None:
+        node = self.config.get_node_by_name(node_name)
+        try:
+            self._execute(node_name, "CREATE EXTENSION IF NOT EXISTS pglogical;")
+            self._execute(node_name, "CREATE EXTENSION IF NOT EXISTS pgl_ddl_deploy;")
+
+            self._execute(node_name, f"SELECT pgl_ddl_deploy.add_role(oid) FROM pg_roles WHERE rolname = '{node.replication_user}';")
+
+            logger.debug(f"{self.LOG_TAG} Extension pgl_ddl_deploy created on '{node_name}'.")
+        except Exception as e:
+            logger.error(f"{self.LOG_TAG} Failed to create extension on '{node_name}': {e}")
+            raise
+
     def setup_master(self, node_name: str, ddl: bool) -> None:
         logger.debug(f"{self.LOG_TAG} Setting up master '{node_name}' with pglogical DDL replication enabled.")
 
@@ -191,30 +188,34 @@ class PG_DDL_Deploy(BaseDDL):
     def cleanup_cluster(self) -> None:
         logger.debug(f"{self.LOG_TAG} Cleaning up cluster with pgl_ddl_deploy.")
 
-        for node in self.config.nodes:
-            node_name = node.name
-            try:
-                drop_sub_sql = f"SELECT pglogical.drop_subscription('sub_{node_name}', true);"
-                self._execute(node_name, drop_sub_sql)
-            except Exception as e:
-                logger.debug(f"{self.LOG_TAG} Subscription sub_{node_name} was not dropped or did not exist: {e}")
-
-            try:
-                drop_node_sql = f"SELECT pglogical.drop_node('subscriber_{node_name}', true);"
-                self._execute(node_name, drop_node_sql)
-                drop_node_sql2 = f"SELECT pglogical.drop_node('provider_{node_name}', true);"
-                self._execute(node_name, drop_node_sql2)
-            except Exception as e:
-                logger.debug(f"{self.LOG_TAG} pglogical node not removed or not existed: {e}")
-
-        for node in self.config.nodes:
-            node_name = node.name
-            try:
-                self._execute(node_name, "DROP EXTENSION IF EXISTS pgl_ddl_deploy CASCADE;")
-                self._execute(node_name, "CREATE EXTENSION IF NOT EXISTS pgl_ddl_deploy;")
-                logger.debug(f"{self.LOG_TAG} Dropped and re-created extension pgl_ddl_deploy on '{node_name}'.")
-            except Exception as e:
-                logger.error(f"{self.LOG_TAG} Failed to drop or recreate extension pgl_ddl_deploy on '{node_name}': {e}")
+        # Subscriptions first, pglogical nodes second: a provider must outlive its subscribers.
+        self.for_each_node(self._drop_node_pglogical_subscription, operation="Drop pglogical subscription")
+        self.for_each_node(self._drop_node_pglogical, operation="Drop pglogical node")
+        self.for_each_node(self._recreate_node_extension, operation="Re-create extension pgl_ddl_deploy")
 
         super().cleanup_cluster()
         logger.debug(f"{self.LOG_TAG} Cleanup for pgl_ddl_deploy completed on all nodes.")
+
+    def _drop_node_pglogical_subscription(self, node_name: str) -> None:
+        try:
+            drop_sub_sql = f"SELECT pglogical.drop_subscription('sub_{node_name}', true);"
+            self._execute(node_name, drop_sub_sql)
+        except Exception as e:
+            logger.debug(f"{self.LOG_TAG} Subscription sub_{node_name} was not dropped or did not exist: {e}")
+
+    def _drop_node_pglogical(self, node_name: str) -> None:
+        try:
+            drop_node_sql = f"SELECT pglogical.drop_node('subscriber_{node_name}', true);"
+            self._execute(node_name, drop_node_sql)
+            drop_node_sql2 = f"SELECT pglogical.drop_node('provider_{node_name}', true);"
+            self._execute(node_name, drop_node_sql2)
+        except Exception as e:
+            logger.debug(f"{self.LOG_TAG} pglogical node not removed or not existed: {e}")
+
+    def _recreate_node_extension(self, node_name: str) -> None:
+        try:
+            self._execute(node_name, "DROP EXTENSION IF EXISTS pgl_ddl_deploy CASCADE;")
+            self._execute(node_name, "CREATE EXTENSION IF NOT EXISTS pgl_ddl_deploy;")
+            logger.debug(f"{self.LOG_TAG} Dropped and re-created extension pgl_ddl_deploy on '{node_name}'.")
+        except Exception as e:
+            logger.error(f"{self.LOG_TAG} Failed to drop or recreate extension pgl_ddl_deploy on '{node_name}': {e}")
@@ -1,9 +1,12 @@
 #main.py
 
+import os
 import subprocess
 import click
+from commands.bench import bench_cmd
 from commands.build import build_postgresql_cmd
 from commands.cluster import (
+    apply_settings_cmd,
     init_cluster_cmd,
     start_cluster_cmd,
     status_cluster_cmd,
@@ -13,16 +16,19 @@ from commands.cluster import (
 from commands.master import setup_master_cmd
 from commands.replica1 import setup_replica1_cmd
 from commands.replica2 import setup_replica2_cmd
-from commands.replication import setup_replication_cmd
+from commands.replication import setup_replication_cmd, topology_cmd
 from commands.clean_replication import clean_replication_cmd
 from factories.ddl_factory import get_ddl_implementation
-from models.config import load_config
+from models.config import CLUSTER_PROFILES, load_config
 from tests.tests import tests_cmd
 
 @click.group()
-def cli():
+@click.option('--profile', default=None,
+              help=f"Cluster settings profile overriding config.json (built-in: {', '.join(CLUSTER_PROFILES)})")
+def cli(profile):
     """CLI tool for automating PostgreSQL build, setup, and testing."""
-    pass
+    if profile:
+        os.environ["PG_CLUSTER_PROFILE"] = profile
 
 cli.add_command(build_postgresql_cmd)
 
@@ -30,8 +36,10 @@ cli.add_command(init_cluster_cmd)
 cli.add_command(start_cluster_cmd)
 cli.add_command(status_cluster_cmd)
 cli.add_command(stop_cluster_cmd)
+cli.add_command(apply_settings_cmd)
 
 cli.add_command(setup_replication_cmd)
+cli.add_command(topology_cmd)
 cli.add_command(clean_replication_cmd)
 
 cli.add_command(setup_master_cmd)
@@ -40,6 +48,8 @@ cli.add_command(setup_replica2_cmd)
 
 cli.add_command(tests_cmd)
 
+cli.add_command(bench_cmd)
+
 
 @cli.command(name='full')
 @click.option('--tags', '-t', multiple=True, help="Markers (tags) to run (e.g. ddl, cascade_ddl)")
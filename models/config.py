@@ -2,8 +2,41 @@
 
 import json
 import os
-from pydantic import BaseModel, Field, field_validator
-from typing import List, Dict, Optional
+from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import List, Dict, Literal, Optional
+
+
+# Built-in named postgresql.conf profiles. Config.profiles adds to / overrides these.
+# "fast" trades durability for speed: a crash may lose or corrupt data, which is fine for throwaway test clusters.
+CLUSTER_PROFILES: Dict[str, Dict[str, str]] = {
+    "default": {},
+    "fast": {
+        "fsync": "off",
+        "synchronous_commit": "off",
+        "full_page_writes": "off",
+        "checkpoint_timeout": "30min",
+        "max_wal_size": "4GB",
+    },
+    "replication_bench": {
+        "shared_buffers": "1GB",
+        "wal_buffers": "64MB",
+        "max_wal_size": "8GB",
+        "max_wal_senders": "32",
+        "max_replication_slots": "32",
+        "max_worker_processes": "32",
+        "max_logical_replication_workers": "16",
+        "max_sync_workers_per_subscription": "4",
+        "logical_decoding_work_mem": "256MB",
+    },
+}
+
+# Profiles whose data directories live in Config.fast_cluster_dir (tmpfs) instead of pg_cluster_dir.
+RAM_PROFILES = ("fast",)
+
+
+def _settings_to_str(settings: Dict) -> Dict[str, str]:
+    # config.json may use numbers and booleans for setting values.
+    return {name: ("on" if value else "off") if isinstance(value, bool) else str(value) for name, value in (settings or {}).items()}
 
 
 class ConnParams(BaseModel):
@@ -25,8 +58,25 @@ class Cluster(BaseModel):
     replication_schema: str = Field(default="replication", json_schema_extra={"description": "Schema used for replication"})
     replication_table: str = Field(default="table1", json_schema_extra={"description": "Table used for replication"})
     conn_params: ConnParams = Field(..., json_schema_extra={"description": "Parameters for connecting to this node"})
+    profile: Optional[str] = Field(default=None, json_schema_extra={"description": "Settings profile applied to this node on top of the cluster profile"})
+    settings: Dict[str, str] = Field(default_factory=dict, json_schema_extra={"description": "postgresql.conf settings of this node (override profiles)"})
+
+    @field_validator("settings", mode="before")
+    def settings_as_str(cls, value):
+        return _settings_to_str(value)
 
 
+class ReplicationEdge(BaseModel):
+    publisher: str = Field(..., json_schema_extra={"description": "Node publishing the replication schema"})
+    subscriber: str = Field(..., json_schema_extra={"description": "Node subscribing to the publisher"})
+    cascade: bool = Field(default=False, json_schema_extra={"description": "Edge only exists in cascade setups"})
+
+# Topology used when config.json has no topology section: master -> replica1 (-> replica2 with cascade).
+DEFAULT_TOPOLOGY: List[ReplicationEdge] = [
+    ReplicationEdge(publisher="master", subscriber="replica1"),
+    ReplicationEdge(publisher="replica1", subscriber="replica2", cascade=True),
+]
+
 
 class Config(BaseModel):
     ddl_implementation: Optional[str] = Field("vanilla", json_schema_extra={"description": "DDL implementation type"})
@@ -34,6 +84,50 @@ class Config(BaseModel):
     pg_bin_dir: str = Field(..., json_schema_extra={"description": "Directory containing PostgreSQL binaries"})
     pg_cluster_dir: str = Field(..., json_schema_extra={"description": "Directory containing clusters"})
     nodes: List[Cluster] = Field(..., json_schema_extra={"description": "List of nodes configurations"})
+    pg_ctl_timeout: int = Field(default=60, json_schema_extra={"description": "Seconds to wait for a server to start or stop"})
+    shutdown_mode: Literal["smart", "fast", "immediate"] = Field(default="fast", json_schema_extra={"description": "pg_ctl stop mode"})
+    initdb_template: bool = Field(default=True, json_schema_extra={"description": "Clone node data dirs from a cached initdb template"})
+    cluster_profile: str = Field(default="default", json_schema_extra={"description": "Settings profile of all nodes (fast: tmpfs, non-durable settings)"})
+    fast_cluster_dir: str = Field(default="/dev/shm/pg_cluster", json_schema_extra={"description": "RAM-backed directory for data dirs of the fast profile"})
+    profiles: Dict[str, Dict[str, str]] = Field(default_factory=dict, json_schema_extra={"description": "Named settings profiles (added to / overriding the built-in ones)"})
+    shard: int = Field(default=0, json_schema_extra={"description": "Index of the independent test topology (0 = the one defined here)"})
+    shard_port_stride: int = Field(default=10, json_schema_extra={"description": "Port offset between test topologies"})
+    topology: List[ReplicationEdge] = Field(default_factory=list, json_schema_extra={"description": "Publisher/subscriber edges (default: master -> replica1 -> replica2)"})
+
+    @field_validator("profiles", mode="before")
+    def profiles_as_str(cls, value):
+        return {name: _settings_to_str(settings) for name, settings in (value or {}).items()}
+
+    @model_validator(mode="after")
+    def profiles_are_known(self):
+        known = self.get_profiles()
+        for profile in [self.cluster_profile] + [node.profile for node in self.nodes if node.profile]:
+            if profile not in known:
+                raise ValueError(f"Unknown settings profile '{profile}', expected one of {list(known)}")
+        return self
+
+    @model_validator(mode="after")
+    def topology_is_valid(self):
+        names = {node.name for node in self.nodes}
+        subscribers = set()
+        for edge in self.topology:
+            for name in (edge.publisher, edge.subscriber):
+                if name not in names:
+                    raise ValueError(f"Topology refers to unknown node '{name}'")
+            if edge.subscriber in subscribers:
+                raise ValueError(f"Node '{edge.subscriber}' subscribes to more than one publisher")
+            subscribers.add(edge.subscriber)
+        self.get_topology_levels(cascade=True)
+        return self
+
+    @model_validator(mode="after")
+    def shard_ports_do_not_overlap(self):
+        ports = [port for node in self.nodes for port in (node.port, node.conn_params.port)]
+        span = max(ports) - min(ports) + 1 if ports else 0
+        if self.shard_port_stride < span:
+            raise ValueError(f"shard_port_stride {self.shard_port_stride} is smaller than the port span {span} "
+                             f"of the nodes ({min(ports)}-{max(ports)}), shards would share ports")
+        return self
 
 
     def get_master_node(self) -> Cluster:
@@ -62,14 +156,103 @@ class Config(BaseModel):
         node = self.get_node_by_name(node_name)
         return node.replication_table
 
+    def get_data_dir(self, node_name: str) -> str:
+        """Data directory of the node for the selected cluster profile (and shard)."""
+        base_dir = self.fast_cluster_dir if self.cluster_profile in RAM_PROFILES else self.pg_cluster_dir
+        if self.shard:
+            base_dir = os.path.join(base_dir, f"shard{self.shard}")
+        return os.path.join(base_dir, node_name)
+
+    def for_shard(self, shard: int) -> "Config":
+        """
+        Returns the config of an independent copy of the topology: every port shifted by
+        shard * shard_port_stride and data dirs under <cluster dir>/shard<N>.
+        """
+        offset = shard * self.shard_port_stride
+        nodes = [
+            node.model_copy(update={
+                "port": node.port + offset,
+                "conn_params": node.conn_params.model_copy(update={"port": node.conn_params.port + offset}),
+            })
+            for node in self.nodes
+        ]
+        return self.model_copy(update={"shard": shard, "nodes": nodes})
+
+    def get_topology(self, cascade: bool = True) -> List[ReplicationEdge]:
+        """Replication edges of the topology; cascade-only edges are left out unless cascade is set."""
+        return [edge for edge in (self.topology or DEFAULT_TOPOLOGY) if cascade or not edge.cascade]
+
+    def get_topology_roots(self, cascade: bool = True) -> List[str]:
+        """Publishers that do not subscribe to anything, in topology order."""
+        edges = self.get_topology(cascade)
+        subscribers = {edge.subscriber for edge in edges}
+        return list(dict.fromkeys(edge.publisher for edge in edges if edge.publisher not in subscribers))
+
+    def get_topology_levels(self, cascade: bool = True) -> List[List[ReplicationEdge]]:
+        """
+        Edges grouped in setup order: level N holds the subscribers N hops away from a root.
+        Edges within a level are independent of each other.
+        """
+        remaining = self.get_topology(cascade)
+        ready = set(self.get_topology_roots(cascade))
+        levels = []
+        while remaining:
+            level = [edge for edge in remaining if edge.publisher in ready]
+            if not level:
+                raise ValueError(f"Topology has a cycle through {sorted(edge.subscriber for edge in remaining)}")
+            levels.append(level)
+            ready.update(edge.subscriber for edge in level)
+            remaining = [edge for edge in remaining if edge not in level]
+        return levels
+
+    def get_topology_chain(self, cascade: bool = True) -> Optional[List[str]]:
+        """
+        Nodes of the topology in replication order if it is a single chain
+        (e.g. ['master', 'replica1', 'replica2']), None if it fans out anywhere.
+        """
+        roots = self.get_topology_roots(cascade)
+        levels = self.get_topology_levels(cascade)
+        if len(roots) != 1 or any(len(level) != 1 for level in levels):
+            return None
+        return roots + [level[0].subscriber for level in levels]
+
+    def get_profiles(self) -> Dict[str, Dict[str, str]]:
+        """Built-in profiles merged with the ones from config.json."""
+        profiles = {name: dict(settings) for name, settings in CLUSTER_PROFILES.items()}
+        for name, settings in self.profiles.items():
+            profiles.setdefault(name, {}).update(settings)
+        return profiles
+
+    def get_node_settings(self, node_name: str) -> Dict[str, str]:
+        """
+        postgresql.conf settings configured for the node: cluster profile,
+        then the node's own profile, then its settings map (later wins).
+        """
+        node = self.get_node_by_name(node_name)
+        profiles = self.get_profiles()
+        settings = dict(profiles[self.cluster_profile])
+        if node.profile:
+            settings.update(profiles[node.profile])
+        settings.update(node.settings)
+        return settings
+
 def load_config() -> Config:
-    """Load configuration from config.json."""
+    """
+    Load configuration from config.json.
+    The PG_CLUSTER_PROFILE environment variable (set by `main.py --profile`) overrides cluster_profile,
+    PG_TEST_SHARD selects a shard of the topology (see Config.for_shard; set by the parallel test runner).
+    """
     config_path = os.path.join(os.path.dirname(__file__), '..', 'config.json')
     try:
         with open(config_path) as f:
             config_data = json.load(f)
+        if os.environ.get("PG_CLUSTER_PROFILE"):
+            config_data["cluster_profile"] = os.environ["PG_CLUSTER_PROFILE"]
 
-        return Config(**config_data)
+        config = Config(**config_data)
+        if os.environ.get("PG_TEST_SHARD"):
+            config = config.for_shard(int(os.environ["PG_TEST_SHARD"]))
+        return config
     except FileNotFoundError:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
     except json.JSONDecodeError as e:
@@ -0,0 +1,87 @@
+# sql/catalog.py
+
+from jinja2 import Template
+
+
+def generate_schema_snapshot_query(schema_name: str) -> str:
+    """
+    Creates a query returning the structure of every table in the schema as one JSON object
+    keyed by table name: kind, columns (in attnum order), constraints, indexes,
+    partition key/bound and inheritance parents. Read from pg_catalog only.
+    """
+    template = Template("""
+    SELECT coalesce(json_object_agg(c.relname, json_build_object(
+        'kind', c.relkind,
+        'columns', (
+            SELECT coalesce(json_agg(json_build_object(
+                'name', a.attname,
+                'type', format_type(a.atttypid, a.atttypmod),
+                'not_null', a.attnotnull,
+                'default', pg_get_expr(d.adbin, d.adrelid),
+                'identity', a.attidentity,
+                'generated', a.attgenerated
+            ) ORDER BY a.attnum), '[]')
+            FROM pg_attribute a
+            LEFT JOIN pg_attrdef d ON d.adrelid = a.attrelid AND d.adnum = a.attnum
+            WHERE a.attrelid = c.oid AND a.attnum > 0 AND NOT a.attisdropped
+        ),
+        'constraints', (
+            SELECT coalesce(json_object_agg(co.conname, pg_get_constraintdef(co.oid)), '{}')
+            FROM pg_constraint co
+            WHERE co.conrelid = c.oid
+        ),
+        'indexes', (
+            SELECT coalesce(json_object_agg(ic.relname, pg_get_indexdef(i.indexrelid)), '{}')
+            FROM pg_index i
+            JOIN pg_class ic ON ic.oid = i.indexrelid
+            WHERE i.indrelid = c.oid
+        ),
+        'partition_key', CASE WHEN c.relkind = 'p' THEN pg_get_partkeydef(c.oid) END,
+        'partition_bound', CASE WHEN c.relispartition THEN pg_get_expr(c.relpartbound, c.oid) END,
+        'parents', (
+            SELECT coalesce(json_agg(pn.nspname || '.' || p.relname ORDER BY inh.inhseqno), '[]')
+            FROM pg_inherits inh
+            JOIN pg_class p ON p.oid = inh.inhparent
+            JOIN pg_namespace pn ON pn.oid = p.relnamespace
+            WHERE inh.inhrelid = c.oid
+        )
+    )), '{}')
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = '{{ schema_name }}' AND c.relkind IN ('r', 'p');
+    """)
+    return template.render(schema_name=schema_name)
+
+
+def generate_schema_columns_query(schema_name: str) -> str:
+    """
+    Creates a query returning (table, column, type, default) for every table, view and
+    foreign table of the schema; tables without columns yield one row with NULL column.
+    The type is spelled like information_schema.columns.data_type ('character varying',
+    'ARRAY', 'USER-DEFINED', the base type for domains); generated columns have no default,
+    as in information_schema.columns.column_default.
+    """
+    template = Template("""
+    SELECT c.relname, a.attname,
+           CASE WHEN t.typtype = 'd' THEN
+                    CASE WHEN bt.typelem <> 0 AND bt.typlen = -1 THEN 'ARRAY'
+                         WHEN btn.nspname = 'pg_catalog' THEN format_type(t.typbasetype, NULL)
+                         ELSE 'USER-DEFINED' END
+                ELSE
+                    CASE WHEN t.typelem <> 0 AND t.typlen = -1 THEN 'ARRAY'
+                         WHEN tn.nspname = 'pg_catalog' THEN format_type(a.atttypid, NULL)
+                         ELSE 'USER-DEFINED' END
+           END,
+           CASE WHEN a.attgenerated = '' THEN pg_get_expr(d.adbin, d.adrelid) END
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    LEFT JOIN pg_attribute a ON a.attrelid = c.oid AND a.attnum > 0 AND NOT a.attisdropped
+    LEFT JOIN pg_attrdef d ON d.adrelid = a.attrelid AND d.adnum = a.attnum
+    LEFT JOIN pg_type t ON t.oid = a.atttypid
+    LEFT JOIN pg_namespace tn ON tn.oid = t.typnamespace
+    LEFT JOIN pg_type bt ON t.typtype = 'd' AND bt.oid = t.typbasetype
+    LEFT JOIN pg_namespace btn ON btn.oid = bt.typnamespace
+    WHERE n.nspname = '{{ schema_name }}' AND c.relkind IN ('r', 'p', 'v', 'm', 'f')
+    ORDER BY c.relname, a.attnum;
+    """)
+    return template.render(schema_name=schema_name)
@@ -0,0 +1,97 @@
+# sql/checksum.py
+
+from typing import List, Optional
+
+from jinja2 import Template
+
+
+def quote_ident(name: str) -> str:
+    """Quotes an identifier taken from the catalog (column names may be mixed-case)."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _param_ident(name: str) -> str:
+    """quote_ident for queries run with psycopg2 parameters, where a literal '%' must be doubled."""
+    return quote_ident(name).replace("%", "%%")
+
+
+def generate_primary_key_query(schema_name: str, table_name: str) -> str:
+    """
+    Creates a query returning (column, type) of the table's primary key in key order.
+    """
+    template = Template("""
+    SELECT a.attname, format_type(a.atttypid, a.atttypmod)
+    FROM pg_index i
+    JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
+    WHERE i.indrelid = '{{ schema_name }}.{{ table_name }}'::regclass AND i.indisprimary
+    ORDER BY array_position(i.indkey::int2[], a.attnum);
+    """)
+    return template.render(schema_name=schema_name, table_name=table_name)
+
+
+def generate_table_columns_query(schema_name: str, table_name: str) -> str:
+    """
+    Creates a query returning the table's column names in attnum order.
+    """
+    template = Template("""
+    SELECT attname FROM pg_attribute
+    WHERE attrelid = '{{ schema_name }}.{{ table_name }}'::regclass AND attnum > 0 AND NOT attisdropped
+    ORDER BY attnum;
+    """)
+    return template.render(schema_name=schema_name, table_name=table_name)
+
+
+def generate_chunk_bounds_query(schema_name: str, table_name: str, key_column: str, chunk_size: int) -> str:
+    """
+    Creates a query returning every chunk_size-th distinct value of key_column;
+    these are the lower bounds of the chunks.
+    """
+    template = Template("""
+    SELECT k FROM (
+        SELECT k, row_number() OVER (ORDER BY k) AS rn
+        FROM (SELECT DISTINCT {{ key_column }} AS k FROM {{ schema_name }}.{{ table_name }}) d
+    ) n
+    WHERE rn % {{ chunk_size }} = 1
+    ORDER BY k;
+    """)
+    return template.render(schema_name=schema_name, table_name=table_name,
+                           key_column=quote_ident(key_column), chunk_size=chunk_size)
+
+
+def generate_chunk_hash_query(schema_name: str, table_name: str, columns: List[str],
+                              key_columns: List[str], key_type: Optional[str] = None) -> str:
+    """
+    Creates a query returning (chunk, row count, md5 of the chunk) per chunk.
+
+    Rows are assigned to chunks with width_bucket() over the bounds passed as the
+    %(bounds)s parameter (array of key_type); within a chunk rows are hashed in key order.
+    Without key columns the whole table is one chunk, hashed in row-hash order.
+    """
+    template = Template("""
+    SELECT {% if key_columns %}width_bucket({{ key_columns[0] }}, %(bounds)s::{{ key_type }}[]){% else %}0{% endif %} AS chunk,
+           count(*),
+           md5(string_agg(md5(ROW({{ columns | join(', ') }})::text), ''
+               ORDER BY {% if key_columns %}{{ key_columns | join(', ') }}{% else %}md5(ROW({{ columns | join(', ') }})::text){% endif %}))
+    FROM {{ schema_name }}.{{ table_name }}
+    GROUP BY 1
+    ORDER BY 1;
+    """)
+    return template.render(schema_name=schema_name, table_name=table_name, key_type=key_type,
+                           columns=[_param_ident(c) for c in columns],
+                           key_columns=[_param_ident(c) for c in key_columns])
+
+
+def generate_chunk_rows_query(schema_name: str, table_name: str, columns: List[str], key_column: Optional[str] = None,
+                              has_lower: bool = False, has_upper: bool = False) -> str:
+    """
+    Creates a query returning the rows of one chunk: key_column >= %(lower)s and < %(upper)s
+    (each bound only if present).
+    """
+    template = Template("""
+    SELECT {{ columns | join(', ') }} FROM {{ schema_name }}.{{ table_name }}
+    WHERE true{% if has_lower %} AND {{ key_column }} >= %(lower)s{% endif %}{% if has_upper %} AND {{ key_column }} < %(upper)s{% endif %};
+    """)
+    return template.render(schema_name=schema_name, table_name=table_name,
+                           columns=[_param_ident(c) for c in columns],
+                           key_column=_param_ident(key_column) if key_column else None,
+                           has_lower=has_lower, has_upper=has_upper)
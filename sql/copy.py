@@ -0,0 +1,72 @@
+# sql/copy.py
+
+import json
+from datetime import date, datetime, time
+from typing import Any, List, Optional, Sequence
+
+from jinja2 import Template
+
+_COPY_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def generate_copy_from_stdin_query(schema_name: str, table_name: str, columns: Optional[List[str]] = None) -> str:
+    """
+    Creates a COPY ... FROM STDIN query (text format).
+    Without columns the table's own column order is used.
+    """
+    template = Template("COPY {{ schema_name }}.{{ table_name }}{% if columns %} ({{ columns | join(', ') }}){% endif %} FROM STDIN;")
+    return template.render(schema_name=schema_name, table_name=table_name, columns=columns)
+
+
+def get_copy_columns(columns_def: dict) -> List[str]:
+    """
+    Returns the columns of a create_table columns_def that accept values,
+    i.e. everything except generated columns.
+    """
+    return [name for name, col_type in columns_def.items() if "GENERATED ALWAYS AS" not in col_type.upper()]
+
+
+def _array_literal(values: Sequence[Any]) -> str:
+    elements = []
+    for value in values:
+        if value is None:
+            elements.append("NULL")
+        elif isinstance(value, (list, tuple)):
+            elements.append(_array_literal(value))
+        else:
+            text = _to_text(value, None).replace("\\", "\\\\").replace('"', '\\"')
+            elements.append(f'"{text}"')
+    return "{" + ",".join(elements) + "}"
+
+
+def _to_text(value: Any, column_type: Optional[str]) -> str:
+    type_name = (column_type or "").upper()
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return "\\x" + bytes(value).hex()
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, dict) or (isinstance(value, (list, tuple)) and "JSON" in type_name):
+        return json.dumps(value)
+    if isinstance(value, (list, tuple)):
+        return _array_literal(value)
+    return str(value)
+
+
+def format_copy_row(values: Sequence[Any], column_types: Optional[Sequence[Optional[str]]] = None) -> str:
+    """
+    Renders one row as a line of COPY text format.
+
+    :param values: Row values in column order (None becomes NULL).
+    :param column_types: SQL type of every column (from columns_def); None entries or no list when unknown.
+    """
+    if column_types is None:
+        column_types = [None] * len(values)
+    fields = []
+    for value, column_type in zip(values, column_types):
+        if value is None:
+            fields.append("\\N")
+        else:
+            fields.append(_to_text(value, column_type).translate(_COPY_TEXT_ESCAPES))
+    return "\t".join(fields) + "\n"
@@ -12,4 +12,14 @@ def generate_create_publication_query(publication_name: str, schema_name: str, d
 def generate_drop_publication_query(publication_name: str) -> str:
     """Creates an SQL query to drop a publication."""
     template = Template("DROP PUBLICATION IF EXISTS {{ publication_name }};")
-    return template.render(publication_name=publication_name)
\ No newline at end of file
+    return template.render(publication_name=publication_name)
+
+def generate_add_schema_to_publication_query(publication_name: str, schema_name: str) -> str:
+    """Creates an SQL query to add all tables of a schema to a publication."""
+    template = Template("ALTER PUBLICATION {{ publication_name }} ADD TABLES IN SCHEMA {{ schema_name }};")
+    return template.render(publication_name=publication_name, schema_name=schema_name)
+
+def generate_drop_schema_from_publication_query(publication_name: str, schema_name: str) -> str:
+    """Creates an SQL query to remove a schema from a publication."""
+    template = Template("ALTER PUBLICATION {{ publication_name }} DROP TABLES IN SCHEMA {{ schema_name }};")
+    return template.render(publication_name=publication_name, schema_name=schema_name)
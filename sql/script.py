@@ -0,0 +1,33 @@
+# sql/script.py
+
+from typing import List
+
+from jinja2 import Template
+
+
+def _terminate(statement: str) -> str:
+    # ';' goes on its own line: the statement may end with a -- comment.
+    statement = statement.strip()
+    return statement if statement.endswith(";") else f"{statement}\n;"
+
+
+def generate_timed_script(statements: List[str]) -> str:
+    """
+    Composes several generated queries (e.g. from sql/*) into one script that can be
+    sent to the server in a single round trip. Records clock_timestamp() before every statement
+    into transaction-local settings and ends with a SELECT returning all marks
+    (one more than the number of statements) as a timestamptz array.
+
+    Must run inside a single transaction.
+    """
+    statements = [s for s in statements if s.strip()]
+    template = Template(
+        "{% for statement in statements %}"
+        "SELECT set_config('batch.mark_{{ loop.index0 }}', clock_timestamp()::text, true);\n"
+        "{{ statement }}\n"
+        "{% endfor %}"
+        "SELECT ARRAY["
+        "{% for statement in statements %}current_setting('batch.mark_{{ loop.index0 }}')::timestamptz, {% endfor %}"
+        "clock_timestamp()];"
+    )
+    return template.render(statements=[_terminate(s) for s in statements])
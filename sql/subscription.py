@@ -11,4 +11,9 @@ def generate_create_subscription_query(subscription_name: str, connection_info:
 def generate_drop_subscription_query(subscription_name: str) -> str:
     """Creates an SQL query to drop a subscription."""
     template = Template("DROP SUBSCRIPTION IF EXISTS {{ subscription_name }};")
-    return template.render(subscription_name=subscription_name)
\ No newline at end of file
+    return template.render(subscription_name=subscription_name)
+
+def generate_refresh_subscription_query(subscription_name: str) -> str:
+    """Creates an SQL query to pick up tables added to the subscribed publications."""
+    template = Template("ALTER SUBSCRIPTION {{ subscription_name }} REFRESH PUBLICATION;")
+    return template.render(subscription_name=subscription_name)
@@ -0,0 +1,24 @@
+# tests/cascade/dml/test_cascade_propagation.py
+
+import pytest
+
+@pytest.mark.cascade
+def test_cascade_propagation(local_setup, ddl_implementation, master_node, replica2_node, replication_timeout):
+    """
+    1) Insert a row into the replication table on the master.
+    2) Follow the master LSN hop by hop: master -> replica1 -> replica2.
+    3) Verify that every hop converged and the row reached replica2.
+    """
+    master_name = master_node.name
+    replica_name = replica2_node.name
+    schema_name = master_node.replication_schema
+    table_name = master_node.replication_table
+
+    ddl_implementation.insert_into_table(master_name, schema_name, table_name, {"data": "cascade row"})
+
+    hops = ddl_implementation.track_propagation(master_name, replica_name, replication_timeout)
+    assert [hop["hop"] for hop in hops] == ["master -> replica1", "replica1 -> replica2"], \
+        f"Unexpected replication chain: {hops}"
+
+    rows = ddl_implementation.select_all(replica_name, schema_name, table_name)
+    assert any(r["data"] == "cascade row" for r in rows), "Row did not reach the end of the cascade."
@@ -1,11 +1,14 @@
 # tests/conftest.py
 
 import json
+import os
 import pytest
 import time
 
 from factories.ddl_factory import get_ddl_implementation
 from models.config import load_config
+from utils.log_handler import logger
+from utils.test_history import load_history, order_tests, record_results
 from tests.fixtures.cluster_fixtures import *
 from tests.fixtures.global_fixtures import *
 from tests.fixtures.local_fixtures import *
@@ -16,7 +19,12 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "cascade: Marker for tests, that need cascade replication")
 
 def pytest_addoption(parser):
-    parser.addini("replication_wait_time", "Time to wait (in seconds) for replication", default="1")
+    parser.addini("replication_timeout", "Max time (in seconds) to wait for a replica to catch up", default="30")
+    parser.addini("lag_sample_interval", "Interval (in seconds) of background replication lag sampling, 0 disables it", default="0")
+    parser.addini("schema_per_test", "Set up replication once per session and give every test its own replicated schema (1/0)", default="0")
+    parser.addini("test_order", "Test order: collection, duration (longest first, from pytest_durations.json) "
+                  "or failed (recently failed first, then longest first)", default="collection")
+    parser.addini("setup_snapshots", "Restore replication setup from a data dir snapshot before each test instead of re-creating it (1/0)", default="0")
 
 @pytest.fixture(scope="session")
 def config():
@@ -35,14 +43,58 @@ def ddl_implementation(request, config):
     return get_ddl_implementation("postgresql", config)
 
 @pytest.fixture(scope="session")
-def replication_wait_time(pytestconfig):
-    """Return the replication wait time (int)."""
-    return int(pytestconfig.getini("replication_wait_time"))
+def replication_timeout(pytestconfig):
+    """Return the max time (float) to wait for a replica to catch up."""
+    return float(pytestconfig.getini("replication_timeout"))
+
+@pytest.fixture(scope="session")
+def lag_sample_interval(pytestconfig):
+    """Return the lag sampling interval (float), 0 when sampling is disabled."""
+    return float(pytestconfig.getini("lag_sample_interval"))
+
+@pytest.fixture(scope="session")
+def setup_snapshots(pytestconfig):
+    """Return True if local_setup restores replication setups from snapshots."""
+    return pytestconfig.getini("setup_snapshots").strip().lower() in ("1", "true", "yes", "on")
+
+@pytest.fixture(scope="session")
+def schema_per_test(pytestconfig, ddl_implementation):
+    """
+    Return True if tests run in their own schema on a session-wide topology
+    (schema_per_test ini option, only for implementations that support it and chain topologies).
+    """
+    enabled = pytestconfig.getini("schema_per_test").strip().lower() in ("1", "true", "yes", "on")
+    if enabled and ddl_implementation.config.get_topology_chain(cascade=True) is None:
+        # add_replicated_schema follows a single chain; fan-out topologies get per-test setup.
+        logger.warning("[schema_per_test] Topology is not a single chain, schema_per_test disabled.")
+        return False
+    return enabled and ddl_implementation.supports_schema_namespacing
+
+@pytest.fixture
+def wait_for_replication(ddl_implementation, replication_timeout):
+    """
+    Returns a callable wait(master_name, replica_name, timeout=None) that blocks until
+    the replica has applied everything committed on the master so far.
+    """
+    def wait(master_name, replica_name, timeout=None):
+        return ddl_implementation.wait_for_replication(master_name, replica_name, timeout or replication_timeout)
+    return wait
+
+def pytest_collection_modifyitems(session, config, items):
+    order = config.getini("test_order").strip().lower()
+    if order not in ("duration", "failed"):
+        return
+    positions = {test_id: i for i, test_id in enumerate(order_tests([item.nodeid for item in items], load_history(),
+                                                                     failed_first=(order == "failed")))}
+    items.sort(key=lambda item: positions[item.nodeid])
 
 # --------------------
 # Метрики тестов
 # --------------------
 
+# Per-test results of this session for utils.test_history: node id -> {"duration", "failed", "skipped"}.
+_test_results = {}
+
 def pytest_sessionstart(session):
     session.config._my_metrics = {
         "start_time": time.time(),
@@ -50,6 +102,17 @@ def pytest_sessionstart(session):
         "failed": 0,
         "skipped": 0
     }
+    _test_results.clear()
+
+def pytest_runtest_logreport(report):
+    # setup + call + teardown time and outcome of every test, for test_history;
+    # xfail is reported as skipped, so an expected failure is not recorded as failed.
+    result = _test_results.setdefault(report.nodeid, {"duration": 0.0, "failed": False, "skipped": False})
+    result["duration"] += report.duration
+    if report.skipped:
+        result["skipped"] = True
+    elif report.failed:
+        result["failed"] = True
 
 def pytest_runtest_makereport(item, call):
 
@@ -68,6 +131,7 @@ def pytest_runtest_makereport(item, call):
 
 def pytest_sessionfinish(session, exitstatus):
     metrics = session.config._my_metrics
+    record_results({test_id: result for test_id, result in _test_results.items() if not result["skipped"]})
     total_time = time.time() - metrics["start_time"]
 
     p = metrics["passed"]
@@ -90,5 +154,7 @@ def pytest_sessionfinish(session, exitstatus):
         "skipped": s,
         "time_seconds": total_time,
     }
-    with open("pytest_metrics.json", "w") as fjson:
+    shard = os.environ.get("PG_TEST_SHARD")
+    metrics_path = f"pytest_metrics_shard{shard}.json" if shard else "pytest_metrics.json"
+    with open(metrics_path, "w") as fjson:
         json.dump(results_dict, fjson, indent=2)
@@ -1,12 +1,11 @@
 # tests/ddl/table/create/test_alter_table_add_column.py
 
 import pytest
-import time
 
 from utils.execute import execute_sql
 
 @pytest.mark.ddl
-def test_alter_table_add_column(local_setup, ddl_implementation, master_node, replica1_node, replication_wait_time):
+def test_alter_table_add_column(local_setup, ddl_implementation, master_node, replica1_node, wait_for_replication):
     """
     1) Create a table (`id SERIAL, data TEXT`).
     2) Execute `ALTER TABLE ADD COLUMN new_column INTEGER DEFAULT 0` on the master.
@@ -26,7 +25,7 @@ def test_alter_table_add_column(local_setup, ddl_implementation, master_node, re
         table_name=table_name
     )
 
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     if not ddl_implementation.table_exists(replica_name, schema_name, table_name):
         ddl_implementation.create_table(
@@ -45,7 +44,7 @@ def test_alter_table_add_column(local_setup, ddl_implementation, master_node, re
         default_value=0
     )
 
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     columns = ddl_implementation.get_table_columns(replica_name, schema_name, table_name)
     col_names = [col["column_name"] for col in columns]
@@ -60,7 +59,7 @@ def test_alter_table_add_column(local_setup, ddl_implementation, master_node, re
         data={"id": 2, "data": "Hello from master2", "new_column": 999}
     )
 
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     rows = ddl_implementation.select_all(replica_name, schema_name, table_name)
 
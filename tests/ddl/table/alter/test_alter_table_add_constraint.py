@@ -1,11 +1,10 @@
 # tests/ddl/table/alter/test_alter_table_add_constraint.py
 
 import pytest
-import time
 import psycopg2
 
 @pytest.mark.ddl
-def test_alter_table_add_constraint_check(local_setup, ddl_implementation, master_node, replica1_node, replication_wait_time):
+def test_alter_table_add_constraint_check(local_setup, ddl_implementation, master_node, replica1_node, wait_for_replication):
     """
     1) Create a table (`id INT, val INT`).
     2) Execute `ALTER TABLE ADD CONSTRAINT check_val_positive CHECK (val > 0)`.
@@ -25,7 +24,7 @@ def test_alter_table_add_constraint_check(local_setup, ddl_implementation, maste
         table_name,
         columns_def={"id": "SERIAL", "val": "INT"}
     )
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     if not ddl_implementation.table_exists(replica_name, schema_name, table_name):
         ddl_implementation.create_table(
@@ -40,7 +39,7 @@ def test_alter_table_add_constraint_check(local_setup, ddl_implementation, maste
     CHECK (val > 0);
     """
     ddl_implementation._execute(master_name, add_constraint_sql)
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     check_constraints_sql = f"""
     SELECT conname, contype
@@ -63,7 +62,7 @@ def test_alter_table_add_constraint_check(local_setup, ddl_implementation, maste
     ddl_implementation.insert_into_table(
         master_name, schema_name, table_name, good_row
     )
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     rows_on_replica = ddl_implementation.select_all(replica_name, schema_name, table_name)
     assert len(rows_on_replica) == 1
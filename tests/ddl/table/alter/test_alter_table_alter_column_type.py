@@ -1,11 +1,10 @@
 #tests/ddl/table/alter/test_alter_table_alter_column_type.py
 
 import pytest
-import time
 
 
 @pytest.mark.ddl
-def test_alter_table_alter_column_type(local_setup, ddl_implementation, master_node, replica1_node, replication_wait_time):
+def test_alter_table_alter_column_type(local_setup, ddl_implementation, master_node, replica1_node, wait_for_replication):
     """
     1) Create a table (`id SERIAL PRIMARY KEY, col_to_alter TEXT`).
     2) Execute `ALTER TABLE ALTER COLUMN col_to_alter TYPE VARCHAR(255)` on the master.
@@ -25,7 +24,7 @@ def test_alter_table_alter_column_type(local_setup, ddl_implementation, master_n
         table_name=table_name,
         columns_def={"id": "SERIAL PRIMARY KEY", col_name: "text"}
     )
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     if not ddl_implementation.table_exists(replica_name, schema_name, table_name):
         ddl_implementation.create_table(
@@ -34,7 +33,7 @@ def test_alter_table_alter_column_type(local_setup, ddl_implementation, master_n
             table_name=table_name,
             columns_def={"id": "SERIAL PRIMARY KEY", col_name: "text"}
         )
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     ddl_implementation.alter_column_type(
         node_name=master_name,
@@ -44,7 +43,7 @@ def test_alter_table_alter_column_type(local_setup, ddl_implementation, master_n
         new_type="VARCHAR(255)"
     )
 
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     columns = ddl_implementation.get_table_columns(replica_name, schema_name, table_name)
     altered_col = next((c for c in columns if c["column_name"] == col_name), None)
@@ -1,10 +1,9 @@
 # tests/ddl/table/alter/test_alter_table_default.py
 
 import pytest
-import time
 
 @pytest.mark.ddl
-def test_alter_table_alter_column_default(local_setup, ddl_implementation, master_node, replica1_node, replication_wait_time):
+def test_alter_table_alter_column_default(local_setup, ddl_implementation, master_node, replica1_node, wait_for_replication):
     """
     1) Create a table (`id serial primary key, data text`).
     2) Execute `ALTER TABLE ... ALTER COLUMN data SET DEFAULT 'Hello default!';`
@@ -25,7 +24,7 @@ def test_alter_table_alter_column_default(local_setup, ddl_implementation, maste
         table_name,
         columns_def={"id": "SERIAL PRIMARY KEY", "data": "TEXT"}
     )
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     if not ddl_implementation.table_exists(replica_name, schema_name, table_name):
         ddl_implementation.create_table(
@@ -40,11 +39,11 @@ def test_alter_table_alter_column_default(local_setup, ddl_implementation, maste
     SET DEFAULT 'Hello default!';
     """
     ddl_implementation._execute(master_name, alter_sql_1)
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     row1 = {"id": 1}
     ddl_implementation.insert_into_table(master_name, schema_name, table_name, row1)
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     rows_replica = ddl_implementation.select_all(replica_name, schema_name, table_name)
 
@@ -58,11 +57,11 @@ def test_alter_table_alter_column_default(local_setup, ddl_implementation, maste
     SET DEFAULT 'Another default';
     """
     ddl_implementation._execute(master_name, alter_sql_2)
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     row2 = {"id": 2}
     ddl_implementation.insert_into_table(master_name, schema_name, table_name, row2)
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     rows_replica = ddl_implementation.select_all(replica_name, schema_name, table_name)
     assert len(rows_replica) == 2
@@ -1,10 +1,9 @@
 #tests/ddl/table/alter/test_alter_table_drop_column.py
 
 import pytest
-import time
 
 @pytest.mark.ddl
-def test_alter_table_drop_column(local_setup, ddl_implementation, master_node, replica1_node, replication_wait_time):
+def test_alter_table_drop_column(local_setup, ddl_implementation, master_node, replica1_node, wait_for_replication):
     """
     1) Create a table (`id SERIAL PRIMARY KEY, drop_me TEXT`).
     2) Execute `ALTER TABLE DROP COLUMN drop_me` on the master.
@@ -25,7 +24,7 @@ def test_alter_table_drop_column(local_setup, ddl_implementation, master_node, r
         columns_def={"id": "SERIAL PRIMARY KEY", col_name: "text"}
     )
 
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     if not ddl_implementation.table_exists(replica_name, schema_name, table_name):
         ddl_implementation.create_table(
@@ -35,7 +34,7 @@ def test_alter_table_drop_column(local_setup, ddl_implementation, master_node, r
             columns_def={"id": "SERIAL PRIMARY KEY", col_name: "text"}
         )
 
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     ddl_implementation.drop_column(
         node_name=master_name,
@@ -44,7 +43,7 @@ def test_alter_table_drop_column(local_setup, ddl_implementation, master_node, r
         column_name=col_name
     )
 
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     columns = ddl_implementation.get_table_columns(replica_name, schema_name, table_name)
     col_names = [c["column_name"] for c in columns]
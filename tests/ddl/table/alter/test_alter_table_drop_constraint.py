@@ -1,11 +1,10 @@
 # tests/ddl/table/alter/test_alter_table_drop_constraint.py
 
 import pytest
-import time
 import psycopg2
 
 @pytest.mark.ddl
-def test_alter_table_drop_constraint(local_setup, ddl_implementation, master_node, replica1_node, replication_wait_time):
+def test_alter_table_drop_constraint(local_setup, ddl_implementation, master_node, replica1_node, wait_for_replication):
     """
     1) Create a table and add a CHECK constraint (`val > 0`).
     2) Verify that the constraint exists on the replica.
@@ -27,7 +26,7 @@ def test_alter_table_drop_constraint(local_setup, ddl_implementation, master_nod
     );
     """
     ddl_implementation._execute(master_name, create_sql)
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     con_check_sql = f"""
     SELECT conname
@@ -43,14 +42,14 @@ def test_alter_table_drop_constraint(local_setup, ddl_implementation, master_nod
     DROP CONSTRAINT check_val_positive;
     """
     ddl_implementation._execute(master_name, drop_sql)
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     constraints_after = ddl_implementation._execute(replica_name, con_check_sql, fetch=True)
     assert not constraints_after, "Constraint still exists on replica after DROP."
 
     row_neg = {"val": -100}
     ddl_implementation.insert_into_table(master_name, schema_name, table_name, row_neg)
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     rows_replica = ddl_implementation.select_all(replica_name, schema_name, table_name)
     inserted_row = next((r for r in rows_replica if r["val"] == -100), None)
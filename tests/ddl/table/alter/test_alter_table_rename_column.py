@@ -1,10 +1,9 @@
 #tests/ddl/table/alter/test_alter_table_rename_column.py
 
 import pytest
-import time
 
 @pytest.mark.ddl
-def test_alter_table_rename_column(local_setup, ddl_implementation, master_node, replica1_node, replication_wait_time):
+def test_alter_table_rename_column(local_setup, ddl_implementation, master_node, replica1_node, wait_for_replication):
     """
     1) Create a table (`id SERIAL PRIMARY KEY, col_old TEXT`).
     2) Execute `ALTER TABLE RENAME COLUMN col_old TO col_new` on the master.
@@ -26,7 +25,7 @@ def test_alter_table_rename_column(local_setup, ddl_implementation, master_node,
         columns_def={"id": "SERIAL PRIMARY KEY", old_col_name: "text"}
     )
 
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     if not ddl_implementation.table_exists(replica_name, schema_name, table_name):
         ddl_implementation.create_table(
@@ -35,7 +34,7 @@ def test_alter_table_rename_column(local_setup, ddl_implementation, master_node,
             table_name=table_name,
             columns_def={"id": "SERIAL PRIMARY KEY", old_col_name: "text"}
         )
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     ddl_implementation.rename_column(
         node_name=master_name,
@@ -45,7 +44,7 @@ def test_alter_table_rename_column(local_setup, ddl_implementation, master_node,
         new_column_name=new_col_name
     )
 
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     columns = ddl_implementation.get_table_columns(replica_name, schema_name, table_name)
     col_names = [c["column_name"] for c in columns]
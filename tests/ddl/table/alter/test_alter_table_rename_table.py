@@ -1,10 +1,9 @@
 #tests/ddl/table/alter/test_alter_table_rename_table.py
 
 import pytest
-import time
 
 @pytest.mark.ddl
-def test_alter_table_rename_table(local_setup, ddl_implementation, master_node, replica1_node, replication_wait_time):
+def test_alter_table_rename_table(local_setup, ddl_implementation, master_node, replica1_node, wait_for_replication):
     """
     1) Create a table (`test_alter_table_rename_table`).
     2) Execute `ALTER TABLE RENAME TO test_alter_table_rename_table_new` on the master.
@@ -24,7 +23,7 @@ def test_alter_table_rename_table(local_setup, ddl_implementation, master_node,
         table_name=old_table_name
     )
 
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     if not ddl_implementation.table_exists(replica_name, schema_name, old_table_name):
         ddl_implementation.create_table(
@@ -40,7 +39,7 @@ def test_alter_table_rename_table(local_setup, ddl_implementation, master_node,
         new_table_name=new_table_name
     )
 
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     exists_old = ddl_implementation.table_exists(replica_name, schema_name, old_table_name)
     exists_new = ddl_implementation.table_exists(replica_name, schema_name, new_table_name)
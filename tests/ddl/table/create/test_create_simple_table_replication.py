@@ -1,12 +1,11 @@
 # tests/ddl/table/create/test_create_simple_table.py
 
 import pytest
-import time
 
 from utils.execute import execute_sql
 
 @pytest.mark.ddl
-def test_create_simple_table(local_setup, ddl_implementation, master_node, replica1_node, replication_wait_time):
+def test_create_simple_table(local_setup, ddl_implementation, master_node, replica1_node, wait_for_replication):
     """
     The test checks the replication of CREATE TABLE (if supported)
     and verifies that the table is actually "live": performing INSERT on the master,
@@ -23,7 +22,7 @@ def test_create_simple_table(local_setup, ddl_implementation, master_node, repli
         table_name=table_name
     )
 
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     if not ddl_implementation.table_exists(replica_name, schema_name, table_name):
         pytest.fail("CREATE TABLE was not replicated. The extension/logic may not support this operation.")
@@ -35,7 +34,7 @@ def test_create_simple_table(local_setup, ddl_implementation, master_node, repli
         data={"id": 1, "data": "Hello from master"}
         )
 
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     rows = ddl_implementation.select_all(replica_name, schema_name, table_name)
     assert len(rows) == 1, f"Expected 1 row, got {len(rows)}"
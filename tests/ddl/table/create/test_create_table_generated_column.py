@@ -1,10 +1,9 @@
 # tests/ddl/table/create/test_create_table_generated_column.py
 
 import pytest
-import time
 
 @pytest.mark.ddl
-def test_create_table_with_generated_column_and_data(local_setup, ddl_implementation, master_node, replica1_node, replication_wait_time):
+def test_create_table_with_generated_column_and_data(local_setup, ddl_implementation, master_node, replica1_node, wait_for_replication):
     """
     1) Create a table with a generated column (`gen_val` computed as `base_val * 2`).
     2) Verify that the table is replicated to the replica.
@@ -25,13 +24,13 @@ def test_create_table_with_generated_column_and_data(local_setup, ddl_implementa
     );
     """
     ddl_implementation._execute(master_name, create_table_sql)
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     assert ddl_implementation.table_exists(replica_name, schema_name, table_name)
 
     row_data = {"base_val": 10}
     ddl_implementation.insert_into_table(master_name, schema_name, table_name, row_data)
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     rows = ddl_implementation.select_all(replica_name, schema_name, table_name)
     assert len(rows) == 1
@@ -1,10 +1,9 @@
 # tests/ddl/table/create/test_create_table_inheritance.py
 
 import pytest
-import time
 
 @pytest.mark.ddl
-def test_create_table_with_inheritance_and_data(local_setup, ddl_implementation, master_node, replica1_node, replication_wait_time):
+def test_create_table_with_inheritance_and_data(local_setup, ddl_implementation, master_node, replica1_node, wait_for_replication):
     """
     1) Create `parent_table` on the master,
     2) Create `child_table` inheriting from `parent_table`,
@@ -26,7 +25,7 @@ def test_create_table_with_inheritance_and_data(local_setup, ddl_implementation,
         table_name=parent_table,
         columns_def={"id": "SERIAL PRIMARY KEY", "parent_col": "TEXT"}
     )
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
     assert ddl_implementation.table_exists(replica_name, schema_name, parent_table)
 
     create_child_sql = f"""
@@ -36,13 +35,13 @@ def test_create_table_with_inheritance_and_data(local_setup, ddl_implementation,
         INHERITS ({schema_name}.{parent_table});
     """
     ddl_implementation._execute(master_name, create_child_sql)
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     assert ddl_implementation.table_exists(replica_name, schema_name, child_table)
 
     row_data = {"id": 1, "parent_col": "some parent data", "child_col": 42}
     ddl_implementation.insert_into_table(master_name, schema_name, child_table, row_data)
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     rows_replica = ddl_implementation.select_all(replica_name, schema_name, child_table)
     assert len(rows_replica) == 1, "Row not found in inherited child_table on replica"
@@ -1,10 +1,9 @@
 # tests/ddl/table/create/test_create_table_like.py
 
 import pytest
-import time
 
 @pytest.mark.ddl
-def test_create_table_with_like_clause_and_data(local_setup, ddl_implementation, master_node, replica1_node, replication_wait_time):
+def test_create_table_with_like_clause_and_data(local_setup, ddl_implementation, master_node, replica1_node, wait_for_replication):
     """
     1) Create an original table (`test_like_original`) with columns (`id INT, txt TEXT`).
     2) Verify that the table is replicated to the replica.
@@ -27,19 +26,19 @@ def test_create_table_with_like_clause_and_data(local_setup, ddl_implementation,
         table_name=original_table,
         columns_def={"id": "INT", "txt": "TEXT"}
     )
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
     assert ddl_implementation.table_exists(replica_name, schema_name, original_table)
 
     like_sql = f"CREATE TABLE {schema_name}.{like_table} (LIKE {schema_name}.{original_table} INCLUDING ALL);"
     ddl_implementation._execute(master_name, like_sql)
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     assert ddl_implementation.table_exists(replica_name, schema_name, like_table)
 
     # Вставка
     row_data = {"id": 777, "txt": "like cloned row"}
     ddl_implementation.insert_into_table(master_name, schema_name, like_table, row_data)
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     rows_replica = ddl_implementation.select_all(replica_name, schema_name, like_table)
     assert len(rows_replica) == 1
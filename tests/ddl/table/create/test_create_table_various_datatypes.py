@@ -1,10 +1,9 @@
 # File: tests/ddl/table/create/test_create_table_various_datatypes.py
 
 import pytest
-import time
 
 @pytest.mark.ddl
-def test_create_table_with_various_datatypes_and_data(local_setup, ddl_implementation, master_node, replica1_node, replication_wait_time):
+def test_create_table_with_various_datatypes_and_data(local_setup, ddl_implementation, master_node, replica1_node, wait_for_replication):
     """
     1) Create a table with columns of various data types:
        - INTEGER, BIGINT, VARCHAR(50), BOOLEAN, TIMESTAMP, NUMERIC(10,2).
@@ -34,7 +33,7 @@ def test_create_table_with_various_datatypes_and_data(local_setup, ddl_implement
         table_name=table_name,
         columns_def=columns_def
     )
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     assert ddl_implementation.table_exists(replica_name, schema_name, table_name)
 
@@ -48,7 +47,7 @@ def test_create_table_with_various_datatypes_and_data(local_setup, ddl_implement
     }
     ddl_implementation.insert_into_table(master_name, schema_name, table_name, row_to_insert)
 
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     rows_replica = ddl_implementation.select_all(replica_name, schema_name, table_name)
     assert len(rows_replica) == 1
@@ -1,11 +1,10 @@
 # tests/ddl/table/create/test_create_table_with_constraints.py
 
 import pytest
-import time
 import psycopg2
 
 @pytest.mark.ddl
-def test_create_table_with_constraints_and_data(local_setup, ddl_implementation, master_node, replica1_node, replication_wait_time):
+def test_create_table_with_constraints_and_data(local_setup, ddl_implementation, master_node, replica1_node, wait_for_replication):
     """
     1) Create a table with constraints:
        - `id SERIAL PRIMARY KEY`
@@ -29,13 +28,13 @@ def test_create_table_with_constraints_and_data(local_setup, ddl_implementation,
     );
     """
     ddl_implementation._execute(master_name, create_table_sql)
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     assert ddl_implementation.table_exists(replica_name, schema_name, table_name)
 
     valid_data = {"val": 10}
     ddl_implementation.insert_into_table(master_name, schema_name, table_name, valid_data)
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     rows_replica = ddl_implementation.select_all(replica_name, schema_name, table_name)
     assert len(rows_replica) == 1
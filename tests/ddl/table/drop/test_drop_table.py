@@ -1,10 +1,9 @@
 # tests/ddl/table/create/test_drop_table.py
 
 import pytest
-import time
 
 @pytest.mark.ddl
-def test_drop_table(local_setup, ddl_implementation, master_node, replica1_node):
+def test_drop_table(local_setup, ddl_implementation, master_node, replica1_node, wait_for_replication):
 
     master_name = master_node.name
     replica_name = replica1_node.name
@@ -16,13 +15,13 @@ def test_drop_table(local_setup, ddl_implementation, master_node, replica1_node)
         schema_name=schema_name,
         table_name=table_name)
 
-    time.sleep(1)
+    wait_for_replication(master_name, replica_name)
 
     assert ddl_implementation.table_exists(replica_name, schema_name, table_name), \
         "Table was not replicated to the replica."
 
     ddl_implementation.drop_table(master_name, schema_name, table_name)
-    time.sleep(1)
+    wait_for_replication(master_name, replica_name)
 
     assert not ddl_implementation.table_exists(replica_name, schema_name, table_name), \
         "Table was not dropped on the replica."
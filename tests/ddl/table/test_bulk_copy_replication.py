@@ -0,0 +1,46 @@
+# tests/ddl/table/test_bulk_copy_replication.py
+
+import pytest
+
+@pytest.mark.ddl
+def test_bulk_copy_replication(local_setup, ddl_implementation, master_node, replica1_node, wait_for_replication):
+    """
+    1) Create a table with text, array, JSONB and boolean columns on the master.
+    2) Bulk-load rows with insert_rows (COPY), including NULLs, NULL array elements,
+       empty arrays, JSON arrays/objects and text with tabs, newlines and backslashes.
+    3) Verify that the rows read back on the master are exactly the loaded values.
+    4) Verify that the replica received the same rows.
+    """
+    master_name = master_node.name
+    replica_name = replica1_node.name
+    schema_name = master_node.replication_schema
+    table_name = "test_bulk_copy"
+
+    columns_def = {
+        "id": "INTEGER PRIMARY KEY",
+        "label": "TEXT",
+        "tags": "TEXT[]",
+        "scores": "INTEGER[]",
+        "payload": "JSONB",
+        "flag": "BOOLEAN"
+    }
+    ddl_implementation.create_table(master_name, schema_name, table_name, columns_def)
+    wait_for_replication(master_name, replica_name)
+    assert ddl_implementation.table_exists(replica_name, schema_name, table_name)
+
+    rows = [
+        {"id": 1, "label": "plain", "tags": ["a", "b"], "scores": [1, 2], "payload": {"k": "v", "n": 1}, "flag": True},
+        {"id": 2, "label": "tab\there\nnew line \\ backslash", "tags": ["with space", 'quo"te', None], "scores": [],
+         "payload": [1, "two", None], "flag": False},
+        {"id": 3, "label": None, "tags": None, "scores": None, "payload": None, "flag": None},
+    ]
+    loaded = ddl_implementation.insert_rows(master_name, schema_name, table_name, rows, columns_def=columns_def)
+    assert loaded == len(rows)
+
+    rows_master = sorted(ddl_implementation.select_all(master_name, schema_name, table_name), key=lambda r: r["id"])
+    assert rows_master == rows, f"Rows loaded with COPY differ from the input: {rows_master}"
+
+    wait_for_replication(master_name, replica_name)
+
+    rows_replica = sorted(ddl_implementation.select_all(replica_name, schema_name, table_name), key=lambda r: r["id"])
+    assert rows_replica == rows, f"Bulk-loaded rows differ on replica: {rows_replica}"
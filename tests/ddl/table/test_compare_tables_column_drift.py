@@ -0,0 +1,43 @@
+# tests/ddl/table/test_compare_tables_column_drift.py
+
+import pytest
+
+@pytest.mark.ddl
+def test_compare_tables_column_drift(local_setup, ddl_implementation, master_node, replica1_node, wait_for_replication):
+    """
+    1) Create a table with a column whose name contains '%' on the master and insert rows.
+    2) Verify that compare_tables finds the replicated table consistent.
+    3) Add a column on the replica only (not replicated back to the master).
+    4) Verify that compare_tables reports the extra column as a diff instead of failing,
+       and that the data of the shared columns still matches.
+    """
+    master_name = master_node.name
+    replica_name = replica1_node.name
+    schema_name = master_node.replication_schema
+    table_name = "test_compare_column_drift"
+
+    ddl_implementation._execute(master_name, f"""
+    CREATE TABLE {schema_name}.{table_name} (
+        id      INT PRIMARY KEY,
+        "pct%"  INT,
+        data    TEXT
+    );
+    """)
+    wait_for_replication(master_name, replica_name)
+    assert ddl_implementation.table_exists(replica_name, schema_name, table_name)
+
+    for i in range(1, 4):
+        ddl_implementation.insert_into_table(master_name, schema_name, table_name, {"id": i, '"pct%"': i * 10, "data": f"row {i}"})
+    wait_for_replication(master_name, replica_name)
+
+    result = ddl_implementation.compare_tables([master_name, replica_name], schema_name, table_name)
+    assert result["consistent"], f"Replica data differs from master: {result['diffs']}"
+
+    ddl_implementation._execute(replica_name, f"ALTER TABLE {schema_name}.{table_name} ADD COLUMN replica_only TEXT;")
+
+    result = ddl_implementation.compare_tables([master_name, replica_name], schema_name, table_name)
+    diff = result["diffs"][replica_name]
+    assert not result["consistent"]
+    assert diff["extra_columns"] == ["replica_only"]
+    assert diff["missing_columns"] == []
+    assert diff["missing"] == diff["extra"] == diff["changed"] == [], f"Shared columns differ: {diff}"
@@ -0,0 +1,37 @@
+# tests/ddl/table/test_execute_batch.py
+
+import psycopg2
+import pytest
+
+@pytest.mark.ddl
+def test_execute_batch(local_setup, ddl_implementation, master_node):
+    """
+    1) Run a transactional batch (CREATE TABLE, INSERT, a statement sleeping 50 ms) on the master.
+    2) Verify that one duration is returned per statement and that the sleep is measured
+       on the statement that slept.
+    3) Run a batch whose last statement fails; verify that the error is raised and that
+       the statements before it were rolled back with it.
+    """
+    master_name = master_node.name
+    schema_name = master_node.replication_schema
+    table_name = "test_execute_batch"
+
+    durations = ddl_implementation.execute_batch(master_name, [
+        f"CREATE TABLE {schema_name}.{table_name} (id INT PRIMARY KEY, data TEXT)",
+        f"INSERT INTO {schema_name}.{table_name} VALUES (1, 'first') -- trailing comment",
+        "SELECT pg_sleep(0.05);",
+    ])
+    assert len(durations) == 3
+    assert all(duration >= 0 for duration in durations)
+    assert durations[2] >= 0.05, f"Sleep not attributed to its statement: {durations}"
+    assert durations[2] > durations[1]
+    assert ddl_implementation.table_exists(master_name, schema_name, table_name)
+
+    with pytest.raises(psycopg2.DatabaseError):
+        ddl_implementation.execute_batch(master_name, [
+            f"INSERT INTO {schema_name}.{table_name} VALUES (2, 'second')",
+            f"INSERT INTO {schema_name}.{table_name} VALUES (1, 'duplicate')",
+        ])
+
+    rows = ddl_implementation.select_all(master_name, schema_name, table_name)
+    assert rows == [{"id": 1, "data": "first"}], f"Failed batch was not rolled back: {rows}"
@@ -0,0 +1,44 @@
+# tests/ddl/table/test_metadata_cache_refresh.py
+
+import pytest
+
+@pytest.mark.ddl
+def test_metadata_cache_refresh(local_setup, ddl_implementation, master_node, replica1_node, wait_for_replication):
+    """
+    1) Create a table with a default and a generated column on the master and read its
+       columns on the replica (the replica's schema is now cached).
+    2) Verify that the generated column has no default (like information_schema reports it).
+    3) Add a column on the master; the cached master lookup sees it (DDL invalidates the node).
+    4) After replication, a fresh=True bulk lookup on the replica sees the replicated column
+       and reports a missing table as None.
+    """
+    master_name = master_node.name
+    replica_name = replica1_node.name
+    schema_name = master_node.replication_schema
+    table_name = "test_metadata_cache_refresh"
+
+    ddl_implementation._execute(master_name, f"""
+    CREATE TABLE {schema_name}.{table_name} (
+        id       INT PRIMARY KEY,
+        base_val INT DEFAULT 1,
+        gen_val  INT GENERATED ALWAYS AS (base_val * 2) STORED
+    );
+    """)
+    wait_for_replication(master_name, replica_name)
+
+    columns = {col["column_name"]: col for col in ddl_implementation.get_table_columns(replica_name, schema_name, table_name)}
+    assert list(columns) == ["id", "base_val", "gen_val"]
+    assert columns["base_val"]["default"] == "1"
+    assert columns["gen_val"]["default"] is None, f"Generated column reported with a default: {columns['gen_val']}"
+    assert columns["id"]["data_type"] == "integer"
+
+    ddl_implementation.add_column(master_name, schema_name, table_name, "note", "TEXT")
+    master_columns = [col["column_name"] for col in ddl_implementation.get_table_columns(master_name, schema_name, table_name)]
+    assert "note" in master_columns, "Cached master metadata was not invalidated by ALTER TABLE"
+
+    wait_for_replication(master_name, replica_name)
+
+    found = ddl_implementation.get_tables_columns(replica_name, schema_name, [table_name, "no_such_table"], fresh=True)
+    assert found["no_such_table"] is None
+    replica_columns = {col["column_name"]: col["data_type"] for col in found[table_name]}
+    assert replica_columns.get("note") == "text", f"Replicated column not seen with fresh=True: {replica_columns}"
@@ -1,10 +1,9 @@
 # tests/ddl/table/test_multi_ddl_sequence.py
 
 import pytest
-import time
 
 @pytest.mark.ddl
-def test_multiple_ddl_operations_in_sequence(local_setup, ddl_implementation, master_node, replica1_node, replication_wait_time):
+def test_multiple_ddl_operations_in_sequence(local_setup, ddl_implementation, master_node, replica1_node, wait_for_replication):
 
     """ We check that consecutive DDL operations on the same table are correctly replicated:
 
@@ -31,7 +30,7 @@ def test_multiple_ddl_operations_in_sequence(local_setup, ddl_implementation, ma
         master_name, schema_name, old_table_name,
         columns_def={"id": "SERIAL PRIMARY KEY", col2_old: "INT"}
     )
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
     assert ddl_implementation.table_exists(replica_name, schema_name, old_table_name), "Table not replicated."
 
 
@@ -43,7 +42,7 @@ def test_multiple_ddl_operations_in_sequence(local_setup, ddl_implementation, ma
         column_type="TEXT",
         default_value=None
     )
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
 
     columns = ddl_implementation.get_table_columns(replica_name, schema_name, old_table_name)
     col_names = [c["column_name"] for c in columns]
@@ -51,23 +50,23 @@ def test_multiple_ddl_operations_in_sequence(local_setup, ddl_implementation, ma
 
 
     ddl_implementation.rename_column(master_name, schema_name, old_table_name, col2_old, col2_new)
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
     columns = ddl_implementation.get_table_columns(replica_name, schema_name, old_table_name)
     col_names = [c["column_name"] for c in columns]
     assert col2_new in col_names and col2_old not in col_names, "Column rename not replicated properly."
 
 
     ddl_implementation.drop_column(master_name, schema_name, old_table_name, col1)
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
     columns = ddl_implementation.get_table_columns(replica_name, schema_name, old_table_name)
     col_names = [c["column_name"] for c in columns]
     assert col1 not in col_names, "Dropped column is still on replica."
 
     ddl_implementation.rename_table(master_name, schema_name, old_table_name, new_table_name)
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
     assert not ddl_implementation.table_exists(replica_name, schema_name, old_table_name), "Old table name still on replica."
     assert ddl_implementation.table_exists(replica_name, schema_name, new_table_name), "Renamed table not found on replica."
 
     ddl_implementation.drop_table(master_name, schema_name, new_table_name)
-    time.sleep(replication_wait_time)
+    wait_for_replication(master_name, replica_name)
     assert not ddl_implementation.table_exists(replica_name, schema_name, new_table_name), "Table not dropped on replica."
@@ -2,23 +2,30 @@
 
 import pytest
 
-@pytest.fixture(scope="session")
-def master_node(config):
+
+def _with_test_schema(node, test_schema):
+    return node.model_copy(update={"replication_schema": test_schema}) if test_schema else node
+
+@pytest.fixture
+def master_node(config, test_schema):
     """
-    Returns the 'master' cluster object from config.
+    Returns the 'master' cluster object from config
+    (with replication_schema set to the test's schema in schema-per-test mode).
     """
-    return next(n for n in config.nodes if n.name == "master")
+    return _with_test_schema(next(n for n in config.nodes if n.name == "master"), test_schema)
 
-@pytest.fixture(scope="session")
-def replica1_node(config):
+@pytest.fixture
+def replica1_node(config, test_schema):
     """
-    Returns the 'replica1' cluster object from config.
+    Returns the 'replica1' cluster object from config
+    (with replication_schema set to the test's schema in schema-per-test mode).
     """
-    return next(n for n in config.nodes if n.name == "replica1")
+    return _with_test_schema(next(n for n in config.nodes if n.name == "replica1"), test_schema)
 
-@pytest.fixture(scope="session")
-def replica2_node(config):
+@pytest.fixture
+def replica2_node(config, test_schema):
     """
-    Returns the 'replica2' cluster object from config.
+    Returns the 'replica2' cluster object from config
+    (with replication_schema set to the test's schema in schema-per-test mode).
     """
-    return next(n for n in config.nodes if n.name == "replica2")
+    return _with_test_schema(next(n for n in config.nodes if n.name == "replica2"), test_schema)
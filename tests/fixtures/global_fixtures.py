@@ -3,17 +3,26 @@
 import pytest
 import logging
 
+from commands.clean_replication import clean_replication
 from utils.log_handler import logger
 
 @pytest.fixture(scope="session", autouse=True)
-def global_setup(request, ddl_implementation):
+def global_setup(request, ddl_implementation, setup_snapshots, schema_per_test):
     """
     Session-scoped fixture that runs once.
     Then yields, and at the end does optional teardown (stop clusters).
+    With setup snapshots or schema-per-test the replication is still in place after the last test,
+    so it is cleaned up here.
     """
     logger.debug("[global_setup]")
+    if setup_snapshots:
+        # Snapshots of an earlier session may predate code or config changes.
+        ddl_implementation.drop_snapshots()
 
     yield
 
     logger.debug("[global_setup] Teardown")
+    if setup_snapshots or schema_per_test:
+        clean_replication()
+    ddl_implementation.pool.close_all()
 
@@ -1,16 +1,43 @@
 # tests/fixtures/local_fixtures.py
 
+import itertools
+import re
+
 import pytest
 from commands.clean_replication import clean_replication
 from commands.replication import setup_replication
+from utils.lag_sampler import LagSampler
 from utils.log_handler import logger
 
+# Replication variant (ddl, cascade) currently set up for schema-per-test mode.
+_session_topology = {"variant": None}
+_schema_ids = itertools.count(1)
+
+
 @pytest.fixture(scope="function")
-def local_setup(request, ddl_implementation):
+def test_schema(request, schema_per_test):
+    """
+    Unique schema name of the test in schema-per-test mode, None otherwise.
+    """
+    if not schema_per_test:
+        return None
+    name = re.sub(r"[^a-z0-9_]", "_", request.node.name.lower())[:40]
+    return f"t_{name}_{next(_schema_ids)}"
 
-    logger.debug("[local_setup] PREPARE replication before test.")
-    clean_replication()
 
+@pytest.fixture(scope="function")
+def local_setup(request, ddl_implementation, setup_snapshots, test_schema, replication_timeout):
+    """
+    Sets up replication (DDL/cascade according to the test's markers) before the test.
+
+    In schema-per-test mode the replication is set up once per variant and session; the test
+    gets its own schema added to the running topology, and only that schema is dropped afterwards.
+
+    With the setup_snapshots ini option the first test of every setup variant creates
+    the replication normally and snapshots the data dirs; later tests restore that snapshot
+    instead of cleaning up and re-creating publications/subscriptions. The next restore
+    discards whatever the test left behind, so there is no cleanup after the test.
+    """
     ddl = False
     cascade = False
 
@@ -19,10 +46,58 @@ def local_setup(request, ddl_implementation):
     if request.node.get_closest_marker("cascade"):
         cascade = True
 
+    if test_schema:
+        if _session_topology["variant"] != (ddl, cascade):
+            logger.debug(f"[local_setup] Setting up session replication with DDL={ddl}, CASCADE={cascade}.")
+            clean_replication()
+            setup_replication(ddl=ddl, cascade=cascade)
+            _session_topology["variant"] = (ddl, cascade)
+
+        chain = ddl_implementation.config.get_topology_chain(cascade)
+        ddl_implementation.add_replicated_schema(test_schema, chain)
+        yield
+
+        logger.debug(f"[local_setup] Dropping test schema '{test_schema}'.")
+        ddl_implementation.drop_replicated_schema(test_schema, chain, replication_timeout)
+        return
+
+    snapshot_name = f"setup_{ddl_implementation.config.ddl_implementation}_ddl{int(ddl)}_cascade{int(cascade)}"
+    if setup_snapshots and ddl_implementation.has_snapshot(snapshot_name):
+        logger.debug(f"[local_setup] Restoring snapshot '{snapshot_name}'.")
+        ddl_implementation.restore_snapshot(snapshot_name)
+        yield
+        return
+
+    logger.debug("[local_setup] PREPARE replication before test.")
+    clean_replication()
+
     logger.debug(f"[local_setup] Setting up replication with DDL={ddl}, CASCADE={cascade}.")
     setup_replication(ddl=ddl, cascade=cascade)
 
+    if setup_snapshots:
+        # Snapshot only after the initial table sync, so restored tests do not start mid-sync.
+        for level in ddl_implementation.config.get_topology_levels(cascade):
+            for edge in level:
+                ddl_implementation.wait_for_replication(edge.publisher, edge.subscriber, replication_timeout)
+        ddl_implementation.create_snapshot(snapshot_name)
+        yield
+        return
+
     yield
 
     logger.debug("[local_setup] Cleaning up replication after the test.")
     clean_replication()
+
+
+@pytest.fixture(scope="function", autouse=True)
+def lag_sampler(request, ddl_implementation, lag_sample_interval):
+    """
+    Samples replication lag in the background for the duration of each test
+    when the lag_sample_interval ini option is set (logs/<date>/lag_<test>_*.jsonl).
+    """
+    if not lag_sample_interval:
+        yield None
+        return
+
+    with LagSampler(ddl_implementation, interval=lag_sample_interval, name=f"lag_{request.node.name}") as sampler:
+        yield sampler
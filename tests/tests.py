@@ -1,21 +1,125 @@
 #tests/tests.py
+import json
+import os
 import subprocess
 import sys
+import time
 import click
 
 
-def run_tests(tags=None):
+def _marker_args(tags):
+    return ["-m", " or ".join(tags)] if tags else []
+
+
+def collect_tests(tags=None):
+    """
+    Returns the node ids of the tests pytest would run for the given markers
+    (relative to the rootdir tests/, as pytest reports them).
+    Exits with pytest's return code if the collection fails (e.g. on an import error).
+    """
+    collect_cmd = ["pytest", "tests", "--collect-only", "-q"] + _marker_args(tags)
+    result = subprocess.run(collect_cmd, check=False, capture_output=True, text=True)
+    # 5: no tests collected, which is reported by the caller.
+    if result.returncode not in (0, 5):
+        click.echo(result.stdout + result.stderr, err=True)
+        click.echo(f"[run_tests] Test collection failed with exit code {result.returncode}.", err=True)
+        sys.exit(result.returncode)
+    return [line.strip() for line in result.stdout.splitlines() if "::" in line]
+
+
+def provision_shards(shards):
+    """
+    Makes sure every shard's topology exists and runs: nodes without a data dir
+    are initialized (init_cluster), then the cluster is started. Shards are provisioned concurrently.
+    """
+    from factories.ddl_factory import get_ddl_implementation
+    from models.config import load_config
+    from utils.parallel import NodeOperationError, run_concurrently
+
+    base_config = load_config()
+
+    def provision(shard):
+        config = base_config.for_shard(int(shard))
+        ddl = get_ddl_implementation(db_type="postgresql", config=config)
+        if not all(os.path.exists(config.get_data_dir(node.name)) for node in config.nodes):
+            click.echo(f"[run_tests] Initializing shard {shard} (ports {', '.join(str(n.port) for n in config.nodes)})...")
+            ddl.init_cluster()
+        ddl.start_cluster()
+
+    _, errors = run_concurrently(provision, [str(shard) for shard in shards])
+    if errors:
+        raise NodeOperationError("Provision shard", errors)
+
+
+def run_tests_parallel(tags=None, workers=2, order="failed"):
+    """
+    Runs the tests in `workers` pytest processes, each bound to its own topology
+    (shard) through the PG_TEST_SHARD environment variable. Tests are balanced over the
+    workers by their recorded durations; within a worker they run in the given test_order
+    (recently failed first by default). Returns the worst exit code.
+    """
+    from utils.log_handler import get_logs_dir
+    from utils.test_history import balance_tests, load_history
+
+    test_ids = collect_tests(tags)
+    if not test_ids:
+        click.echo("[run_tests] No tests collected.")
+        return 5
+    workers = min(workers, len(test_ids))
+    provision_shards(range(workers))
+
+    started = time.time()
+    processes = []
+    for shard, shard_tests in enumerate(balance_tests(test_ids, load_history(), workers)):
+        log_path = os.path.join(get_logs_dir(), f"pytest_shard{shard}.log")
+        env = dict(os.environ, PG_TEST_SHARD=str(shard))
+        pytest_cmd = ["pytest", "-v", "-p", "no:cacheprovider", "-o", f"test_order={order}"] + _marker_args(tags) + [os.path.join("tests", test_id) for test_id in shard_tests]
+        click.echo(f"[run_tests] Shard {shard}: {len(shard_tests)} test(s), output in {log_path}")
+        log_file = open(log_path, "w")
+        processes.append((shard, subprocess.Popen(pytest_cmd, env=env, stdout=log_file, stderr=subprocess.STDOUT), log_file))
+
+    returncode = 0
+    totals = {"total": 0, "passed": 0, "failed": 0, "skipped": 0}
+    for shard, process, log_file in processes:
+        code = process.wait()
+        log_file.close()
+        click.echo(f"[run_tests] Shard {shard} finished with exit code {code}.")
+        returncode = max(returncode, code)
+        metrics_path = f"pytest_metrics_shard{shard}.json"
+        if os.path.exists(metrics_path):
+            with open(metrics_path) as f:
+                metrics = json.load(f)
+            for key in totals:
+                totals[key] += metrics.get(key, 0)
+
+    totals["time_seconds"] = time.time() - started
+    totals["workers"] = workers
+    with open("pytest_metrics.json", "w") as f:
+        json.dump(totals, f, indent=2)
+    click.echo(f"[run_tests] {totals['passed']} passed, {totals['failed']} failed, {totals['skipped']} skipped "
+               f"in {totals['time_seconds']:.1f} s on {workers} worker(s).")
+    return returncode
+
+
+def run_tests(tags=None, workers=1, order=None):
     """
     Internal function that runs pytest with the given implementation and optional markers.
+    With workers > 1 the tests are spread over independent port-sharded topologies.
+
+    :param order: test_order for this run (collection, duration, failed); the ini default
+                  if not given, 'failed' for parallel runs.
     """
+    if workers > 1:
+        sys.exit(run_tests_parallel(tags=tags, workers=workers, order=order or "failed"))
+
     pytest_cmd = [
         "pytest",
         "tests",
         "-v"
     ]
-    if tags:
-        marker_expr = " or ".join(tags)
-        pytest_cmd.extend(["-m", marker_expr])
+    if order:
+        pytest_cmd.extend(["-o", f"test_order={order}"])
+    pytest_cmd.extend(_marker_args(tags))
 
     click.echo(f"[run_tests] Running: {' '.join(pytest_cmd)}")
     result = subprocess.run(pytest_cmd, check=False)
@@ -23,8 +127,11 @@ def run_tests(tags=None):
 
 @click.command(name="tests")
 @click.option("--tags", "-t", multiple=True, help="Markers (tags) to run (e.g. ddl, cascade_ddl)")
-def tests_cmd(tags):
+@click.option("--workers", "-j", default=1, show_default=True, help="Parallel pytest workers, each on its own topology")
+@click.option("--order", type=click.Choice(["collection", "duration", "failed"]), default=None,
+              help="Test order from recorded durations (default: collection, failed with --workers)")
+def tests_cmd(tags, workers, order):
     """
     CLI command that runs pytest-based tests with the chosen DDL implementation.
     """
-    run_tests(tags=tags)
\ No newline at end of file
+    run_tests(tags=tags, workers=workers, order=order)
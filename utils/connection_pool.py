@@ -0,0 +1,144 @@
+# utils/connection_pool.py
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Tuple
+
+import psycopg2
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+from utils.log_handler import logger
+
+
+class ConnectionPool:
+    """
+    Keeps idle psycopg2 connections per node, so that consecutive statements
+    on the same node reuse one backend instead of connecting every time.
+
+    :param node_conn: Mapping node name -> psycopg2 connection parameters.
+    :param max_idle: Maximum number of idle connections kept per node.
+    :param health_check_interval: Idle connections older than this (seconds) are pinged before reuse.
+    """
+
+    LOG_TAG = "[ConnectionPool]"
+
+    def __init__(self, node_conn: Dict[str, Dict[str, Any]], max_idle: int = 4, health_check_interval: float = 30.0):
+        self.node_conn = node_conn
+        self.max_idle = max_idle
+        self.health_check_interval = health_check_interval
+        self._idle: Dict[str, List[Tuple[Any, float]]] = {}
+        # Bumped by close_node; connections checked out under an older generation
+        # (e.g. held across a server restart) are closed instead of returned to the pool.
+        self._generation: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self, node_name: str, autocommit: bool = False):
+        """
+        Checks out a connection to the node for exclusive use.
+
+        The connection is handed out outside of any transaction with the requested
+        autocommit mode. On exit it is returned to the pool (rolled back if a
+        transaction is still open); broken connections are closed instead.
+
+        :param node_name: Name of the node from config.
+        :param autocommit: Autocommit mode of the checked out connection.
+        """
+        with self._lock:
+            generation = self._generation.setdefault(node_name, 0)
+        conn = self._checkout(node_name)
+        conn.autocommit = autocommit
+        try:
+            yield conn
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            self._discard(node_name, conn)
+            raise
+        except BaseException:
+            self._release(node_name, conn, generation)
+            raise
+        else:
+            self._release(node_name, conn, generation)
+
+    def close_node(self, node_name: str) -> None:
+        """
+        Closes all idle connections of the node (e.g. before the server is stopped or restarted).
+        Connections checked out right now are closed when they are returned.
+        """
+        with self._lock:
+            self._generation[node_name] = self._generation.get(node_name, 0) + 1
+            idle = self._idle.pop(node_name, [])
+        for conn, _ in idle:
+            self._close(conn)
+        if idle:
+            logger.debug(f"{self.LOG_TAG} Closed {len(idle)} idle connection(s) to '{node_name}'.")
+
+    def close_all(self) -> None:
+        """Closes idle connections of every node; checked out ones are closed when returned."""
+        with self._lock:
+            node_names = set(self._idle) | set(self._generation)
+        for node_name in node_names:
+            self.close_node(node_name)
+
+    def _checkout(self, node_name: str):
+        while True:
+            with self._lock:
+                idle = self._idle.get(node_name)
+                entry = idle.pop() if idle else None
+            if entry is None:
+                return self._connect(node_name)
+
+            conn, released_at = entry
+            if conn.closed:
+                continue
+            if time.monotonic() - released_at > self.health_check_interval and not self._is_alive(conn):
+                logger.debug(f"{self.LOG_TAG} Dropping stale connection to '{node_name}'.")
+                self._close(conn)
+                continue
+            return conn
+
+    def _connect(self, node_name: str):
+        conn = psycopg2.connect(**self.node_conn[node_name])
+        logger.debug(f"{self.LOG_TAG} Opened new connection to '{node_name}'.")
+        return conn
+
+    def _is_alive(self, conn) -> bool:
+        try:
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1;")
+            return True
+        except psycopg2.Error:
+            return False
+
+    def _release(self, node_name: str, conn, generation: int) -> None:
+        if conn.closed:
+            return
+        with self._lock:
+            stale = generation != self._generation.get(node_name, 0)
+        if stale:
+            logger.debug(f"{self.LOG_TAG} Closing connection to '{node_name}' opened before the node was closed.")
+            self._close(conn)
+            return
+        try:
+            if conn.info.transaction_status != TRANSACTION_STATUS_IDLE:
+                conn.rollback()
+        except psycopg2.Error:
+            self._close(conn)
+            return
+
+        with self._lock:
+            idle = self._idle.setdefault(node_name, [])
+            if len(idle) < self.max_idle:
+                idle.append((conn, time.monotonic()))
+                return
+        self._close(conn)
+
+    def _discard(self, node_name: str, conn) -> None:
+        logger.debug(f"{self.LOG_TAG} Discarding broken connection to '{node_name}'.")
+        self._close(conn)
+
+    def _close(self, conn) -> None:
+        try:
+            conn.close()
+        except psycopg2.Error:
+            pass
@@ -5,36 +5,41 @@ import psycopg2
 import click
 import subprocess
 import sys
+from utils.connection_pool import ConnectionPool
 from utils.log_handler import logger
+from utils.postgres_helper import HelperError, discard_helper, get_helper
 
 def execute_sql(
     conn_params: Dict[str, Any],
     sql: str,
     server_name: str,
     autocommit: bool = False,
-    fetch: bool = False
+    fetch: bool = False,
+    pool: Optional[ConnectionPool] = None
 ) -> Optional[List[tuple]]:
     """
     Executes an SQL command on the specified PostgreSQL server.
 
     :param conn_params: Connection parameters for psycopg2.
     :param sql: The SQL query to execute.
-    :param server_name: Name of the server (for logging purposes).
+    :param server_name: Name of the server (for logging purposes, and the pool key).
     :param autocommit: If True, the transaction is committed automatically.
     :param fetch: If True, fetches and returns the query results.
+    :param pool: If given, a connection is checked out from the pool instead of opening a new one.
     :return: List of tuples containing the results if fetch is True, otherwise None.
     :raises: psycopg2.DatabaseError if a database error occurs.
     """
     try:
+        if pool is not None:
+            with pool.connection(server_name, autocommit=autocommit) as conn:
+                return _run_sql(conn, sql, autocommit, fetch)
+
         conn = psycopg2.connect(**conn_params)
-        conn.autocommit = autocommit
-        with conn.cursor() as cur:
-            cur.execute(sql)
-            results = cur.fetchall() if fetch else None
-        if not autocommit:
-            conn.commit()
-        conn.close()
-        return results
+        try:
+            conn.autocommit = autocommit
+            return _run_sql(conn, sql, autocommit, fetch)
+        finally:
+            conn.close()
     except psycopg2.DatabaseError as e:
         logger.error(f"Error executing SQL on server '{server_name}': {e}")
         raise
@@ -42,10 +47,21 @@ def execute_sql(
         logger.error(f"Unexpected error executing SQL on server '{server_name}': {e}")
         raise
 
+def _run_sql(conn, sql: str, autocommit: bool, fetch: bool) -> Optional[List[tuple]]:
+    with conn.cursor() as cur:
+        cur.execute(sql)
+        results = cur.fetchall() if fetch else None
+    if not autocommit:
+        conn.commit()
+    return results
+
 def run_as_postgres(command: List[str], suppress_output: bool = True) -> None:
     """
     Executes a shell command as the 'postgres' user.
 
+    Commands go through the shared long-lived helper process (utils/postgres_helper.py);
+    if it is not available, every command is run with its own sudo.
+
     :param command: List of command arguments to execute.
     :param suppress_output: If True, suppresses the command's stdout and stderr.
     :raises: subprocess.CalledProcessError if the command fails.
@@ -53,6 +69,17 @@ def run_as_postgres(command: List[str], suppress_output: bool = True) -> None:
     try:
         cmd = ["sudo", "-u", "postgres"] + command
         log_cmd = " ".join(cmd)
+        helper = get_helper()
+        if helper is not None:
+            try:
+                returncode = helper.run(command, suppress_output=suppress_output)
+            except HelperError as e:
+                logger.debug(f"Postgres helper failed ({e}), falling back to sudo.")
+                discard_helper()
+            else:
+                if returncode != 0:
+                    raise subprocess.CalledProcessError(returncode, cmd)
+                return
         if suppress_output:
             subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         else:
@@ -0,0 +1,46 @@
+# utils/fs.py
+
+import hashlib
+import os
+import shutil
+import subprocess
+from typing import Iterable
+
+from utils.log_handler import logger
+
+
+def clone_tree(src: str, dst: str) -> None:
+    """
+    Copies a directory tree preserving ownership and modes (cp -a). On filesystems with
+    copy-on-write support (btrfs, xfs with reflink, ...) file data is shared instead of copied.
+
+    :param dst: Target directory; must not exist yet.
+    :raises subprocess.CalledProcessError: if the copy failed.
+    """
+    logger.debug(f"Cloning '{src}' -> '{dst}'")
+    subprocess.run(["cp", "-a", "--reflink=auto", src, dst], check=True)
+
+
+def remove_tree(path: str) -> None:
+    """Removes a directory tree if it exists."""
+    if os.path.lexists(path):
+        shutil.rmtree(path)
+
+
+def hash_tree_metadata(paths: Iterable[str]) -> str:
+    """
+    Returns a hash of the names, sizes and modification times of all files below the given
+    directories. Changes whenever something there is rebuilt or reinstalled, without reading file contents.
+    """
+    digest = hashlib.sha256()
+    for root_path in paths:
+        for root, dirs, files in os.walk(root_path):
+            dirs.sort()
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                digest.update(f"{os.path.relpath(path, root_path)}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
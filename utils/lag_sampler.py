@@ -0,0 +1,108 @@
+# utils/lag_sampler.py
+
+import json
+import os
+import re
+import threading
+import time
+from typing import Optional
+
+from utils.log_handler import get_logs_dir, logger
+
+PUBLISHER_LAG_SQL = """
+SELECT application_name, state, sent_lsn::text, replay_lsn::text,
+       extract(epoch FROM write_lag), extract(epoch FROM flush_lag), extract(epoch FROM replay_lag),
+       pg_wal_lsn_diff(pg_current_wal_lsn(), replay_lsn)
+FROM pg_stat_replication;
+"""
+
+SUBSCRIBER_LAG_SQL = """
+SELECT subname, received_lsn::text, latest_end_lsn::text,
+       extract(epoch FROM (now() - last_msg_receipt_time))
+FROM pg_stat_subscription
+WHERE relid IS NULL;
+"""
+
+
+class LagSampler:
+    """
+    Background thread that polls pg_stat_replication (publisher side) and
+    pg_stat_subscription (subscriber side) on every node at a fixed interval and
+    appends one JSON line per sample to a file in the run's log directory.
+
+    Publisher lines: {"t", "node", "pub", "state", "sent", "replay", "write_lag", "flush_lag", "replay_lag", "lag_bytes"}
+    Subscriber lines: {"t", "node", "sub", "received", "latest_end", "idle"}
+    where "t" is seconds since start() and lags are in seconds.
+
+    :param ddl_implementation: BaseDDL instance used to reach the nodes.
+    :param interval: Seconds between samples.
+    :param name: Prefix of the output file name.
+    :param output_path: Explicit output file (overrides name).
+    """
+
+    LOG_TAG = "[LagSampler]"
+
+    def __init__(self, ddl_implementation, interval: float = 0.5, name: str = "lag", output_path: Optional[str] = None):
+        self.ddl = ddl_implementation
+        self.interval = interval
+        # Test ids may contain '/', '%' or brackets; keep the file name plain.
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", name)
+        self.output_path = output_path or os.path.join(get_logs_dir(), f"{safe_name}_{time.strftime('%H%M%S')}.jsonl")
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+        self._started = 0.0
+
+    def start(self) -> "LagSampler":
+        self._stop.clear()
+        self._started = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="lag-sampler", daemon=True)
+        self._thread.start()
+        logger.debug(f"{self.LOG_TAG} Sampling replication lag every {self.interval} s into '{self.output_path}'.")
+        return self
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        logger.debug(f"{self.LOG_TAG} Stopped after {self.samples} sample(s).")
+
+    def __enter__(self) -> "LagSampler":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        with open(self.output_path, "a") as out:
+            while not self._stop.is_set():
+                tick = time.monotonic()
+                for line in self._sample(round(tick - self._started, 3)):
+                    out.write(json.dumps(line, separators=(",", ":")) + "\n")
+                out.flush()
+                self.samples += 1
+                self._stop.wait(max(0.0, self.interval - (time.monotonic() - tick)))
+
+    def _sample(self, t: float):
+        for node in self.ddl.config.nodes:
+            try:
+                publishers = self.ddl.query(node.name, PUBLISHER_LAG_SQL)
+                subscribers = self.ddl.query(node.name, SUBSCRIBER_LAG_SQL)
+            except Exception as e:
+                logger.debug(f"{self.LOG_TAG} Skipping sample of '{node.name}': {e}")
+                continue
+
+            for app, state, sent, replay, write_lag, flush_lag, replay_lag, lag_bytes in publishers:
+                yield {
+                    "t": t, "node": node.name, "pub": app, "state": state, "sent": sent, "replay": replay,
+                    "write_lag": _num(write_lag), "flush_lag": _num(flush_lag), "replay_lag": _num(replay_lag),
+                    "lag_bytes": _num(lag_bytes),
+                }
+            for subname, received, latest_end, idle in subscribers:
+                yield {"t": t, "node": node.name, "sub": subname, "received": received, "latest_end": latest_end, "idle": _num(idle)}
+
+
+def _num(value) -> Optional[float]:
+    return None if value is None else float(value)
@@ -4,12 +4,17 @@ import os
 import logging
 import time
 
-def get_log_file():
-    """Получает путь к файлу логов и создает папку, если она не существует."""
+def get_logs_dir():
+    """Returns the log directory of the current run (logs/<date>), creating it if needed."""
     date_str = time.strftime("%Y_%m_%d")
 
     logs_dir = os.path.join(os.path.dirname(__file__), '..', 'logs', date_str)
     os.makedirs(logs_dir, exist_ok=True)
+    return logs_dir
+
+def get_log_file():
+    """Получает путь к файлу логов и создает папку, если она не существует."""
+    logs_dir = get_logs_dir()
 
     log_filename = time.strftime("log_%H%M%S.log")
     log_file_path = os.path.join(logs_dir, log_filename)
@@ -0,0 +1,63 @@
+# utils/metadata_cache.py
+
+import re
+import threading
+from typing import Callable, Dict, List, Optional
+
+from utils.log_handler import logger
+
+# Statements that may change the catalog (checked at the start of every line of a script).
+_CATALOG_CHANGING = re.compile(r"^\s*(CREATE|ALTER|DROP|TRUNCATE|COMMENT|IMPORT|SECURITY\s+LABEL)\b", re.IGNORECASE | re.MULTILINE)
+
+
+def may_change_catalog(sql: str) -> bool:
+    """True if the SQL contains a DDL statement (a cached node must then be invalidated)."""
+    return _CATALOG_CHANGING.search(sql) is not None
+
+
+class MetadataCache:
+    """
+    Per-node cache of table definitions, loaded one whole schema at a time.
+
+    A schema is read with a single loader call the first time any of its tables is looked up;
+    afterwards lookups (including "table does not exist") are answered from memory until the
+    node is invalidated. Callers must invalidate a node after anything that may change its
+    catalog: DDL sent to it, replication applied to it, a server restart. Changes that arrive
+    unobserved (replicated DDL while polling a subscriber) need fresh=True lookups.
+
+    :param loader: loader(node_name, schema_name) -> {table: [column dict, ...]} for every table of the schema.
+    """
+
+    LOG_TAG = "[MetadataCache]"
+
+    def __init__(self, loader: Callable[[str, str], Dict[str, List[Dict]]]):
+        self.loader = loader
+        self._schemas: Dict[str, Dict[str, Dict[str, List[Dict]]]] = {}
+        self._lock = threading.Lock()
+
+    def _schema(self, node_name: str, schema_name: str, fresh: bool = False) -> Dict[str, List[Dict]]:
+        with self._lock:
+            tables = None if fresh else self._schemas.get(node_name, {}).get(schema_name)
+        if tables is None:
+            tables = self.loader(node_name, schema_name)
+            with self._lock:
+                self._schemas.setdefault(node_name, {})[schema_name] = tables
+            logger.debug(f"{self.LOG_TAG} Loaded {len(tables)} table(s) of '{schema_name}' on '{node_name}'.")
+        return tables
+
+    def get(self, node_name: str, schema_name: str, table_name: str, fresh: bool = False) -> Optional[List[Dict]]:
+        """Returns the columns of the table, or None if it does not exist. fresh=True reloads the schema first."""
+        return self._schema(node_name, schema_name, fresh).get(table_name)
+
+    def get_many(self, node_name: str, schema_name: str, table_names: List[str], fresh: bool = False) -> Dict[str, Optional[List[Dict]]]:
+        """Returns {table: columns or None} for all given tables of one schema (at most one round trip)."""
+        tables = self._schema(node_name, schema_name, fresh)
+        return {table_name: tables.get(table_name) for table_name in table_names}
+
+    def invalidate(self, node_name: str = None) -> None:
+        """Drops cached metadata of the node (of all nodes without node_name)."""
+        with self._lock:
+            if node_name is None:
+                self._schemas.clear()
+            else:
+                self._schemas.pop(node_name, None)
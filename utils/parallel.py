@@ -0,0 +1,48 @@
+# utils/parallel.py
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class NodeOperationError(Exception):
+    """
+    Raised when an operation fanned out over several nodes failed on some of them.
+
+    :param operation: Human readable name of the operation.
+    :param errors: Mapping node name -> exception raised on that node.
+    """
+
+    def __init__(self, operation: str, errors: Dict[str, BaseException]):
+        self.operation = operation
+        self.errors = errors
+        details = "; ".join(f"{node}: {error!r}" for node, error in errors.items())
+        super().__init__(f"{operation} failed on {len(errors)} node(s): {details}")
+
+
+def run_concurrently(
+    func: Callable[[str], Any],
+    node_names: List[str],
+    max_workers: Optional[int] = None
+) -> Tuple[Dict[str, Any], Dict[str, BaseException]]:
+    """
+    Runs func(node_name) for every node in its own thread and waits for all of them.
+
+    :param func: Callable receiving the node name.
+    :param node_names: Names of the nodes to run on.
+    :param max_workers: Thread count, one per node by default.
+    :return: (results, errors) — both keyed by node name, in the order of node_names.
+    """
+    results: Dict[str, Any] = {}
+    errors: Dict[str, BaseException] = {}
+    if not node_names:
+        return results, errors
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(node_names), thread_name_prefix="node") as executor:
+        futures = {node_name: executor.submit(func, node_name) for node_name in node_names}
+        for node_name, future in futures.items():
+            error = future.exception()
+            if error is None:
+                results[node_name] = future.result()
+            else:
+                errors[node_name] = error
+    return results, errors
@@ -0,0 +1,35 @@
+# utils/pg_conf.py
+
+import re
+from typing import Dict
+
+_BARE_VALUE = re.compile(r"^[A-Za-z0-9._+-]+$")
+
+
+def format_value(value: str) -> str:
+    """Formats a setting value for postgresql.conf, quoting it unless it is a plain word/number."""
+    value = str(value)
+    if len(value) >= 2 and value[0] == value[-1] == "'":
+        value = value[1:-1].replace("''", "'")
+    if _BARE_VALUE.match(value):
+        return value
+    return "'" + value.replace("'", "''") + "'"
+
+
+def render_conf(settings: Dict[str, str], header: str = None) -> str:
+    """Renders settings as postgresql.conf lines."""
+    lines = [f"# {header}"] if header else []
+    lines += [f"{name} = {format_value(value)}" for name, value in settings.items()]
+    return "\n".join(lines) + "\n"
+
+
+def parse_conf(text: str) -> Dict[str, str]:
+    """Parses 'name = value' lines (as written by render_conf) back into {name: formatted value}."""
+    settings = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        name, _, value = line.partition("=")
+        settings[name.strip()] = value.strip()
+    return settings
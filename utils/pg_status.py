@@ -0,0 +1,57 @@
+# utils/pg_status.py
+
+import os
+import socket
+from typing import Dict, Optional
+
+
+def read_postmaster_pid(data_dir: str) -> Optional[Dict]:
+    """
+    Parses <data_dir>/postmaster.pid.
+
+    :return: {"pid", "data_dir", "port", "socket_dir", "listen_address", "status"} or None if there is no pid file.
+             status ("starting", "ready", "stopping", ...) is only written by PostgreSQL 10+ and may be None.
+    :raises PermissionError: if the data dir is not readable by the current user.
+    """
+    try:
+        with open(os.path.join(data_dir, "postmaster.pid")) as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return None
+    if not lines or not lines[0].strip().isdigit():
+        return None
+
+    def line(index: int) -> Optional[str]:
+        return lines[index].strip() if len(lines) > index and lines[index].strip() else None
+
+    port = line(3)
+    return {
+        "pid": int(lines[0]),
+        "data_dir": line(1),
+        "port": int(port) if port and port.isdigit() else None,
+        "socket_dir": line(4),
+        "listen_address": line(5),
+        "status": line(7),
+    }
+
+
+def is_postmaster_alive(pid: int) -> bool:
+    """Checks through /proc that the process exists and is a postgres server (not a reused PID)."""
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as f:
+            cmdline = f.read()
+    except (FileNotFoundError, ProcessLookupError):
+        return False
+    except PermissionError:
+        return True
+    executable = os.path.basename(cmdline.split(b"\0", 1)[0])
+    return executable in (b"postgres", b"postmaster")
+
+
+def probe_port(host: str, port: int, timeout: float = 0.2) -> bool:
+    """Checks that something accepts TCP connections on host:port."""
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
@@ -0,0 +1,165 @@
+# utils/postgres_helper.py
+
+import atexit
+import itertools
+import json
+import subprocess
+import sys
+import threading
+from typing import Dict, List, Optional
+
+from utils.log_handler import logger
+
+# Runs as 'postgres' (python3 standard library only). Reads one JSON request per line
+# from stdin, runs every command in its own thread and answers on stdout with
+# {"id", "output"} lines (only for streamed commands) followed by one {"id", "returncode"}.
+HELPER_SOURCE = r'''
+import json, subprocess, sys, threading
+lock = threading.Lock()
+def send(msg):
+    with lock:
+        sys.stdout.write(json.dumps(msg) + "\n")
+        sys.stdout.flush()
+def run(req):
+    stream = req.get("stream", False)
+    try:
+        proc = subprocess.Popen(req["cmd"], stdin=subprocess.DEVNULL,
+                                stdout=subprocess.PIPE if stream else subprocess.DEVNULL,
+                                stderr=subprocess.STDOUT if stream else subprocess.DEVNULL,
+                                text=True, errors="replace")
+        if stream:
+            for line in proc.stdout:
+                send({"id": req["id"], "output": line})
+        send({"id": req["id"], "returncode": proc.wait()})
+    except OSError as e:
+        send({"id": req["id"], "returncode": 127, "error": str(e)})
+for line in sys.stdin:
+    threading.Thread(target=run, args=(json.loads(line),), daemon=True).start()
+'''
+
+
+class HelperError(Exception):
+    """Raised when the helper process is not available (failed to start or exited)."""
+
+
+class PostgresHelper:
+    """
+    Long-lived `sudo -u postgres python3` process that runs commands as postgres on request,
+    so each pg_ctl/initdb call costs a pipe round trip instead of a sudo (PAM) + process start.
+    Thread-safe; several commands may run at the same time.
+    """
+
+    LOG_TAG = "[PostgresHelper]"
+
+    def __init__(self):
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, Dict] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        try:
+            self._proc = subprocess.Popen(
+                ["sudo", "-u", "postgres", "python3", "-u", "-c", HELPER_SOURCE],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, bufsize=1
+            )
+        except OSError as e:
+            raise HelperError(f"Cannot start helper: {e}")
+        self._reader = threading.Thread(target=self._read_responses, name="postgres-helper", daemon=True)
+        self._reader.start()
+        logger.debug(f"{self.LOG_TAG} Started helper (pid {self._proc.pid}).")
+
+    def _read_responses(self) -> None:
+        for line in self._proc.stdout:
+            try:
+                msg = json.loads(line)
+            except ValueError:
+                continue
+            with self._lock:
+                request = self._pending.get(msg.get("id"))
+            if request is None:
+                continue
+            if "output" in msg:
+                sys.stdout.write(msg["output"])
+                sys.stdout.flush()
+            else:
+                request["returncode"] = msg["returncode"]
+                request["error"] = msg.get("error")
+                request["done"].set()
+
+        with self._lock:
+            self._closed = True
+            pending = list(self._pending.values())
+        for request in pending:
+            request["done"].set()
+
+    def run(self, command: List[str], suppress_output: bool = True) -> int:
+        """
+        Runs the command as postgres and waits for it.
+
+        :param suppress_output: If False, the command's output is streamed to our stdout.
+        :return: Exit code of the command.
+        :raises HelperError: if the helper is gone.
+        """
+        request_id = next(self._ids)
+        request = {"done": threading.Event(), "returncode": None, "error": None}
+        with self._lock:
+            if self._closed:
+                raise HelperError("Helper has exited.")
+            self._pending[request_id] = request
+            try:
+                self._proc.stdin.write(json.dumps({"id": request_id, "cmd": command, "stream": not suppress_output}) + "\n")
+                self._proc.stdin.flush()
+            except (OSError, ValueError) as e:
+                self._pending.pop(request_id)
+                self._closed = True
+                raise HelperError(f"Cannot send command to helper: {e}")
+
+        request["done"].wait()
+        with self._lock:
+            self._pending.pop(request_id, None)
+        if request["returncode"] is None:
+            raise HelperError("Helper exited while running the command.")
+        if request["error"]:
+            logger.debug(f"{self.LOG_TAG} {command[0]}: {request['error']}")
+        return request["returncode"]
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+        if self._proc.poll() is None:
+            self._proc.stdin.close()
+            try:
+                self._proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+
+
+_helper: Optional[PostgresHelper] = None
+_helper_failed = False
+_helper_lock = threading.Lock()
+
+
+def get_helper() -> Optional[PostgresHelper]:
+    """
+    Returns the helper shared by the whole process, starting it on first use.
+    Returns None if it cannot be started (callers fall back to per-command sudo).
+    """
+    global _helper, _helper_failed
+    with _helper_lock:
+        if _helper is None and not _helper_failed:
+            try:
+                _helper = PostgresHelper()
+                atexit.register(_helper.close)
+            except HelperError as e:
+                logger.debug(f"{PostgresHelper.LOG_TAG} {e}; using sudo per command.")
+                _helper_failed = True
+        return _helper
+
+
+def discard_helper() -> None:
+    """Stops using the shared helper (after it failed); later calls fall back to sudo."""
+    global _helper, _helper_failed
+    with _helper_lock:
+        if _helper is not None:
+            _helper.close()
+        _helper = None
+        _helper_failed = True
@@ -0,0 +1,51 @@
+# utils/schema_snapshot.py
+
+import hashlib
+import json
+from typing import Any, Dict, List
+
+
+def fingerprint(snapshot: Dict[str, Any]) -> str:
+    """
+    Returns a stable hash of a schema snapshot (see BaseDDL.get_schema_snapshot);
+    equal structures give equal fingerprints regardless of catalog order.
+    """
+    return hashlib.sha256(json.dumps(snapshot, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _diff(path: str, left: Any, right: Any, changes: List[Dict[str, Any]]) -> None:
+    if isinstance(left, dict) and isinstance(right, dict):
+        for key in sorted(set(left) | set(right), key=str):
+            child = f"{path}.{key}" if path else str(key)
+            if key not in right:
+                changes.append({"path": child, "change": "missing", "left": left[key], "right": None})
+            elif key not in left:
+                changes.append({"path": child, "change": "extra", "left": None, "right": right[key]})
+            else:
+                _diff(child, left[key], right[key], changes)
+    elif left != right:
+        changes.append({"path": path, "change": "changed", "left": left, "right": right})
+
+
+def _keyed(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    # Columns are compared by name; their order is compared separately.
+    keyed = {}
+    for table, definition in snapshot.items():
+        definition = dict(definition)
+        columns = definition.pop("columns", [])
+        definition["columns"] = {column["name"]: column for column in columns}
+        definition["column_order"] = [column["name"] for column in columns]
+        keyed[table] = definition
+    return keyed
+
+
+def diff_snapshots(left: Dict[str, Any], right: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Structurally diffs two schema snapshots.
+
+    :return: One entry per difference: {"path": "table.columns.col.type", "change": "missing" | "extra" | "changed",
+        "left": value in left, "right": value in right}. Empty if the schemas match.
+    """
+    changes: List[Dict[str, Any]] = []
+    _diff("", _keyed(left), _keyed(right), changes)
+    return changes
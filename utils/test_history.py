@@ -0,0 +1,98 @@
+# utils/test_history.py
+
+import fcntl
+import json
+import os
+import time
+from typing import Dict, List
+
+# Anchored to the repository root, so runs started from tests/ share the history.
+HISTORY_FILE = os.path.join(os.path.dirname(__file__), '..', 'pytest_durations.json')
+
+# Weight of the newest run in the stored duration (exponential moving average).
+DURATION_SMOOTHING = 0.5
+
+
+def load_history(path: str = HISTORY_FILE) -> Dict[str, Dict]:
+    """
+    Loads the per-test history: node id -> {"duration", "runs", "failed", "last_run"}.
+    Returns an empty history if the file is missing or unreadable.
+    """
+    try:
+        with open(path) as f:
+            fcntl.flock(f, fcntl.LOCK_SH)
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def record_results(results: Dict[str, Dict], path: str = HISTORY_FILE) -> None:
+    """
+    Merges the results of a run into the history file. Safe for several pytest
+    processes finishing at the same time (the file is locked while it is rewritten).
+
+    :param results: node id -> {"duration": seconds, "failed": bool}.
+    """
+    if not results:
+        return
+    with open(path, "a+") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        f.seek(0)
+        try:
+            history = json.loads(f.read() or "{}")
+        except ValueError:
+            history = {}
+
+        now = time.time()
+        for test_id, result in results.items():
+            entry = history.get(test_id)
+            if entry is None:
+                duration = result["duration"]
+                runs = 1
+            else:
+                duration = DURATION_SMOOTHING * result["duration"] + (1 - DURATION_SMOOTHING) * entry["duration"]
+                runs = entry["runs"] + 1
+            history[test_id] = {"duration": duration, "runs": runs, "failed": result["failed"], "last_run": now}
+
+        f.seek(0)
+        f.truncate()
+        json.dump(history, f, indent=2, sort_keys=True)
+
+
+def expected_durations(test_ids: List[str], history: Dict[str, Dict]) -> Dict[str, float]:
+    """
+    Expected duration of every test. Tests without history get the median of the known
+    durations (1 second if there is no history at all, so they are still spread evenly).
+    """
+    known = sorted(entry["duration"] for entry in history.values())
+    default = known[len(known) // 2] if known else 1.0
+    return {test_id: history[test_id]["duration"] if test_id in history else default for test_id in test_ids}
+
+
+def order_tests(test_ids: List[str], history: Dict[str, Dict], failed_first: bool = True) -> List[str]:
+    """
+    Orders tests longest-first; with failed_first, tests that failed on their last run come first.
+    The sort is stable, so tests without history keep their collection order among themselves.
+    """
+    durations = expected_durations(test_ids, history)
+
+    def key(test_id):
+        failed = failed_first and history.get(test_id, {}).get("failed", False)
+        return (not failed, -durations[test_id])
+    return sorted(test_ids, key=key)
+
+
+def balance_tests(test_ids: List[str], history: Dict[str, Dict], workers: int) -> List[List[str]]:
+    """
+    Splits tests over workers so that they finish at about the same time: longest test first,
+    each to the worker with the least expected work so far (LPT scheduling).
+    Returns one list per worker, each in longest-first order.
+    """
+    durations = expected_durations(test_ids, history)
+    buckets: List[List[str]] = [[] for _ in range(workers)]
+    loads = [0.0] * workers
+    for test_id in order_tests(test_ids, history, failed_first=False):
+        worker = loads.index(min(loads))
+        buckets[worker].append(test_id)
+        loads[worker] += durations[test_id]
+    return buckets
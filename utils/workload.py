@@ -0,0 +1,132 @@
+# utils/workload.py
+
+import random
+import threading
+import time
+from typing import Dict
+
+import psycopg2
+from utils.log_handler import logger
+
+DEFAULT_MIX = {"insert": 70, "update": 20, "delete": 10}
+
+
+def parse_mix(mix: str) -> Dict[str, int]:
+    """
+    Parses an operation mix like 'insert=70,update=20,delete=10' into weights.
+    """
+    weights = {}
+    for part in mix.split(","):
+        op, _, weight = part.partition("=")
+        op = op.strip().lower()
+        if op not in DEFAULT_MIX:
+            raise ValueError(f"Unknown operation '{op}' in mix '{mix}', expected one of {list(DEFAULT_MIX)}.")
+        weights[op] = int(weight)
+    if not any(weights.values()):
+        raise ValueError(f"Operation mix '{mix}' has no positive weights.")
+    return weights
+
+
+class WriteWorkload:
+    """
+    pgbench-style load generator: `writers` threads run transactions of `txn_size`
+    single-row operations drawn from `mix` against one table of the node for `duration` seconds.
+
+    Every writer only updates/deletes rows it inserted itself, so writers never block each other.
+    The table needs an integer `id` primary key with a default and a text `data` column
+    (the replication table created by setup_master has exactly that).
+
+    :param ddl_implementation: BaseDDL instance; writers check connections out of its pool.
+    """
+
+    LOG_TAG = "[WriteWorkload]"
+
+    def __init__(self, ddl_implementation, node_name: str, schema_name: str, table_name: str,
+                 writers: int = 4, txn_size: int = 10, mix: Dict[str, int] = None, duration: float = 30.0):
+        self.ddl = ddl_implementation
+        self.node_name = node_name
+        self.table = f"{schema_name}.{table_name}"
+        self.writers = writers
+        self.txn_size = txn_size
+        self.mix = mix or DEFAULT_MIX
+        self.duration = duration
+        self._lock = threading.Lock()
+        self._totals = {"transactions": 0, "errors": 0, "insert": 0, "update": 0, "delete": 0}
+
+    def run(self) -> Dict:
+        """
+        Runs the workload and returns totals: transactions, errors, rows per operation,
+        rows, seconds and committed tps.
+        """
+        logger.debug(f"{self.LOG_TAG} {self.writers} writer(s), txn_size={self.txn_size}, mix={self.mix}, {self.duration} s on '{self.node_name}'.")
+        deadline = time.monotonic() + self.duration
+        threads = [threading.Thread(target=self._writer, args=(i, deadline), name=f"writer-{i}") for i in range(self.writers)]
+
+        started = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - started
+
+        totals = dict(self._totals)
+        totals["rows"] = totals["insert"] + totals["update"] + totals["delete"]
+        totals["seconds"] = elapsed
+        totals["tps"] = totals["transactions"] / elapsed if elapsed else 0.0
+        logger.debug(f"{self.LOG_TAG} Done: {totals}")
+        return totals
+
+    def _writer(self, writer_id: int, deadline: float) -> None:
+        rnd = random.Random(writer_id)
+        ops, weights = zip(*self.mix.items())
+        own_ids = []
+        counts = {"transactions": 0, "errors": 0, "insert": 0, "update": 0, "delete": 0}
+
+        try:
+            while time.monotonic() < deadline:
+                try:
+                    with self.ddl.pool.connection(self.node_name) as conn:
+                        self._run_transactions(conn, writer_id, deadline, rnd, ops, weights, own_ids, counts)
+                except psycopg2.Error as e:
+                    # A failed rollback means the connection is broken: the pool drops it
+                    # and the writer goes on with a new one, keeping its counts.
+                    logger.debug(f"{self.LOG_TAG} Writer {writer_id} lost its connection: {e}")
+                    time.sleep(0.1)
+        finally:
+            with self._lock:
+                for key, value in counts.items():
+                    self._totals[key] += value
+
+    def _run_transactions(self, conn, writer_id, deadline, rnd, ops, weights, own_ids, counts) -> None:
+        """Runs transactions on one connection until the deadline; raises if the connection breaks."""
+        with conn.cursor() as cur:
+            while time.monotonic() < deadline:
+                done = {"insert": 0, "update": 0, "delete": 0}
+                inserted = []
+                deleted = []
+                try:
+                    for _ in range(self.txn_size):
+                        op = rnd.choices(ops, weights)[0]
+                        if op != "insert" and not own_ids:
+                            op = "insert"
+                        if op == "insert":
+                            cur.execute(f"INSERT INTO {self.table} (data) VALUES (%s) RETURNING id;", (f"w{writer_id}",))
+                            inserted.append(cur.fetchone()[0])
+                        elif op == "update":
+                            cur.execute(f"UPDATE {self.table} SET data = %s WHERE id = %s;", (f"w{writer_id}-{time.monotonic()}", rnd.choice(own_ids)))
+                        else:
+                            deleted.append(own_ids.pop(rnd.randrange(len(own_ids))))
+                            cur.execute(f"DELETE FROM {self.table} WHERE id = %s;", (deleted[-1],))
+                        done[op] += 1
+                    conn.commit()
+                except psycopg2.Error as e:
+                    own_ids.extend(deleted)
+                    counts["errors"] += 1
+                    logger.debug(f"{self.LOG_TAG} Writer {writer_id} transaction failed: {e}")
+                    conn.rollback()
+                    continue
+
+                own_ids.extend(inserted)
+                counts["transactions"] += 1
+                for op, n in done.items():
+                    counts[op] += n